@@ -0,0 +1,103 @@
+"""
+Events per second of an SSE subscription, from the socket to decoded JSON.
+
+A local server streams transaction events; the client reads them with the line-based
+loop that ``_subscribe`` used before and with :class:`SSEParser` over raw chunks.
+
+    python -m benchmarks.sse_parser [--events 200000] [--repeat 3]
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import time
+from typing import Any, Callable
+
+import aiohttp
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from pytonapi.codec import get_codec
+from pytonapi.streaming import SSEParser
+
+
+def make_body(events: int) -> bytes:
+    lines = []
+    for i in range(events):
+        account, tx_hash = (hashlib.sha256(f"{kind}{i}".encode()).hexdigest() for kind in "at")
+        data = json.dumps({"account_id": f"0:{account}", "lt": 48_000_000_000_000 + i, "tx_hash": tx_hash})
+        lines.append(f"event: message\ndata: {data}\n\n")
+        if i % 100 == 0:
+            lines.append("event: heartbeat\n\n")
+    return "".join(lines).encode()
+
+
+async def line_loop(response: aiohttp.ClientResponse, loads: Callable[[Any], Any]) -> int:
+    events = 0
+    async for line in response.content:
+        line_string = line.decode("utf-8").strip()
+        if not line_string:
+            continue
+        try:
+            key, value = line_string.split(": ", 1)
+        except ValueError:
+            continue
+        if value == "heartbeat":
+            continue
+        if key == "data":
+            loads(value)
+            events += 1
+    return events
+
+
+async def sse_parser(response: aiohttp.ClientResponse, loads: Callable[[Any], Any]) -> int:
+    events = 0
+    parser = SSEParser()
+    async for chunk in response.content.iter_any():
+        for event in parser.feed(chunk):
+            if event.event == "heartbeat" or event.data == b"heartbeat":
+                continue
+            loads(event.data)
+            events += 1
+    return events
+
+
+async def main() -> None:
+    arguments = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arguments.add_argument("--events", type=int, default=200_000)
+    arguments.add_argument("--repeat", type=int, default=3)
+    args = arguments.parse_args()
+
+    body = make_body(args.events)
+
+    async def sse(request: web.Request) -> web.StreamResponse:
+        response = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+        await response.prepare(request)
+        for i in range(0, len(body), 65536):
+            await response.write(body[i:i + 65536])
+        return response
+
+    app = web.Application()
+    app.router.add_get("/sse", sse)
+    server = TestServer(app)
+    await server.start_server()
+
+    codec = get_codec()
+    print(f"{args.events} events, {len(body) / 1e6:.1f} MB, codec: {codec.name}")
+    try:
+        async with aiohttp.ClientSession() as session:
+            for name, read in (("line loop", line_loop), ("SSEParser", sse_parser)):
+                best = float("inf")
+                for _ in range(args.repeat):
+                    start = time.perf_counter()
+                    async with session.get(server.make_url("/sse")) as response:
+                        count = await read(response, codec.loads)
+                    best = min(best, time.perf_counter() - start)
+                assert count == args.events
+                print(f"{name:>10}: {args.events / best:12,.0f} events/s")
+    finally:
+        await server.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
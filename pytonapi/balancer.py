@@ -0,0 +1,227 @@
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger("pytonapi")
+
+Probe = Callable[["Endpoint"], Awaitable[Tuple[float, Optional[int]]]]
+
+
+class Endpoint:
+    """
+    A tonapi endpoint of an :class:`EndpointBalancer` with its health and load.
+    """
+
+    def __init__(self, url: str) -> None:
+        """
+        Initialize the Endpoint.
+
+        :param url: The base URL, e.g. ``https://tonapi.io/``.
+        """
+        self.url = url if url.endswith("/") else url + "/"
+
+        self.in_flight = 0
+        self.latency: Optional[float] = None
+        self.requests = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.ejected_until = 0.0
+        self.healthy = True
+        self.lag: Optional[float] = None
+
+    @property
+    def ejected(self) -> bool:
+        """Whether the endpoint is ejected after errors or high latency."""
+        return self.ejected_until > time.monotonic()
+
+    @property
+    def available(self) -> bool:
+        """Whether the endpoint may receive requests."""
+        return self.healthy and not self.ejected
+
+    def __repr__(self) -> str:
+        latency = f"{self.latency * 1000:.0f}ms" if self.latency is not None else None
+        return (
+            f"Endpoint({self.url}, in_flight={self.in_flight}, latency={latency}, "
+            f"lag={self.lag}, healthy={self.healthy}, ejected={self.ejected})"
+        )
+
+
+class EndpointBalancer:
+    """
+    Routes requests over several tonapi endpoints.
+
+    Requests go to the available endpoint with the fewest requests in flight
+    (``least_requests``), or with the lowest EWMA latency weighted by its requests
+    in flight (``ewma``). An endpoint is ejected for ``eject_time`` seconds after
+    ``eject_after`` consecutive errors or when its EWMA latency exceeds ``max_latency``.
+    Background health checks mark endpoints that are down or whose chain data lags
+    more than ``max_lag`` seconds as unhealthy. If no endpoint is available,
+    requests are spread over all of them.
+    """
+
+    def __init__(
+            self,
+            urls: Sequence[str],
+            strategy: str = "least_requests",
+            decay: float = 0.3,
+            eject_after: int = 5,
+            eject_time: float = 30.0,
+            max_latency: Optional[float] = None,
+            max_lag: float = 30.0,
+            check_interval: Optional[float] = 10.0,
+            check_timeout: float = 5.0,
+    ) -> None:
+        """
+        Initialize the EndpointBalancer.
+
+        :param urls: Base URLs of the endpoints, e.g. tonapi.io and self-hosted opentonapi instances.
+        :param strategy: "least_requests" or "ewma".
+        :param decay: Weight of the newest latency in the EWMA, between 0 and 1.
+        :param eject_after: Consecutive errors (5xx, timeouts, connection errors) that eject an endpoint.
+        :param eject_time: Seconds an ejected endpoint receives no requests.
+        :param max_latency: EWMA latency in seconds that ejects an endpoint. None disables latency ejection.
+        :param max_lag: Chain lag in seconds above which an endpoint is unhealthy.
+        :param check_interval: Seconds between health checks. None disables health checks.
+         Each check sends two requests per endpoint, which count against the client's rate limit.
+        :param check_timeout: Timeout of a health check in seconds.
+        """
+        if strategy not in ("least_requests", "ewma"):
+            raise ValueError(f"Unknown strategy: {strategy}")
+        self.endpoints: List[Endpoint] = [Endpoint(url) for url in urls]
+        if not self.endpoints:
+            raise ValueError("At least one endpoint is required")
+        self.strategy = strategy
+        self.decay = decay
+        self.eject_after = eject_after
+        self.eject_time = eject_time
+        self.max_latency = max_latency
+        self.max_lag = max_lag
+        self.check_interval = check_interval
+        self.check_timeout = check_timeout
+
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    def _score(self, endpoint: Endpoint) -> Tuple[float, float]:
+        latency = endpoint.latency or 0.0  # endpoints without samples are tried first
+        if self.strategy == "ewma":
+            return latency * (endpoint.in_flight + 1), endpoint.in_flight
+        return endpoint.in_flight, latency
+
+    def select(self) -> Endpoint:
+        """
+        Choose the endpoint for the next request without counting it as in flight.
+
+        :return: The best available endpoint, or the best of all if none is available.
+        """
+        candidates = [endpoint for endpoint in self.endpoints if endpoint.available] or self.endpoints
+        return min(candidates, key=self._score)
+
+    def acquire(self) -> Endpoint:
+        """
+        Take an endpoint for one request. Call :meth:`release` when the request is done.
+
+        :return: The endpoint to send the request to.
+        """
+        endpoint = self.select()
+        endpoint.in_flight += 1
+        endpoint.requests += 1
+        return endpoint
+
+    def release(self, endpoint: Endpoint, latency: Optional[float] = None, failed: bool = False) -> None:
+        """
+        Record the outcome of a request taken with :meth:`acquire`.
+
+        :param endpoint: The endpoint the request was sent to.
+        :param latency: Seconds until the response was received. None if the request was cancelled.
+        :param failed: Whether the request failed because of the endpoint.
+        """
+        endpoint.in_flight = max(endpoint.in_flight - 1, 0)
+        if failed:
+            endpoint.failures += 1
+            endpoint.consecutive_failures += 1
+            if endpoint.consecutive_failures >= self.eject_after:
+                self.eject(endpoint, f"{endpoint.consecutive_failures} consecutive errors")
+            return
+        if latency is None:
+            return
+
+        endpoint.consecutive_failures = 0
+        if endpoint.latency is None:
+            endpoint.latency = latency
+        else:
+            endpoint.latency = self.decay * latency + (1 - self.decay) * endpoint.latency
+        if self.max_latency is not None and endpoint.latency > self.max_latency:
+            self.eject(endpoint, f"latency {endpoint.latency:.2f}s")
+
+    def eject(self, endpoint: Endpoint, reason: str) -> None:
+        """
+        Stop sending requests to an endpoint for ``eject_time`` seconds.
+
+        :param endpoint: The endpoint to eject.
+        :param reason: Why the endpoint is ejected, for the log.
+        """
+        logger.warning(f"Ejecting endpoint {endpoint.url} for {self.eject_time:.0f}s: {reason}")
+        endpoint.ejected_until = time.monotonic() + self.eject_time
+        endpoint.consecutive_failures = 0
+        endpoint.latency = None  # start afresh when the endpoint is back
+
+    async def check(self, probe: Probe) -> None:
+        """
+        Check the health of all endpoints once.
+
+        The lag of an endpoint is its indexing latency, or how far its liteserver time
+        is behind the freshest endpoint, whichever is larger.
+
+        :param probe: Coroutine function that gets the indexing latency in seconds and
+         the liteserver time of an endpoint, and raises if the endpoint is down.
+        """
+        async def run(endpoint: Endpoint) -> Optional[Tuple[float, Optional[int]]]:
+            try:
+                return await asyncio.wait_for(probe(endpoint), self.check_timeout)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Health check of {endpoint.url} failed: {e!r}")
+                return None
+
+        results = await asyncio.gather(*(run(endpoint) for endpoint in self.endpoints))
+        times = [result[1] for result in results if result is not None and result[1] is not None]
+        freshest = max(times) if times else None
+        for endpoint, result in zip(self.endpoints, results):
+            if result is None:
+                endpoint.healthy = False
+                endpoint.lag = None
+                continue
+            indexing_latency, chain_time = result
+            lag = float(indexing_latency)
+            if freshest is not None and chain_time is not None:
+                lag = max(lag, float(freshest - chain_time))
+            endpoint.lag = lag
+            endpoint.healthy = lag <= self.max_lag
+
+    def start(self, probe: Probe) -> None:
+        """
+        Start the background health checks, if enabled and not running yet.
+
+        :param probe: See :meth:`check`.
+        """
+        if self.check_interval is None or (self._task is not None and not self._task.done()):
+            return
+        self._task = asyncio.ensure_future(self._run(probe))
+
+    async def _run(self, probe: Probe) -> None:
+        while True:
+            await self.check(probe)
+            await asyncio.sleep(self.check_interval)
+
+    async def close(self) -> None:
+        """Stop the background health checks."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
@@ -1,19 +1,78 @@
 import asyncio
-import json
-from typing import Any, Dict, Optional, AsyncGenerator
+import functools
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import (
+    TYPE_CHECKING, Any, AsyncGenerator, AsyncIterator, Awaitable, Callable, Dict, Hashable, Iterable, Iterator, List,
+    Mapping, Optional, Sequence, Tuple, Type, TypeVar, Union,
+)
 
 import aiohttp
 
+from pytonapi.balancer import Endpoint, EndpointBalancer
+from pytonapi.batching import BatchLoader
+from pytonapi.cache import CachePolicy, ResponseCache
+from pytonapi.codec import JSONCodec
+from pytonapi.core import ClientCore, CoreAttribute, ResponseMode
+from pytonapi.dispatch import KeyedDispatcher
 from pytonapi.exceptions import (
     TONAPIBadRequestError,
+    TONAPIBulkRequestError,
+    TONAPIClientError,
     TONAPIError,
     TONAPIInternalServerError,
     TONAPINotFoundError,
+    TONAPISSELimitReachedError,
     TONAPIUnauthorizedError,
     TONAPITooManyRequestsError,
     TONAPINotImplementedError,
 )
-from pytonapi.logger import setup_logging
+from pytonapi.hedging import HedgePolicy, hedge
+from pytonapi.keypool import APIKey, APIKeyPool
+from pytonapi.pagination import paginate_by_lt, paginate_by_offset, scan_by_time
+from pytonapi.retry import IDEMPOTENT_METHODS, RetryPolicy
+from pytonapi.scheduler import Priority
+from pytonapi.session import SessionManager
+from pytonapi.singleflight import request_key
+from pytonapi.streaming import JSONArrayParser, SSEParser
+
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+
+T = TypeVar("T", bound="AsyncTonapiClientBase")
+M = TypeVar("M", bound="BaseModel")
+
+BULK_CHUNK_SIZE = 100
+# Live events buffered while a resumed stream yields its backfill.
+SSE_BUFFER_SIZE = 1000
+# Seconds a stream must stay open to count as working when it drops without events.
+SSE_STABLE_AFTER = 30.0
+
+
+_response_mode: ContextVar[Optional[ResponseMode]] = ContextVar("pytonapi_response_mode", default=None)
+_priority: ContextVar[Optional[Priority]] = ContextVar("pytonapi_priority", default=None)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a ``Retry-After`` header value.
+
+    :param value: Delay in seconds or an HTTP date.
+    :return: The delay in seconds, or None if the value is missing or malformed.
+    """
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max((date - datetime.now(timezone.utc)).total_seconds(), 0.0)
 
 
 class AsyncTonapiClientBase:
@@ -31,34 +90,181 @@ class AsyncTonapiClientBase:
             websocket_url: Optional[str] = None,
             timeout: Optional[float] = None,
             debug: bool = False,
+            session: Optional[SessionManager] = None,
+            rps: Optional[float] = None,
+            burst: Optional[int] = None,
+            retry_policy: Optional[RetryPolicy] = None,
+            coalesce_requests: bool = False,
+            cache: Optional[ResponseCache] = None,
+            cache_policy: Optional[CachePolicy] = None,
+            batch_window: float = 0.005,
+            batch_size: int = 100,
+            json_codec: Optional[JSONCodec] = None,
+            response_mode: Union[ResponseMode, str] = ResponseMode.model,
+            key_pool: Optional[APIKeyPool] = None,
+            hedge_policy: Optional[HedgePolicy] = None,
+            balancer: Optional[EndpointBalancer] = None,
+            max_concurrency: Optional[int] = None,
+            priority_weights: Optional[Mapping[str, float]] = None,
+            sse_idle_timeout: Optional[float] = 60.0,
             **kwargs,
     ) -> None:
         """
         Initialize the AsyncTonapiClient.
 
-        :param api_key: The API key.
-        :param is_testnet: Use True if using the testnet.
-        :param max_retries: Maximum number of retries per request if rate limit is reached.
-        :param headers: Additional headers to include in requests.
-        :param base_url: The base URL for the API.
-        :param websocket_url: The URL for the WebSocket server.
-        :param timeout: Request timeout in seconds.
-        :param debug: Enable debug mode.
+        Takes the parameters of :class:`~pytonapi.core.ClientCore`, which documents them.
+        """
+        self.core = ClientCore(
+            api_key=api_key,
+            is_testnet=is_testnet,
+            max_retries=max_retries,
+            headers=headers,
+            base_url=base_url,
+            websocket_url=websocket_url,
+            timeout=timeout,
+            debug=debug,
+            session=session,
+            rps=rps,
+            burst=burst,
+            retry_policy=retry_policy,
+            coalesce_requests=coalesce_requests,
+            cache=cache,
+            cache_policy=cache_policy,
+            batch_window=batch_window,
+            batch_size=batch_size,
+            json_codec=json_codec,
+            response_mode=response_mode,
+            key_pool=key_pool,
+            hedge_policy=hedge_policy,
+            balancer=balancer,
+            max_concurrency=max_concurrency,
+            priority_weights=priority_weights,
+            sse_idle_timeout=sse_idle_timeout,
+        )
+
+    api_key = CoreAttribute()
+    is_testnet = CoreAttribute()
+    max_retries = CoreAttribute()
+    headers = CoreAttribute()
+    base_url = CoreAttribute()
+    websocket_url = CoreAttribute()
+    timeout = CoreAttribute()
+    debug = CoreAttribute()
+    logger = CoreAttribute()
+    session = CoreAttribute()
+    rate_limiter = CoreAttribute()
+    scheduler = CoreAttribute()
+    retry_policy = CoreAttribute()
+    coalescer = CoreAttribute()
+    cache = CoreAttribute()
+    cache_policy = CoreAttribute()
+    loaders = CoreAttribute()
+    codec = CoreAttribute()
+    response_mode = CoreAttribute()
+    key_pool = CoreAttribute()
+    hedge_policy = CoreAttribute()
+    balancer = CoreAttribute()
+    sse_idle_timeout = CoreAttribute()
+
+    @classmethod
+    def from_core(cls: Type[T], core: ClientCore) -> T:
+        """
+        Create a client that shares the transport core of another client.
+
+        :param core: The core to share.
+        :return: A new client bound to the given core.
+        """
+        client = cls.__new__(cls)
+        client.core = core
+        return client
+
+    async def __aenter__(self) -> "AsyncTonapiClientBase":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """
+        Close the shared HTTP session and stop the balancer's health checks.
+
+        The session is shared by the client and all of its namespaces,
+        so closing any of them closes it for all.
+        """
+        if self.balancer is not None:
+            await self.balancer.close()
+        await self.session.close()
+
+    @contextmanager
+    def use_response_mode(self, mode: Union[ResponseMode, str]) -> Iterator[None]:
+        """
+        Override the response mode for calls made in this context (task).
+
+        Example::
+
+            with tonapi.use_response_mode("raw"):
+                events = await tonapi.accounts.get_events(account_id)  # a plain dict
+
+        :param mode: The response mode to use.
+        """
+        token = _response_mode.set(ResponseMode(mode))
+        try:
+            yield
+        finally:
+            _response_mode.reset(token)
+
+    @contextmanager
+    def use_priority(self, priority: Union[Priority, str]) -> Iterator[None]:
+        """
+        Send the requests made in this context (task) in the given scheduling lane.
+
+        Example::
+
+            with tonapi.use_priority("bulk"):
+                await backfill(tonapi)
+
+        :param priority: "interactive", "default" or "bulk".
+        """
+        token = _priority.set(Priority(priority))
+        try:
+            yield
+        finally:
+            _priority.reset(token)
+
+    def _parse(self, model: Type[M], data: Dict[str, Any]) -> M:
         """
-        self.api_key = api_key
-        self.is_testnet = is_testnet
-        self.max_retries = max(max_retries, 0)
+        Turn a decoded response into the return value according to the response mode.
 
-        self.headers = headers or {"Authorization": f"Bearer {self.api_key}"}
-        self.base_url = base_url or "https://tonapi.io/" if not is_testnet else "https://testnet.tonapi.io/"
-        self.websocket_url = websocket_url or "wss://tonapi.io/v2/websocket"
+        :param model: The response model.
+        :param data: The decoded response.
+        :return: The model instance, or the data itself in raw mode.
+        """
+        mode = _response_mode.get() or self.response_mode
+        if mode is ResponseMode.raw:
+            return data  # type: ignore[return-value]
+        if mode is ResponseMode.construct:
+            return model.model_construct(**data)
+        return model(**data)
 
-        self.timeout = timeout
-        self.debug = debug
-        self.logger = setup_logging(self.debug)
+    def _get_loader(
+            self,
+            name: str,
+            batch_fn: Callable[[List[Hashable]], Awaitable[Mapping[Hashable, Any]]],
+    ) -> BatchLoader:
+        """
+        Get the client-wide batch loader with the given name, creating it on first use.
 
-    @staticmethod
-    async def __read_content(response: aiohttp.ClientResponse) -> Dict[str, Any]:
+        :param name: The loader name, unique per client.
+        :param batch_fn: The bulk call used if the loader has to be created.
+        :return: The shared batch loader.
+        """
+        loader = self.loaders.get(name)
+        if loader is None:
+            loader = BatchLoader(batch_fn, max_batch_size=self.core.batch_size, window=self.core.batch_window)
+            self.loaders[name] = loader
+        return loader
+
+    async def __read_content(self, response: aiohttp.ClientResponse) -> Dict[str, Any]:
         """
         Read the content of a response.
 
@@ -66,15 +272,15 @@ class AsyncTonapiClientBase:
         :return: The response content as a dictionary or a string.
         """
         try:
-            content = await response.text()
+            content = await response.read()
         except Exception as e:
             raise TONAPIError(f"Failed to read response content: {e}")
 
         try:
-            data = json.loads(content)
+            data = self.codec.loads(content)
             return data.get("error", data)
-        except json.JSONDecodeError:
-            return {"error": content}
+        except ValueError:
+            return {"error": content.decode("utf-8", errors="replace")}
 
     async def __raise_for_status(self, response: aiohttp.ClientResponse) -> None:
         """
@@ -100,51 +306,172 @@ class AsyncTonapiClientBase:
         error_class = error_map.get(response.status, TONAPIError)
 
         self.logger.error(f"Error response received: {error_text}")
-        raise error_class(error_text)
+        try:
+            error = error_class(error_text)
+        except TONAPIError as e:  # some errors resolve to a more specific subclass on init
+            error = e
+        error.status = response.status
+        error.retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        raise error
+
+    @asynccontextmanager
+    async def __stream_key(self) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Pin a long-lived stream to a key of the key pool with a free stream slot.
+
+        A key the server refuses a stream for cools down, so the next
+        subscriptions go to other keys.
+
+        :return: The headers to open the stream with.
+        :raises TONAPISSELimitReachedError: If no key has a free stream slot.
+        """
+        if self.key_pool is None:
+            yield self.headers
+            return
+        api_key = self.key_pool.acquire_stream()
+        try:
+            yield {**self.headers, "Authorization": api_key.authorization}
+        except TONAPISSELimitReachedError:
+            self.key_pool.report_stream_limit(api_key)
+            raise
+        finally:
+            self.key_pool.release_stream(api_key)
 
     async def _subscribe(
             self,
             method: str,
             params: Dict[str, Any],
+            on_open: Optional[Callable[[], Any]] = None,
+            parser: Optional[SSEParser] = None,
     ) -> AsyncGenerator[Dict[str, Any], None]:
         """
         Subscribe to an SSE event stream.
 
+        The request timeout applies to connecting only; an open stream is closed with an
+        error when nothing, not even a heartbeat, arrives for ``sse_idle_timeout`` seconds.
+        Events whose data is not valid JSON are logged and skipped.
+
         :param method: The API method to subscribe to.
         :param params: Optional parameters for the API method.
+        :param on_open: Called once the server has accepted the subscription.
+        :param parser: The parser of the previous connection when reconnecting, so that
+         its last event ID is sent as ``Last-Event-ID``.
         """
-        url = self.base_url + method
+        use_balancer = self.balancer is not None and self.__namespace_base_url() is None
+        url = (self.balancer.select().url if use_balancer else self.base_url) + method
         self.logger.debug(f"Subscribing to SSE with URL: {url} and params: {params}")
 
+        timeout = aiohttp.ClientTimeout(total=None, connect=self.timeout, sock_read=self.sse_idle_timeout)
+
         try:
-            async with aiohttp.ClientSession(headers=self.headers) as session:
-                async with session.get(url, params=params or {}, timeout=self.timeout) as response:
+            session = self.session.get()
+            if parser is None:
+                parser = SSEParser()
+            else:
+                parser.reset()
+            async with self.__stream_key() as headers:
+                if parser.last_event_id:
+                    headers = {**headers, "Last-Event-ID": parser.last_event_id}
+                async with session.get(url, headers=headers, params=params or {}, timeout=timeout) as response:
                     await self.__raise_for_status(response)
+                    if on_open is not None:
+                        on_open()
 
-                    async for line in response.content:
-                        decoded_line = line.decode("utf-8")
-                        line_string = decoded_line.strip()
-                        if not line_string:
-                            continue
-
-                        try:
-                            key, value = line_string.split(": ", 1)
-                        except ValueError:
-                            self.logger.debug(f"Skipped line due to ValueError: {line_string}")
-                            continue
-
-                        if value == "heartbeat":
-                            self.logger.debug("Received heartbeat")
-                            continue
-                        if key == "data":
-                            self.logger.debug(f"Received SSE data: {value}")
-                            data = json.loads(value)
+                    async for chunk in response.content.iter_any():
+                        for event in parser.feed(chunk):
+                            if event.event == "heartbeat" or event.data == b"heartbeat":
+                                self.logger.debug("Received heartbeat")
+                                continue
+                            try:
+                                data = self.codec.loads(event.data)
+                            except ValueError as e:
+                                self.logger.warning(f"Skipping SSE event with invalid data: {e}")
+                                continue
                             yield data
 
         except aiohttp.ClientError as e:
             self.logger.error(f"Error subscribing to SSE: {e}")
             raise TONAPIError(e)
 
+    async def _subscribe_resumable(
+            self,
+            method: str,
+            params: Dict[str, Any],
+            resume: Callable[[], AsyncIterator[Dict[str, Any]]],
+            max_reconnects: Optional[int] = None,
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """
+        Subscribe to an SSE event stream and reconnect when it drops.
+
+        Reconnects send the last event ID received as ``Last-Event-ID`` and wait according
+        to the retry policy's backoff, but at least the ``retry`` time set by the server. The
+        backoff is reset once a connection has delivered an event or stayed open for
+        ``SSE_STABLE_AFTER`` seconds, so a server that accepts and drops connections is
+        not hammered. Once a connection
+        is accepted, the items of ``resume()`` are yielded first (e.g. a backfill of the
+        events missed while disconnected), followed by the live events received in the
+        meantime. Up to ``SSE_BUFFER_SIZE`` live events are buffered; beyond that, reading
+        from the connection waits for the consumer. Events may be repeated around a
+        reconnect, so the caller deduplicates them.
+
+        :param method: The API method to subscribe to.
+        :param params: Parameters for the API method.
+        :param resume: Called after each connection; its items are yielded before the live events.
+        :param max_reconnects: Give up after this number of consecutive failed reconnects.
+         None reconnects forever.
+        :return: An asynchronous generator of event data.
+        """
+        closed = object()
+        loop = asyncio.get_running_loop()
+        parser = SSEParser()
+        attempt = 0
+        while True:
+            queue: "asyncio.Queue[Any]" = asyncio.Queue(SSE_BUFFER_SIZE)
+            connected = asyncio.Event()
+
+            async def pump() -> None:
+                try:
+                    async for data in self._subscribe(method, params, on_open=connected.set, parser=parser):
+                        await queue.put(data)
+                    await queue.put(closed)
+                except Exception as e:
+                    await queue.put(e)
+
+            task = asyncio.ensure_future(pump())
+            waiter = asyncio.ensure_future(connected.wait())
+            opened_at: Optional[float] = None
+            delivered = False
+            try:
+                await asyncio.wait({task, waiter}, return_when=asyncio.FIRST_COMPLETED)
+                if connected.is_set():
+                    opened_at = loop.time()
+                    async for item in resume():
+                        yield item
+                while True:
+                    item = await queue.get()
+                    if item is closed:
+                        raise TONAPIError("SSE stream closed by the server")
+                    if isinstance(item, BaseException):
+                        raise item
+                    delivered = True
+                    yield item
+            except (TONAPIError, aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if isinstance(e, TONAPIClientError) and not isinstance(e, TONAPITooManyRequestsError):
+                    raise  # rejected, reconnecting would not help
+                if delivered or opened_at is not None and loop.time() - opened_at >= SSE_STABLE_AFTER:
+                    attempt = 0  # the connection worked, this is a new outage
+                if max_reconnects is not None and attempt >= max_reconnects:
+                    raise
+                delay = self.retry_policy.get_delay(attempt, e)
+                if parser.retry is not None:
+                    delay = max(delay, parser.retry / 1000)
+                self.logger.warning(f"SSE stream {method} dropped, reconnecting in {delay:.2f}s: {e!r}")
+                await asyncio.sleep(delay)
+                attempt += 1
+            finally:
+                waiter.cancel()
+                task.cancel()
+
     async def _subscribe_websocket(
             self,
             method: str,
@@ -166,14 +493,15 @@ class AsyncTonapiClientBase:
         self.logger.debug(f"Subscribing to WebSocket with payload: {payload}")
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.ws_connect(self.websocket_url) as ws:
+            session = self.session.get()
+            async with self.__stream_key() as headers:
+                async with session.ws_connect(self.websocket_url, headers=headers) as ws:
                     await ws.send_json(payload)
 
                     async for msg in ws:
                         if isinstance(msg, aiohttp.WSMessage):
                             if msg.type == aiohttp.WSMsgType.TEXT:
-                                message_json = json.loads(msg.data)
+                                message_json = self.codec.loads(msg.data)
                                 self.logger.debug(f"Received WebSocket message: {message_json}")
                                 if "params" in message_json:
                                     params = message_json["params"]
@@ -195,9 +523,42 @@ class AsyncTonapiClientBase:
         except aiohttp.ClientError as e:
             self.logger.error(f"WebSocket connection failed: {e}")
             raise TONAPIError(e)
-        finally:
-            if not ws.closed:
-                await ws.close()
+
+    async def _handle_events(
+            self,
+            events: AsyncIterator[Dict[str, Any]],
+            model: Type["BaseModel"],
+            handler: Callable[..., Awaitable[Any]],
+            args: Tuple = (),
+            keys: Optional[Callable[[Dict[str, Any]], Iterable[Hashable]]] = None,
+            workers: int = 1,
+            max_pending: int = 1000,
+    ) -> None:
+        """
+        Parse stream events and pass them to a handler.
+
+        With one worker each event is handled before the next is read. With more, events are
+        handled concurrently by a :class:`KeyedDispatcher`, in order for events with a common key.
+
+        :param events: The decoded events.
+        :param model: The event model.
+        :param handler: The event handler.
+        :param args: Additional arguments to pass to the handler.
+        :param keys: Get the ordering keys of an event, e.g. its accounts. None handles events in any order.
+        :param workers: Maximum number of events handled at the same time.
+        :param max_pending: Maximum number of events read ahead of the handlers;
+         when reached, reading from the stream pauses.
+        """
+        if workers <= 1:
+            async for data in events:
+                await handler(self._parse(model, data), *args)
+            return
+
+        async with KeyedDispatcher(handler, workers=workers, max_pending=max_pending) as dispatcher:
+            async for data in events:
+                event_keys = keys(data) if keys is not None else ()
+                await dispatcher.submit(self._parse(model, data), *args, keys=event_keys)
+            await dispatcher.join()
 
     async def _request(
             self,
@@ -206,6 +567,8 @@ class AsyncTonapiClientBase:
             headers: Optional[Dict[str, Any]] = None,
             params: Optional[Dict[str, Any]] = None,
             body: Optional[Dict[str, Any]] = None,
+            idempotent: Optional[bool] = None,
+            priority: Optional[Priority] = None,
     ) -> Dict[str, Any]:
         """
         Make an HTTP request.
@@ -215,6 +578,9 @@ class AsyncTonapiClientBase:
         :param headers: Optional headers to include in the request.
         :param params: Optional query parameters.
         :param body: Optional request body data.
+        :param idempotent: Whether the request may safely be sent twice.
+         Defaults to True for GET and DELETE and False for POST.
+        :param priority: The scheduling lane of the endpoint. ``use_priority()`` takes precedence.
         :return: The response content as a dictionary.
         """
         url = self.base_url + path
@@ -225,37 +591,476 @@ class AsyncTonapiClientBase:
         self.logger.debug(f"Request {method}: {url}")
         self.logger.debug(f"Headers: {headers}, Params: {params}, Body: {body}")
 
+        if idempotent is None:
+            idempotent = method in IDEMPOTENT_METHODS
+        priority = _priority.get() or priority or Priority.default
+
+        key = request_key(method, url, params, headers) if method == "GET" else None
+        rule = self.cache_policy.match(path) if key is not None and self.cache is not None else None
+        if rule is not None:
+            cached = await self.cache.get(key)
+            if cached is not None:
+                self.logger.debug(f"Cache hit: {url}")
+                return cached
+
+        # a namespace with its own host (webhooks) bypasses the hedge URLs and the balancer
+        base_url = self.__namespace_base_url()
+        if method == "GET" and self.hedge_policy is not None and base_url is None:
+            send = lambda: self._send_hedged(method, path, headers, params, body, idempotent, priority)
+        else:
+            send = lambda: self._send(method, path, headers, params, body, idempotent, base_url, priority)
+
+        if key is not None and self.coalescer is not None:
+            response = await self.coalescer.do(key, send)
+        else:
+            response = await send()
+
+        if rule is not None and rule.accepts(response):
+            await self.cache.set(key, response, rule.ttl)
+        return response
+
+    async def _send(
+            self,
+            method: str,
+            path: str,
+            headers: Dict[str, Any],
+            params: Optional[Dict[str, Any]],
+            body: Optional[Dict[str, Any]],
+            idempotent: bool,
+            base_url: Optional[str] = None,
+            priority: Priority = Priority.default,
+    ) -> Dict[str, Any]:
+        """
+        Send a prepared request, retrying it according to the retry policy.
+
+        :param method: The HTTP method.
+        :param path: The API path.
+        :param headers: Request headers.
+        :param params: Query parameters.
+        :param body: Request body data.
+        :param idempotent: Whether the request may safely be sent twice.
+        :param base_url: Send the request to this base URL. Defaults to an endpoint
+         of the balancer for each attempt, or to the client's base URL.
+        :param priority: The scheduling lane of the request.
+        :return: The response content as a dictionary.
+        """
+        loop = asyncio.get_running_loop()
         timeout = aiohttp.ClientTimeout(total=self.timeout)
+        session = self.session.get()
+        self.retry_policy.budget.deposit()
+
+        data = None
+        if body is not None:
+            data = self.codec.dumps(body)
+            headers = {**headers, "Content-Type": "application/json"}
+
+        attempt = switches = 0
+        while True:
+            await self.scheduler.acquire(priority)
+            api_key = endpoint = error = latency = None
+            started = loop.time()
+            try:
+                api_key, attempt_headers = await self.__acquire_key(headers)
+                endpoint = self.__acquire_endpoint(base_url)
+                async with session.request(
+                        method=method,
+                        url=(endpoint.url if endpoint is not None else base_url or self.base_url) + path,
+                        headers=attempt_headers,
+                        params=params,
+                        data=data,
+                        timeout=timeout,
+                ) as response:
+                    await self.__raise_for_status(response)
+                    content = await self.__read_content(response)
+                latency = loop.time() - started
+                if api_key is not None:
+                    self.key_pool.report_success(api_key)
+                return content
+            except (TONAPIError, aiohttp.ClientError, asyncio.TimeoutError) as e:
+                error, latency = e, loop.time() - started
+            finally:
+                self.__release_attempt(api_key, endpoint, latency, error)
+
+            if self.__switch_key(api_key, error) and switches < len(self.key_pool) - 1:
+                switches += 1
+                continue
+            await self.__retry_or_raise(error, attempt, idempotent)
+            attempt += 1
+
+    def __release_attempt(
+            self,
+            api_key: Optional[APIKey],
+            endpoint: Optional[Endpoint],
+            latency: Optional[float],
+            error: Optional[Exception],
+            slot: bool = True,
+    ) -> None:
+        """
+        Give back what an attempt took from the scheduler, the key pool and the balancer.
+
+        :param api_key: The key of the attempt, if any.
+        :param endpoint: The balancer endpoint of the attempt, if any.
+        :param latency: Seconds until the response or the error. None if the attempt was cancelled.
+        :param error: The error raised by the attempt, if any.
+        :param slot: Whether to free the scheduler slot.
+        """
+        if slot:
+            self.scheduler.release()
+        if api_key is not None:
+            self.key_pool.release(api_key)
+        if endpoint is not None:
+            failed = error is not None and not isinstance(error, TONAPIClientError)
+            self.balancer.release(endpoint, latency, failed)
+
+    async def _send_hedged(
+            self,
+            method: str,
+            path: str,
+            headers: Dict[str, Any],
+            params: Optional[Dict[str, Any]],
+            body: Optional[Dict[str, Any]],
+            idempotent: bool,
+            priority: Priority = Priority.default,
+    ) -> Dict[str, Any]:
+        """
+        Send a read-only request to the base URL (or the balancer) and, if it is slow, a duplicate to
+        the base URLs of the hedge policy. The first successful response is returned.
+
+        :param method: The HTTP method.
+        :param path: The API path.
+        :param headers: Request headers.
+        :param params: Query parameters.
+        :param body: Request body data.
+        :param idempotent: Whether the request may safely be sent twice.
+        :param priority: The scheduling lane of the request.
+        :return: The response content as a dictionary.
+        """
+        calls = [
+            functools.partial(self._send, method, path, headers, params, body, idempotent, base_url, priority)
+            for base_url in [None, *self.hedge_policy.base_urls]
+        ]
+        return await hedge(self.hedge_policy, calls)
+
+    def __namespace_base_url(self) -> Optional[str]:
+        """The base URL of a namespace that overrides the client's one (e.g. webhooks), else None."""
+        base_url = self.base_url
+        return None if base_url == self.core.base_url else base_url
+
+    def __acquire_endpoint(self, base_url: Optional[str]) -> Optional[Endpoint]:
+        """
+        Take an endpoint of the balancer for the next attempt, unless the base URL is given.
+
+        :param base_url: The base URL the request must be sent to, if any.
+        :return: The endpoint, or None if the request does not go through the balancer.
+        """
+        if base_url is not None or self.balancer is None:
+            return None
+        self.balancer.start(self.__probe_endpoint)
+        return self.balancer.acquire()
+
+    async def __probe_endpoint(self, endpoint: Endpoint) -> Tuple[float, Optional[int]]:
+        """
+        Health check of a balancer endpoint.
+
+        The probe requests count against the client's rate limit and concurrency like any
+        other request; they are scheduled in the interactive lane so a backlog does not
+        delay them past the check timeout.
+
+        :param endpoint: The endpoint to check.
+        :return: The indexing latency in seconds and the liteserver time of the endpoint.
+        :raises TONAPIError: If the endpoint or its REST API is down.
+        """
+        session = self.session.get()
+        timeout = aiohttp.ClientTimeout(total=self.balancer.check_timeout)
+
+        async def get(path: str) -> Dict[str, Any]:
+            await self.scheduler.acquire(Priority.interactive)
+            api_key = None
+            try:
+                api_key, headers = await self.__acquire_key(self.headers)
+                async with session.get(endpoint.url + path, headers=headers, timeout=timeout) as response:
+                    await self.__raise_for_status(response)
+                    return await self.__read_content(response)
+            finally:
+                self.scheduler.release()
+                if api_key is not None:
+                    self.key_pool.release(api_key)
+
+        status, raw_time = await asyncio.gather(get("v2/status"), get("v2/liteserver/get_time"))
+        if not status.get("rest_online", True):
+            raise TONAPIError("REST API is offline")
+        return status.get("indexing_latency", 0), raw_time.get("time")
 
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            for attempt in range(self.max_retries + 1):
+    async def __acquire_key(self, headers: Dict[str, Any]) -> Tuple[Optional[APIKey], Dict[str, Any]]:
+        """
+        Take a key of the key pool, if one is set, for the next attempt.
+
+        :param headers: Request headers.
+        :return: The key, or None without a key pool, and the headers authorized with it.
+        """
+        if self.key_pool is None:
+            return None, headers
+        api_key = await self.key_pool.acquire()
+        return api_key, {**headers, "Authorization": api_key.authorization}
+
+    def __switch_key(self, api_key: Optional[APIKey], error: Exception) -> bool:
+        """
+        Report a throttled key to the key pool.
+
+        :param api_key: The key the attempt was sent with.
+        :param error: The error raised by the attempt.
+        :return: True if the attempt was throttled and another key can take it at once.
+        """
+        if api_key is None or not isinstance(error, TONAPITooManyRequestsError):
+            return False
+        self.key_pool.report_throttled(api_key, error.retry_after)
+        if not self.key_pool.has_ready_key():
+            return False
+        self.logger.warning(f"API key {api_key.key[:6]}... throttled, switching to another key")
+        return True
+
+    async def __retry_or_raise(self, error: Exception, attempt: int, idempotent: bool) -> None:
+        """
+        Wait before the next attempt, or re-raise the error if the request is not retried.
+
+        :param error: The error raised by the attempt.
+        :param attempt: Zero-based number of the failed attempt.
+        :param idempotent: Whether the request may safely be sent twice.
+        """
+        if not self.retry_policy.should_retry(error, attempt, idempotent):
+            if isinstance(error, aiohttp.ClientResponseError):
+                raise TONAPIError(error)
+            raise error
+        delay = self.retry_policy.get_delay(attempt, error)
+        self.logger.warning(f"Request failed (attempt {attempt}), retrying in {delay:.2f}s: {error!r}")
+        await asyncio.sleep(delay)
+
+    async def _stream(
+            self,
+            method: str,
+            key: str,
+            model: Type[M],
+            params: Optional[Dict[str, Any]] = None,
+            headers: Optional[Dict[str, Any]] = None,
+    ) -> AsyncGenerator[M, None]:
+        """
+        Make a GET request and yield the items of a list field as the body arrives.
+
+        The request is retried according to the retry policy until the response status
+        is received; errors while reading the body are raised, since items may already
+        have been yielded. Streamed responses bypass the cache and request coalescing.
+
+        The connection and the scheduler slot are released as soon as the body is read
+        or fails. A consumer that stops early must close the generator, e.g. with
+        ``contextlib.aclosing()``, or they are held until it is garbage collected.
+
+        :param method: The API path.
+        :param key: The name of the top-level list field, e.g. ``nft_items``.
+        :param model: The item model.
+        :param params: Optional query parameters.
+        :param headers: Optional headers to include in the request.
+        :return: An asynchronous generator of items.
+        """
+        headers = {**self.headers, **(headers or {})}
+        if params:
+            params = {k: str(v).lower() if isinstance(v, bool) else v for k, v in params.items()}
+        self.logger.debug(f"Stream GET: {method}")
+        self.logger.debug(f"Headers: {headers}, Params: {params}")
+
+        # A large body may take longer than the request timeout, so only stalls are limited.
+        timeout = aiohttp.ClientTimeout(total=None, sock_connect=self.timeout, sock_read=self.timeout)
+        loop = asyncio.get_running_loop()
+        session = self.session.get()
+        self.retry_policy.budget.deposit()
+
+        # The scheduler slot is held until the body is read, like the connection.
+        priority = _priority.get() or Priority.bulk
+        attempt = switches = 0
+        while True:
+            await self.scheduler.acquire(priority)
+            api_key = endpoint = error = latency = None
+            started = loop.time()
+            try:
+                api_key, attempt_headers = await self.__acquire_key(headers)
+                endpoint = self.__acquire_endpoint(self.__namespace_base_url())
+                url = (endpoint.url if endpoint is not None else self.base_url) + method
+                response = await session.get(url, headers=attempt_headers, params=params, timeout=timeout)
                 try:
-                    async with session.request(
-                            method=method,
-                            url=url,
-                            headers=headers,
-                            params=params,
-                            json=body,
-                    ) as response:
-                        await self.__raise_for_status(response)
-                        return await self.__read_content(response)
-                except aiohttp.ClientResponseError as e:
-                    self.logger.error(f"Request failed (attempt {attempt}): {e}")
-                    if attempt < self.max_retries:
-                        await asyncio.sleep(1)
-                    else:
-                        raise TONAPIError(e)
-            else:
-                raise TONAPIError("Max retries exceeded")
+                    await self.__raise_for_status(response)
+                except BaseException:
+                    response.release()
+                    raise
+                latency = loop.time() - started
+                if api_key is not None:
+                    self.key_pool.report_success(api_key)
+                break
+            except (TONAPIError, aiohttp.ClientError, asyncio.TimeoutError) as e:
+                error, latency = e, loop.time() - started
+            finally:
+                self.__release_attempt(api_key, endpoint, latency, error, slot=latency is None or error is not None)
+
+            if self.__switch_key(api_key, error) and switches < len(self.key_pool) - 1:
+                switches += 1
+                continue
+            await self.__retry_or_raise(error, attempt, True)
+            attempt += 1
+
+        parser = JSONArrayParser(key)
+        released = False
+        try:
+            while not released:
+                try:
+                    chunk = await response.content.readany()
+                    items = parser.feed(chunk) if chunk else []
+                    if chunk and parser.complete:
+                        await response.content.read()  # drain the end so the connection is reused
+                    if not chunk or parser.complete:
+                        parser.close()
+                except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+                    raise TONAPIError(f"Failed to read response content: {e}")
+                if not chunk or parser.complete:
+                    # the body is read: free the connection before handing out the last items
+                    released = True
+                    response.release()
+                    self.scheduler.release()
+                for item in items:
+                    yield self._parse(model, item)
+        finally:
+            if not released:
+                response.release()
+                self.scheduler.release()
+
+    async def _paginate(
+            self,
+            method: str,
+            key: str,
+            model: Type[M],
+            params: Dict[str, Any],
+            headers: Optional[Dict[str, Any]] = None,
+            before_lt: Optional[int] = None,
+            until_lt: Optional[int] = None,
+            since: Optional[int] = None,
+            max_items: Optional[int] = None,
+            time_field: str = "utime",
+    ) -> AsyncGenerator[M, None]:
+        """
+        Iterate over the items of a history endpoint paginated with ``before_lt``,
+        prefetching the next page. See :func:`pytonapi.pagination.paginate_by_lt`.
+
+        :param method: The API path.
+        :param key: The name of the item list in the response.
+        :param model: The item model.
+        :param params: Query parameters; must contain the page ``limit``.
+        :param headers: Optional headers to include in the requests.
+        :param before_lt: Start below this lt.
+        :param until_lt: Stop at the first item with an lt lower or equal to this one.
+        :param since: Stop at the first item older than this unix time.
+        :param max_items: Stop after this number of items.
+        :param time_field: The item field with the unix time.
+        :return: An asynchronous generator of items.
+        """
+
+        async def fetch(cursor: Optional[int]) -> Dict[str, Any]:
+            page_params = dict(params)
+            if cursor is not None:
+                page_params["before_lt"] = cursor
+            return await self._get(method=method, params=page_params, headers=headers, priority=Priority.bulk)
+
+        async for item in paginate_by_lt(
+                fetch, key, params["limit"], before_lt, until_lt, since, max_items, time_field,
+        ):
+            yield self._parse(model, item)
+
+    async def _paginate_offset(
+            self,
+            method: str,
+            key: str,
+            model: Type[M],
+            params: Optional[Dict[str, Any]] = None,
+            headers: Optional[Dict[str, Any]] = None,
+            page_size: int = 100,
+            offset: int = 0,
+            max_items: Optional[int] = None,
+            max_concurrency: int = 4,
+    ) -> AsyncGenerator[M, None]:
+        """
+        Iterate over the items of an offset-paginated endpoint, fetching pages
+        concurrently. See :func:`pytonapi.pagination.paginate_by_offset`.
+
+        :param method: The API path.
+        :param key: The name of the item list in the response.
+        :param model: The item model.
+        :param params: Query parameters other than ``offset`` and ``limit``.
+        :param headers: Optional headers to include in the requests.
+        :param page_size: Maximum number of items per request.
+        :param offset: The offset of the first item.
+        :param max_items: Stop after this number of items.
+        :param max_concurrency: Maximum number of pages requested at the same time.
+        :return: An asynchronous generator of items.
+        """
+
+        async def fetch(page_offset: int, limit: int) -> Dict[str, Any]:
+            page_params = {**(params or {}), "offset": page_offset, "limit": limit}
+            return await self._get(method=method, params=page_params, headers=headers, priority=Priority.bulk)
+
+        async for item in paginate_by_offset(fetch, key, page_size, offset, max_items, max_concurrency):
+            yield self._parse(model, item)
+
+    async def _scan(
+            self,
+            method: str,
+            key: str,
+            model: Type[M],
+            params: Dict[str, Any],
+            start_date: int,
+            end_date: int,
+            headers: Optional[Dict[str, Any]] = None,
+            id_fields: Sequence[str] = ("lt",),
+            time_field: str = "utime",
+            min_window: int = 60,
+            max_concurrency: int = 4,
+            descending: bool = True,
+    ) -> List[M]:
+        """
+        Scan a date range of a history endpoint in parallel time windows.
+        See :func:`pytonapi.pagination.scan_by_time`.
+
+        :param method: The API path.
+        :param key: The name of the item list in the response.
+        :param model: The item model.
+        :param params: Query parameters; must contain the page ``limit``.
+        :param start_date: Start of the range, unix time.
+        :param end_date: End of the range, unix time.
+        :param headers: Optional headers to include in the requests.
+        :param id_fields: Item fields that identify an item.
+        :param time_field: The item field with the unix time.
+        :param min_window: Windows shorter than this number of seconds are not split.
+        :param max_concurrency: Maximum number of pages requested at the same time.
+        :param descending: Sort newest first if True, oldest first otherwise.
+        :return: The items of the range, sorted by lt.
+        """
+
+        async def fetch(window_start: int, window_end: int, cursor: Optional[int]) -> Dict[str, Any]:
+            page_params = {**params, "start_date": window_start, "end_date": window_end}
+            if cursor is not None:
+                page_params["before_lt"] = cursor
+            return await self._get(method=method, params=page_params, headers=headers, priority=Priority.bulk)
+
+        items = await scan_by_time(
+            fetch, key, start_date, end_date, params["limit"],
+            id_fields, time_field, min_window, max_concurrency, descending,
+        )
+        return [self._parse(model, item) for item in items]
 
     async def _get(
             self,
             method: str,
             params: Optional[Dict[str, Any]] = None,
             headers: Optional[Dict[str, Any]] = None,
+            priority: Optional[Priority] = None,
     ) -> Dict[str, Any]:
         """Make a GET request."""
-        return await self._request("GET", method, params=params, headers=headers)
+        return await self._request("GET", method, params=params, headers=headers, priority=priority)
 
     async def _post(
             self,
@@ -263,15 +1068,73 @@ class AsyncTonapiClientBase:
             params: Optional[Dict[str, Any]] = None,
             body: Optional[Dict[str, Any]] = None,
             headers: Optional[Dict[str, Any]] = None,
+            idempotent: bool = False,
+            priority: Optional[Priority] = None,
     ) -> Dict[str, Any]:
-        """Make a POST request."""
-        return await self._request("POST", method, params=params, body=body, headers=headers)
+        """Make a POST request. Pass ``idempotent=True`` for read-only endpoints so they can be retried."""
+        return await self._request(
+            "POST", method, params=params, body=body, headers=headers, idempotent=idempotent, priority=priority,
+        )
+
+    async def _post_bulk(
+            self,
+            method: str,
+            account_ids: List[str],
+            model: Type[M],
+            result_key: str,
+            chunk_size: int = BULK_CHUNK_SIZE,
+            max_concurrency: int = 4,
+    ) -> M:
+        """
+        Make a bulk POST request, splitting large inputs into chunks sent concurrently.
+
+        :param method: The API path of the bulk endpoint.
+        :param account_ids: The IDs to look up.
+        :param model: The response model.
+        :param result_key: The response field holding the list of items.
+        :param chunk_size: Maximum number of IDs per request.
+        :param max_concurrency: Maximum number of chunks in flight.
+        :return: The response merged from all chunks in input order.
+        :raises TONAPIBulkRequestError: If some of the chunks failed. The error holds the
+         merged response of the chunks that succeeded.
+        """
+        chunk_size = max(chunk_size, 1)
+        chunks = [account_ids[i:i + chunk_size] for i in range(0, len(account_ids), chunk_size)]
+        if len(chunks) <= 1:
+            response = await self._post(method=method, body={"account_ids": account_ids}, idempotent=True)
+            return self._parse(model, response)
+
+        semaphore = asyncio.Semaphore(max(max_concurrency, 1))
+
+        async def fetch(chunk: List[str]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self._post(method=method, body={"account_ids": chunk}, idempotent=True)
+
+        responses = await asyncio.gather(*(fetch(chunk) for chunk in chunks), return_exceptions=True)
+
+        items: List[Any] = []
+        errors: List[Tuple[List[str], Exception]] = []
+        for chunk, response in zip(chunks, responses):
+            if isinstance(response, BaseException):
+                if not isinstance(response, Exception):
+                    raise response
+                errors.append((chunk, response))
+            else:
+                items.extend(response[result_key])
+
+        if errors and len(errors) == len(chunks):
+            raise errors[0][1]
+        result = self._parse(model, {result_key: items})
+        if errors:
+            raise TONAPIBulkRequestError(result, errors)
+        return result
 
     async def _delete(
             self,
             method: str,
             params: Optional[Dict[str, Any]] = None,
             headers: Optional[Dict[str, Any]] = None,
+            priority: Optional[Priority] = None,
     ) -> Dict[str, Any]:
         """Make a DELETE request."""
-        return await self._request("DELETE", method, params=params, headers=headers)
+        return await self._request("DELETE", method, params=params, headers=headers, priority=priority)
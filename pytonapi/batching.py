@@ -0,0 +1,101 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Mapping, Optional, Set
+
+from pytonapi.exceptions import TONAPINotFoundError
+
+
+class BatchLoader:
+    """
+    Collects single-item loads into batched calls, DataLoader-style.
+
+    Keys requested within ``window`` seconds (or until ``max_batch_size`` distinct keys
+    are queued) are sent to ``batch_fn`` in one call, and each caller receives
+    the value for its own key. Concurrent loads of the same key share one slot.
+    """
+
+    def __init__(
+            self,
+            batch_fn: Callable[[List[Hashable]], Awaitable[Mapping[Hashable, Any]]],
+            max_batch_size: int = 100,
+            window: float = 0.005,
+    ) -> None:
+        """
+        Initialize the BatchLoader.
+
+        :param batch_fn: Coroutine function that loads a list of keys and returns a mapping
+         from key to value. Keys missing from the mapping are reported as not found.
+        :param max_batch_size: Maximum number of keys per batch.
+        :param window: Seconds to wait for more keys before a batch is sent.
+        """
+        self.batch_fn = batch_fn
+        self.max_batch_size = max(max_batch_size, 1)
+        self.window = window
+
+        self._pending: Dict[Hashable, "asyncio.Future[Any]"] = {}
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set["asyncio.Task[None]"] = set()
+
+        self.loads = 0
+        self.batches = 0
+
+    async def load(self, key: Hashable) -> Any:
+        """
+        Load the value for one key.
+
+        :param key: The key to load.
+        :return: The value returned by ``batch_fn`` for the key.
+        :raises TONAPINotFoundError: If the batch result has no value for the key.
+        """
+        self.loads += 1
+        future = self._pending.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            future.add_done_callback(_consume_exception)
+            self._pending[key] = future
+
+            if len(self._pending) >= self.max_batch_size:
+                self._dispatch()
+            elif self._timer is None:
+                self._timer = loop.call_later(self.window, self._dispatch)
+
+        return await asyncio.shield(future)
+
+    def _dispatch(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending = self._pending, {}
+        if batch:
+            task = asyncio.ensure_future(self._run(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: Dict[Hashable, "asyncio.Future[Any]"]) -> None:
+        self.batches += 1
+        try:
+            results = await self.batch_fn(list(batch))
+        except asyncio.CancelledError:
+            for future in batch.values():
+                future.cancel()
+            raise
+        except Exception as e:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for key, future in batch.items():
+            if future.done():
+                continue
+            if key in results:
+                future.set_result(results[key])
+            else:
+                future.set_exception(TONAPINotFoundError(f"{key} not found"))
+
+
+def _consume_exception(future: "asyncio.Future[Any]") -> None:
+    # Every caller of a key may have been cancelled; don't warn about an unretrieved error.
+    if not future.cancelled():
+        future.exception()
@@ -0,0 +1,209 @@
+import re
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Tuple
+
+
+class CacheStats:
+    """
+    Hit and miss counters of a response cache.
+    """
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of lookups served from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"CacheStats(hits={self.hits}, misses={self.misses}, "
+            f"evictions={self.evictions}, expirations={self.expirations})"
+        )
+
+
+class ResponseCache(ABC):
+    """
+    Base class for response caches.
+
+    Subclass it to store responses elsewhere (e.g. in Redis). Keys are hashable
+    tuples built by :func:`pytonapi.singleflight.request_key`, values are decoded responses.
+    A subclass must implement :meth:`get`, :meth:`set` and :meth:`clear`.
+    """
+
+    def __init__(self) -> None:
+        self.stats = CacheStats()
+
+    @abstractmethod
+    async def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Get a cached response.
+
+        :param key: The request key.
+        :return: The cached response, or None on a miss.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store a response.
+
+        :param key: The request key.
+        :param value: The decoded response.
+        :param ttl: Time to live in seconds. None stores the response until it is evicted.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """Drop all cached responses."""
+        raise NotImplementedError
+
+
+class LRUCache(ResponseCache):
+    """
+    In-memory response cache with TTL expiry and least-recently-used eviction.
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        """
+        Initialize the LRUCache.
+
+        :param maxsize: Maximum number of stored responses.
+        """
+        super().__init__()
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, Tuple[Optional[float], Any]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    async def get(self, key: Hashable) -> Optional[Any]:
+        item = self._data.get(key)
+        if item is None:
+            self.stats.misses += 1
+            return None
+
+        expires_at, value = item
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._data[key]
+            self.stats.expirations += 1
+            self.stats.misses += 1
+            return None
+
+        self._data.move_to_end(key)
+        self.stats.hits += 1
+        return value
+
+    async def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        expires_at = None if ttl is None else time.monotonic() + ttl
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self.stats.evictions += 1
+
+    async def clear(self) -> None:
+        self._data.clear()
+
+
+class CacheRule:
+    """
+    Caching rule for the endpoints whose path matches a pattern.
+    """
+
+    def __init__(
+            self,
+            pattern: str,
+            ttl: Optional[float],
+            predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+    ) -> None:
+        """
+        Initialize the CacheRule.
+
+        :param pattern: Regular expression matched against the whole API path, e.g. ``v2/rates``.
+        :param ttl: Time to live in seconds. None caches the response until it is evicted.
+        :param predicate: Optional check of the response; only responses it accepts are cached.
+        """
+        self.pattern = re.compile(pattern)
+        self.ttl = ttl
+        self.predicate = predicate
+
+    def accepts(self, response: Dict[str, Any]) -> bool:
+        """Whether the response may be cached."""
+        return self.predicate is None or self.predicate(response)
+
+
+class CachePolicy:
+    """
+    Ordered set of :class:`CacheRule`. The first matching rule wins;
+    endpoints without a matching rule are not cached.
+    """
+
+    def __init__(self, rules: Optional[Iterable[CacheRule]] = None) -> None:
+        """
+        Initialize the CachePolicy.
+
+        :param rules: Caching rules. Defaults to :data:`DEFAULT_CACHE_RULES`.
+        """
+        self.rules = list(DEFAULT_CACHE_RULES if rules is None else rules)
+
+    def match(self, path: str) -> Optional[CacheRule]:
+        """
+        Find the rule for an API path.
+
+        :param path: The API path, with or without the leading slash.
+        :return: The matching rule, or None if the endpoint is not cached.
+        """
+        path = path.lstrip("/")
+        for rule in self.rules:
+            if rule.pattern.fullmatch(path):
+                return rule
+        return None
+
+
+def is_trace_finished(trace: Dict[str, Any]) -> bool:
+    """
+    Check that a trace is final: not emulated and every internal outgoing
+    message has already produced its child transaction.
+
+    :param trace: The decoded trace.
+    :return: True if the trace can no longer change.
+    """
+    if trace.get("emulated"):
+        return False
+
+    stack = [trace]
+    while stack:
+        node = stack.pop()
+        children = node.get("children") or []
+        out_msgs = node.get("transaction", {}).get("out_msgs") or []
+        if len(children) < sum(1 for msg in out_msgs if msg.get("msg_type") == "int_msg"):
+            return False
+        stack.extend(children)
+    return True
+
+
+def is_event_finished(event: Dict[str, Any]) -> bool:
+    """Check that an event is no longer in progress."""
+    return event.get("in_progress") is False
+
+
+DEFAULT_CACHE_RULES = (
+    CacheRule(r"v2/blockchain/transactions/[^/]+", None),
+    CacheRule(r"v2/blockchain/messages/[^/]+/transaction", None),
+    CacheRule(r"v2/blockchain/blocks/[^/]+(/boc|/transactions)?", None),
+    CacheRule(r"v2/blockchain/masterchain/\d+/(shards|blocks|transactions|config|config/raw)", None),
+    CacheRule(r"v2/traces/[^/]+", None, is_trace_finished),
+    CacheRule(r"v2/events/[^/]+", None, is_event_finished),
+    CacheRule(r"v2/rates(/chart|/markets)?", 30),
+    CacheRule(r"v2/accounts/(?!search$)[^/]+", 5),
+)
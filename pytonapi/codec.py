@@ -0,0 +1,119 @@
+import json
+import re
+from typing import Any, Optional, Union
+
+# A JSON number token of 19+ digits may not fit into 64 bits. orjson and msgspec
+# decode such numbers as floats, which loses precision of large TON/jetton amounts,
+# so those documents are decoded by the stdlib parser instead.
+_LONG_NUMBER = re.compile(rb"[:\[,]\s*-?\d{19,}")
+
+
+class JSONCodec:
+    """
+    JSON codec based on the standard library. Base class for faster codecs.
+    """
+
+    name = "json"
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """
+        Decode a JSON document.
+
+        :param data: The raw JSON document.
+        :return: The decoded value.
+        :raises ValueError: If the document is not valid JSON.
+        """
+        return json.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        """
+        Encode a value as a compact UTF-8 JSON document.
+
+        :param obj: The value to encode.
+        :return: The encoded document.
+        """
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}()"
+
+
+class OrjsonCodec(JSONCodec):
+    """
+    JSON codec based on `orjson <https://github.com/ijl/orjson>`_.
+    """
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._orjson = orjson
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        if _LONG_NUMBER.search(data):
+            return super().loads(data)
+        return self._orjson.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        try:
+            return self._orjson.dumps(obj)
+        except TypeError:  # integers beyond 64 bits
+            return super().dumps(obj)
+
+
+class MsgspecCodec(JSONCodec):
+    """
+    JSON codec based on `msgspec <https://github.com/jcrist/msgspec>`_.
+    """
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        import msgspec
+
+        self._msgspec = msgspec
+        self._decoder = msgspec.json.Decoder()
+        self._encoder = msgspec.json.Encoder()
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        if _LONG_NUMBER.search(data):
+            return super().loads(data)
+        try:
+            return self._decoder.decode(data)
+        except self._msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+
+    def dumps(self, obj: Any) -> bytes:
+        try:
+            return self._encoder.encode(obj)
+        except (TypeError, OverflowError, self._msgspec.EncodeError):
+            return super().dumps(obj)
+
+
+def get_codec(name: Optional[str] = None) -> JSONCodec:
+    """
+    Get a JSON codec by name, or the fastest installed one.
+
+    :param name: "orjson", "msgspec" or "json". If omitted, orjson is preferred,
+     then msgspec, then the standard library.
+    :return: The codec instance.
+    :raises ValueError: If the codec name is unknown.
+    :raises ImportError: If the requested library is not installed.
+    """
+    codecs = {"orjson": OrjsonCodec, "msgspec": MsgspecCodec, "json": JSONCodec}
+    if name is not None:
+        if name not in codecs:
+            raise ValueError(f"Unknown JSON codec: {name}")
+        return codecs[name]()
+
+    for codec_class in (OrjsonCodec, MsgspecCodec):
+        try:
+            return codec_class()
+        except ImportError:
+            continue
+    return JSONCodec()
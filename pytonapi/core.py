@@ -0,0 +1,169 @@
+from enum import Enum
+from typing import Any, Dict, Mapping, Optional, Union
+
+from pytonapi.balancer import EndpointBalancer
+from pytonapi.batching import BatchLoader
+from pytonapi.cache import CachePolicy, ResponseCache
+from pytonapi.codec import JSONCodec, get_codec
+from pytonapi.hedging import HedgePolicy
+from pytonapi.keypool import APIKeyPool
+from pytonapi.logger import setup_logging
+from pytonapi.ratelimit import AsyncTokenBucket
+from pytonapi.retry import RetryPolicy
+from pytonapi.scheduler import PriorityScheduler
+from pytonapi.session import SessionManager
+from pytonapi.singleflight import RequestCoalescer
+
+
+class ResponseMode(str, Enum):
+    """
+    How decoded responses are turned into return values.
+
+    * ``model`` - validate into pydantic models (default).
+    * ``construct`` - build models with ``model_construct`` and skip validation.
+      Only the top-level model is built; nested objects stay plain dicts and lists.
+    * ``raw`` - return the decoded JSON as is. The returned dicts may be shared
+      with the response cache and other callers and must not be mutated.
+    """
+    model = "model"
+    construct = "construct"
+    raw = "raw"
+
+
+class ClientCore:
+    """
+    Transport state shared by a client and all of its namespaces.
+
+    Everything that must be common to the namespaces of one client (configuration,
+    the HTTP session, the rate limiter, the retry budget, the response cache,
+    batch loaders and the logger) lives here, so a namespace only keeps
+    a reference to the core.
+    """
+
+    def __init__(
+            self,
+            api_key: str,
+            is_testnet: bool = False,
+            max_retries: int = 0,
+            headers: Optional[Dict[str, Any]] = None,
+            base_url: Optional[str] = None,
+            websocket_url: Optional[str] = None,
+            timeout: Optional[float] = None,
+            debug: bool = False,
+            session: Optional[SessionManager] = None,
+            rps: Optional[float] = None,
+            burst: Optional[int] = None,
+            retry_policy: Optional[RetryPolicy] = None,
+            coalesce_requests: bool = False,
+            cache: Optional[ResponseCache] = None,
+            cache_policy: Optional[CachePolicy] = None,
+            batch_window: float = 0.005,
+            batch_size: int = 100,
+            json_codec: Optional[JSONCodec] = None,
+            response_mode: Union[ResponseMode, str] = ResponseMode.model,
+            key_pool: Optional[APIKeyPool] = None,
+            hedge_policy: Optional[HedgePolicy] = None,
+            balancer: Optional[EndpointBalancer] = None,
+            max_concurrency: Optional[int] = None,
+            priority_weights: Optional[Mapping[str, float]] = None,
+            sse_idle_timeout: Optional[float] = 60.0,
+    ) -> None:
+        """
+        Initialize the ClientCore.
+
+        :param api_key: The API key.
+        :param is_testnet: Use True if using the testnet.
+        :param max_retries: Maximum number of retries per request on transient errors.
+        :param headers: Additional headers to include in requests.
+        :param base_url: The base URL for the API.
+        :param websocket_url: The URL for the WebSocket server.
+        :param timeout: Request timeout in seconds.
+        :param debug: Enable debug mode.
+        :param session: Shared HTTP session manager. A new pooled one is created if omitted.
+         All namespaces of the client reuse its connections; close it with ``aclose()``
+         or by using the client as an async context manager.
+        :param rps: Client-side rate limit in requests per second, shared by all namespaces.
+         Set it to your plan's limit to avoid 429 responses. None disables the limiter.
+        :param burst: Maximum number of requests sent at once when the limiter is idle. Defaults to ``rps``.
+         Requires ``rps``.
+        :param retry_policy: Retry policy with backoff, error classification and a retry budget.
+         Defaults to ``RetryPolicy(max_retries=max_retries)``.
+        :param coalesce_requests: Share one in-flight request among concurrent identical GET calls.
+        :param cache: Response cache for GET requests, e.g. ``LRUCache(maxsize=10_000)``. None disables caching.
+        :param cache_policy: Per-endpoint TTL rules of the cache. Defaults to caching immutable
+         blockchain data forever and short-lived data (rates, account info) for a few seconds.
+        :param batch_window: Seconds that ``load_*`` methods wait to collect single-item
+         lookups into one bulk request.
+        :param batch_size: Maximum number of items per bulk request sent by ``load_*`` methods.
+        :param json_codec: JSON codec for request and response bodies. Defaults to the fastest
+         installed one: orjson, then msgspec, then the standard library.
+        :param response_mode: "model" to validate responses into pydantic models (default),
+         "construct" to skip validation, or "raw" to return decoded dicts.
+         Can be overridden per call with ``use_response_mode()``.
+        :param key_pool: Pool of API keys to spread requests over, e.g. ``APIKeyPool([key1, key2], rps=10)``.
+         Each request is sent with the key that has the most remaining capacity, and streams
+         are pinned to keys with free stream slots. ``api_key`` is ignored if set.
+        :param hedge_policy: Hedging of slow GET requests to other base URLs,
+         e.g. ``HedgePolicy(["https://my-opentonapi/"])``. None disables hedging.
+        :param balancer: Load balancer over several endpoints with health checks, e.g.
+         ``EndpointBalancer(["https://tonapi.io/", "https://my-opentonapi/"])``. ``base_url`` is ignored if set.
+        :param max_concurrency: Maximum number of requests in flight, shared by all namespaces.
+         Defaults to the connection limit of the session, so queued requests wait in priority order.
+        :param priority_weights: Shares of the scheduling lanes when requests queue for the rate limit
+         or connections, e.g. ``{"interactive": 16, "default": 4, "bulk": 1}`` (the default).
+        :param sse_idle_timeout: Seconds without any data, heartbeats included, after which an SSE
+         stream is considered dead and closed with an error. None waits forever.
+        """
+        self.api_key = api_key
+        self.is_testnet = is_testnet
+        self.max_retries = max(max_retries, 0)
+
+        self.headers = headers or {"Authorization": f"Bearer {self.api_key}"}
+        self.base_url = base_url or "https://tonapi.io/" if not is_testnet else "https://testnet.tonapi.io/"
+        self.websocket_url = websocket_url or "wss://tonapi.io/v2/websocket"
+
+        self.timeout = timeout
+        self.debug = debug
+        self.logger = setup_logging(self.debug)
+        self.session = session or SessionManager()
+        if burst is not None and not rps:
+            raise ValueError("burst requires rps")
+        self.rate_limiter = AsyncTokenBucket(rps, burst) if rps else None
+        self.scheduler = PriorityScheduler(
+            self.rate_limiter,
+            max_concurrency if max_concurrency is not None else self.session.limit,
+            priority_weights,
+        )
+        self.retry_policy = retry_policy or RetryPolicy(max_retries=self.max_retries)
+        self.coalescer = RequestCoalescer() if coalesce_requests else None
+        self.cache = cache
+        self.cache_policy = cache_policy or CachePolicy()
+        self.batch_window = batch_window
+        self.batch_size = batch_size
+        self.loaders: Dict[str, BatchLoader] = {}
+        self.codec = json_codec or get_codec()
+        self.response_mode = ResponseMode(response_mode)
+        self.key_pool = key_pool
+        self.hedge_policy = hedge_policy
+        self.balancer = balancer
+        self.sse_idle_timeout = sse_idle_timeout
+
+
+class CoreAttribute:
+    """
+    Descriptor exposing an attribute of the client's :class:`ClientCore`.
+
+    Reads and writes go to the shared core, so changing e.g. ``timeout`` on the
+    client is seen by all of its namespaces.
+    """
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance: Any, owner: type) -> Any:
+        if instance is None:
+            return self
+        return getattr(instance.core, self.name)
+
+    def __set__(self, instance: Any, value: Any) -> None:
+        setattr(instance.core, self.name, value)
@@ -0,0 +1,157 @@
+import asyncio
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Hashable, Iterable, List, Optional, Set
+
+from pytonapi.utils import address_key
+
+
+class _Job:
+    __slots__ = ("event", "args", "keys", "blocked")
+
+    def __init__(self, event: Any, args: tuple, keys: List[Hashable]) -> None:
+        self.event = event
+        self.args = args
+        self.keys = keys
+        self.blocked = 0  # keys whose queue has older jobs
+
+
+class KeyedDispatcher:
+    """
+    Runs an event handler on a bounded pool of workers, in order per key.
+
+    Events that share a key (e.g. an account) are handled one at a time in the order
+    they were submitted, while events with different keys are handled in parallel.
+    An event with several keys waits for all of them; an event without keys is
+    not ordered. When ``max_pending`` events are queued or running, :meth:`submit`
+    waits, so a slow handler slows down reading from the stream instead of letting
+    events pile up in memory.
+    """
+
+    def __init__(
+            self,
+            handler: Callable[..., Awaitable[Any]],
+            workers: int = 16,
+            max_pending: int = 1000,
+            on_error: Optional[Callable[[BaseException, Any], Any]] = None,
+    ) -> None:
+        """
+        Initialize the KeyedDispatcher.
+
+        :param handler: Coroutine function called with the event and the submitted arguments.
+        :param workers: Maximum number of handlers running at the same time.
+        :param max_pending: Maximum number of events queued or running.
+        :param on_error: Called with the error and the event when a handler fails. If omitted,
+         the first error stops the dispatcher and is raised by :meth:`submit` or :meth:`join`.
+        """
+        self.handler = handler
+        self.workers = max(workers, 1)
+        self.max_pending = max(max_pending, 1)
+        self.on_error = on_error
+
+        self._slots = asyncio.Semaphore(self.max_pending)
+        self._queues: Dict[Hashable, Deque[_Job]] = {}
+        self._ready: "asyncio.Queue[_Job]" = asyncio.Queue()
+        self._tasks: Set["asyncio.Task[None]"] = set()
+        self._pending = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._error: Optional[BaseException] = None
+
+    @property
+    def pending(self) -> int:
+        """Number of events queued or running."""
+        return self._pending
+
+    async def __aenter__(self) -> "KeyedDispatcher":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
+
+    async def submit(self, event: Any, *args: Any, keys: Iterable[Hashable] = ()) -> None:
+        """
+        Queue an event, waiting while ``max_pending`` events are queued or running.
+
+        :param event: The event to pass to the handler.
+        :param args: Additional arguments to pass to the handler.
+        :param keys: Keys that order the event, e.g. the accounts it involves.
+        """
+        self._raise_error()
+        await self._slots.acquire()
+        self._raise_error()
+
+        job = _Job(event, args, list(dict.fromkeys(keys)))
+        for key in job.keys:
+            queue = self._queues.setdefault(key, deque())
+            if queue:
+                job.blocked += 1
+            queue.append(job)
+        self._pending += 1
+        self._idle.clear()
+        if not job.blocked:
+            self._ready.put_nowait(job)
+        if len(self._tasks) < self.workers:
+            task = asyncio.ensure_future(self._work())
+            self._tasks.add(task)
+
+    async def join(self) -> None:
+        """Wait until all submitted events are handled."""
+        await self._idle.wait()
+        self._raise_error()
+
+    async def close(self) -> None:
+        """Stop the workers, dropping the events that have not been handled."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+
+    def _raise_error(self) -> None:
+        if self._error is not None:
+            raise self._error
+
+    async def _work(self) -> None:
+        while True:
+            job = await self._ready.get()
+            try:
+                await self.handler(job.event, *job.args)
+            except Exception as e:
+                if self.on_error is None:
+                    if self._error is None:
+                        self._error = e
+                    self._slots.release()  # wake up a blocked submit() to raise the error
+                    self._idle.set()
+                    return
+                self.on_error(e, job.event)
+            self._done(job)
+
+    def _done(self, job: _Job) -> None:
+        for key in job.keys:
+            queue = self._queues[key]
+            queue.popleft()
+            if queue:
+                head = queue[0]
+                head.blocked -= 1
+                if not head.blocked:
+                    self._ready.put_nowait(head)
+            else:
+                del self._queues[key]
+        self._pending -= 1
+        self._slots.release()
+        if not self._pending:
+            self._idle.set()
+
+
+def transaction_keys(data: Dict[str, Any]) -> List[Hashable]:
+    """Ordering keys of a transaction event: its account."""
+    return [address_key(data["account_id"])]
+
+
+def trace_keys(data: Dict[str, Any]) -> List[Hashable]:
+    """Ordering keys of a trace event: the accounts it involves."""
+    return [address_key(account) for account in data.get("accounts") or []]
+
+
+def block_keys(data: Dict[str, Any]) -> List[Hashable]:
+    """Ordering keys of a block event: its shard."""
+    return [(data["workchain"], data["shard"])]
@@ -0,0 +1,141 @@
+import asyncio
+from collections import deque
+from enum import Enum
+from typing import Any, AsyncIterator, Callable, Deque, Generic, Optional, TypeVar, Union
+
+E = TypeVar("E")
+
+
+class OverflowPolicy(str, Enum):
+    """
+    What an :class:`EventStream` does with a new event when its queue is full.
+
+    * ``block`` - stop reading from the connection until the consumer catches up.
+    * ``drop_oldest`` - drop the oldest queued event to make room.
+    * ``drop_newest`` - drop the new event.
+    """
+    block = "block"
+    drop_oldest = "drop_oldest"
+    drop_newest = "drop_newest"
+
+
+class EventStream(Generic[E]):
+    """
+    Asynchronous iterator over the events of a subscription.
+
+    The connection is read in a background task into a bounded queue, so the consumer
+    can fall behind by up to ``maxsize`` events without stalling the connection. The
+    subscription starts on first iteration and ends with :meth:`aclose`, when leaving
+    ``async with`` or when an ``async for`` loop over the stream ends, also by ``break``.
+    Errors of the connection are raised after the queued events.
+    """
+
+    def __init__(
+            self,
+            source: AsyncIterator[Any],
+            parse: Optional[Callable[[Any], E]] = None,
+            maxsize: int = 1000,
+            overflow: Union[OverflowPolicy, str] = OverflowPolicy.block,
+    ) -> None:
+        """
+        Initialize the EventStream.
+
+        :param source: The decoded events of the connection.
+        :param parse: Turns a decoded event into the yielded value. Only events that are
+         consumed are parsed.
+        :param maxsize: Maximum number of queued events.
+        :param overflow: What to do when the queue is full, see :class:`OverflowPolicy`.
+        """
+        self.source = source
+        self.parse = parse
+        self.maxsize = max(maxsize, 1)
+        self.overflow = OverflowPolicy(overflow)
+
+        self.received = 0
+        self.dropped = 0
+
+        self._queue: Deque[Any] = deque()
+        self._not_empty = asyncio.Event()
+        self._not_full = asyncio.Event()
+        self._task: Optional["asyncio.Task[None]"] = None
+        self._error: Optional[BaseException] = None
+        self._finished = False
+        self._closed = False
+
+    @property
+    def queued(self) -> int:
+        """Number of events read from the connection but not consumed yet."""
+        return len(self._queue)
+
+    def __aiter__(self) -> AsyncIterator[E]:
+        # An async generator, so that the loop closes the stream once the iterator is dropped.
+        return self._iterate()
+
+    async def _iterate(self) -> AsyncIterator[E]:
+        try:
+            while True:
+                try:
+                    event = await self.__anext__()
+                except StopAsyncIteration:
+                    return
+                yield event
+        finally:
+            await self.aclose()
+
+    async def __anext__(self) -> E:
+        if self._closed:
+            raise StopAsyncIteration
+        if self._task is None:
+            self._task = asyncio.ensure_future(self._pump())
+        while not self._queue:
+            if self._finished:
+                if self._error is not None:
+                    error, self._error = self._error, None
+                    raise error
+                raise StopAsyncIteration
+            self._not_empty.clear()
+            await self._not_empty.wait()
+        data = self._queue.popleft()
+        self._not_full.set()
+        return self.parse(data) if self.parse is not None else data
+
+    async def __aenter__(self) -> "EventStream[E]":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the subscription and drop the queued events."""
+        self._closed = True
+        self._queue.clear()
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+        elif hasattr(self.source, "aclose"):
+            await self.source.aclose()
+
+    async def _pump(self) -> None:
+        try:
+            async for data in self.source:
+                self.received += 1
+                if len(self._queue) >= self.maxsize:
+                    if self.overflow is OverflowPolicy.drop_newest:
+                        self.dropped += 1
+                        continue
+                    if self.overflow is OverflowPolicy.drop_oldest:
+                        self._queue.popleft()
+                        self.dropped += 1
+                    else:
+                        while len(self._queue) >= self.maxsize:
+                            self._not_full.clear()
+                            await self._not_full.wait()
+                self._queue.append(data)
+                self._not_empty.set()
+        except Exception as e:
+            self._error = e
+        finally:
+            self._finished = True
+            self._not_empty.set()
+            if hasattr(self.source, "aclose"):
+                await self.source.aclose()
@@ -1,9 +1,28 @@
-from typing import Optional
+from typing import Any, List, Optional, Tuple
 
 
 class TONAPIError(Exception):
     """Base class for all exceptions."""
 
+    #: HTTP status of the response that caused the error, if any.
+    status: Optional[int] = None
+    #: Seconds to wait before retrying, taken from the ``Retry-After`` header, if any.
+    retry_after: Optional[float] = None
+
+
+class TONAPIBulkRequestError(TONAPIError):
+    """Raised when some chunks of a chunked bulk request failed."""
+
+    def __init__(self, result: Any, errors: List[Tuple[List[str], Exception]]):
+        """
+        :param result: The response merged from the chunks that succeeded.
+        :param errors: The IDs of every failed chunk with the error it raised.
+        """
+        self.result = result
+        self.errors = errors
+        failed = sum(len(ids) for ids, _ in errors)
+        super().__init__(f"{len(errors)} bulk chunk(s) with {failed} item(s) failed: {errors[0][1]!r}")
+
 
 class TONAPIClientError(TONAPIError):
     """Base class for client-side errors (HTTP 4xx)."""
@@ -0,0 +1,161 @@
+import asyncio
+import math
+from collections import deque
+from typing import Awaitable, Callable, Deque, Dict, List, Optional, Sequence, TypeVar
+
+from pytonapi.exceptions import TONAPIClientError, TONAPITooManyRequestsError
+
+T = TypeVar("T")
+
+
+class HedgePolicy:
+    """
+    Sends a duplicate of a slow read-only request to another base URL.
+
+    The hedge delay is a percentile of recent response latencies, so only the
+    slowest requests (about ``100 - percentile`` percent) are duplicated.
+    The first successful response wins and the other request is cancelled.
+    """
+
+    def __init__(
+            self,
+            base_urls: Sequence[str],
+            percentile: float = 95.0,
+            initial_delay: float = 0.5,
+            min_delay: float = 0.01,
+            max_delay: float = 5.0,
+            max_hedges: int = 1,
+            window: int = 1000,
+            min_samples: int = 20,
+    ) -> None:
+        """
+        Initialize the HedgePolicy.
+
+        :param base_urls: Base URLs to send duplicates to, e.g. self-hosted opentonapi instances.
+        :param percentile: Latency percentile after which a request is hedged.
+        :param initial_delay: Hedge delay in seconds until ``min_samples`` latencies are recorded.
+        :param min_delay: Lower bound of the hedge delay in seconds.
+        :param max_delay: Upper bound of the hedge delay in seconds.
+        :param max_hedges: Maximum number of duplicates per request.
+        :param window: Number of recent latencies the percentile is computed over.
+        :param min_samples: Latencies required before the percentile is used.
+        """
+        if not base_urls:
+            raise ValueError("At least one base URL is required")
+        self.base_urls = list(base_urls)
+        self.percentile = percentile
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.max_hedges = max(min(max_hedges, len(self.base_urls)), 0)
+        self.min_samples = min_samples
+
+        self.requests = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+
+        self._latencies: Deque[float] = deque(maxlen=window)
+        self._delay: Optional[float] = None
+
+    @property
+    def hedge_rate(self) -> float:
+        """Fraction of requests that were hedged."""
+        return self.hedged / self.requests if self.requests else 0.0
+
+    @property
+    def delay(self) -> float:
+        """The current hedge delay in seconds."""
+        if self._delay is None:
+            if len(self._latencies) < self.min_samples:
+                delay = self.initial_delay
+            else:
+                ordered = sorted(self._latencies)
+                index = min(math.ceil(len(ordered) * self.percentile / 100) - 1, len(ordered) - 1)
+                delay = ordered[max(index, 0)]
+            self._delay = min(max(delay, self.min_delay), self.max_delay)
+        return self._delay
+
+    def record(self, latency: float) -> None:
+        """
+        Record the latency of a successful response.
+
+        :param latency: Seconds from sending the request to receiving the response.
+        """
+        self._latencies.append(latency)
+        if len(self._latencies) % 16 == 0 or len(self._latencies) <= self.min_samples:
+            self._delay = None  # recomputed lazily every 16 samples
+
+    def reset_stats(self) -> None:
+        """Reset the request and hedge counters."""
+        self.requests = self.hedged = self.hedge_wins = 0
+
+
+def is_final(error: BaseException) -> bool:
+    """Whether an error is the answer to the request, so another base URL would return it too."""
+    return isinstance(error, TONAPIClientError) and not isinstance(error, TONAPITooManyRequestsError)
+
+
+async def hedge(policy: HedgePolicy, calls: Sequence[Callable[[], Awaitable[T]]]) -> T:
+    """
+    Run the first call and start the next one each time the hedge delay passes without a response.
+
+    A call that fails with a transient error is replaced by the next call right away.
+    Client errors (4xx other than 429) are returned as is, since every base URL would
+    answer the same.
+
+    :param policy: The hedge policy.
+    :param calls: Coroutine functions sending the same request, the primary one first.
+    :return: The first successful result.
+    """
+    loop = asyncio.get_running_loop()
+    limit = min(len(calls), policy.max_hedges + 1)
+    pending: Dict["asyncio.Future[T]", int] = {}
+    started: List[float] = []
+    errors: List[BaseException] = []
+
+    def launch() -> None:
+        index = len(started)
+        if index == 1:
+            policy.hedged += 1
+        started.append(loop.time())
+        pending[asyncio.ensure_future(calls[index]())] = index
+
+    policy.requests += 1
+    launch()
+    try:
+        while pending:
+            can_hedge = len(started) < limit
+            done, _ = await asyncio.wait(
+                pending, timeout=policy.delay if can_hedge else None, return_when=asyncio.FIRST_COMPLETED,
+            )
+            if not done:
+                launch()
+                continue
+
+            winner = None
+            for task in done:
+                index = pending.pop(task)
+                error = task.exception()
+                if error is not None:
+                    errors.append(error)
+                elif winner is None:
+                    winner = task
+                    policy.record(loop.time() - started[index])
+                    if index > 0:
+                        policy.hedge_wins += 1
+            if winner is not None:
+                return winner.result()
+            for error in errors:
+                if is_final(error):
+                    raise error
+            if not pending and can_hedge:
+                launch()
+        raise errors[0]
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.wait(pending)  # let the losers release their connections
+            for task in pending:
+                if not task.cancelled():
+                    task.exception()  # the loser's result is not needed, nor is its error
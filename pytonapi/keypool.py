@@ -0,0 +1,200 @@
+import asyncio
+import math
+import time
+from typing import Iterable, List, Optional, Union
+
+from pytonapi.exceptions import TONAPISSELimitReachedError
+from pytonapi.ratelimit import AsyncTokenBucket
+
+
+class APIKey:
+    """
+    An API key of an :class:`APIKeyPool` with its limits and usage counters.
+    """
+
+    def __init__(
+            self,
+            key: str,
+            rps: Optional[float] = None,
+            burst: Optional[int] = None,
+            max_streams: Optional[int] = None,
+    ) -> None:
+        """
+        Initialize the APIKey.
+
+        :param key: The API key.
+        :param rps: Requests per second allowed by the key's plan. None if unlimited.
+        :param burst: Maximum number of requests sent at once with the key. Defaults to ``rps``.
+         Requires ``rps``.
+        :param max_streams: Streaming (SSE/WebSocket) connections allowed by the key's plan. None if unlimited.
+        """
+        if burst is not None and not rps:
+            raise ValueError("burst requires rps")
+        self.key = key
+        self.rate_limiter = AsyncTokenBucket(rps, burst) if rps else None
+        self.max_streams = max_streams
+
+        self.in_flight = 0
+        self.streams = 0
+        self.requests = 0
+        self.throttled = 0
+        self.cooldown_until = 0.0
+        self.stream_cooldown_until = 0.0
+        self._strikes = 0
+
+    @property
+    def authorization(self) -> str:
+        """The ``Authorization`` header value."""
+        return f"Bearer {self.key}"
+
+    @property
+    def capacity(self) -> float:
+        """Requests the key can send right now without waiting. Infinite if the key has no rate limit."""
+        if self.rate_limiter is None:
+            return math.inf
+        return self.rate_limiter.available
+
+    @property
+    def free_streams(self) -> float:
+        """
+        Streaming connections the key can still open. Infinite if the key has no stream limit,
+        0 while the key is cooling down after the server refused a stream.
+        """
+        if self.stream_cooldown_until > time.monotonic():
+            return 0
+        if self.max_streams is None:
+            return math.inf
+        return self.max_streams - self.streams
+
+    def __repr__(self) -> str:
+        return (
+            f"APIKey({self.key[:6]}..., in_flight={self.in_flight}, streams={self.streams}, "
+            f"requests={self.requests}, throttled={self.throttled})"
+        )
+
+
+class APIKeyPool:
+    """
+    Spreads requests over several API keys.
+
+    A request goes to the key with the most remaining rate-limit capacity among the keys
+    that are not cooling down after a 429 response; ties go to the key with fewer
+    requests in flight. Long-lived streams are pinned to the key with the most free
+    stream slots among the keys the server has not recently refused a stream.
+    """
+
+    def __init__(
+            self,
+            keys: Iterable[Union[str, APIKey]],
+            rps: Optional[float] = None,
+            burst: Optional[int] = None,
+            max_streams: Optional[int] = None,
+            cooldown: float = 1.0,
+            max_cooldown: float = 60.0,
+            stream_cooldown: float = 60.0,
+    ) -> None:
+        """
+        Initialize the APIKeyPool.
+
+        :param keys: API keys, as strings or :class:`APIKey` objects with their own limits.
+        :param rps: Per-key rate limit applied to the keys given as strings.
+        :param burst: Per-key burst applied to the keys given as strings.
+        :param max_streams: Per-key streaming connection limit applied to the keys given as strings.
+        :param cooldown: Seconds a key is skipped after a 429 without ``Retry-After``,
+         doubled on each consecutive 429 of the key.
+        :param max_cooldown: Upper bound of the cooldown in seconds.
+        :param stream_cooldown: Seconds a key gets no new streams after the server refused one.
+        """
+        self.keys: List[APIKey] = [
+            key if isinstance(key, APIKey) else APIKey(key, rps, burst, max_streams)
+            for key in keys
+        ]
+        if not self.keys:
+            raise ValueError("At least one API key is required")
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.stream_cooldown = stream_cooldown
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def has_ready_key(self) -> bool:
+        """Whether some key is not cooling down."""
+        now = time.monotonic()
+        return any(key.cooldown_until <= now for key in self.keys)
+
+    def select(self) -> APIKey:
+        """
+        Choose the key for the next request without taking its capacity.
+
+        :return: The key with the most remaining capacity, or the key whose
+         cooldown ends first if all keys are cooling down.
+        """
+        now = time.monotonic()
+        ready = [key for key in self.keys if key.cooldown_until <= now]
+        if not ready:
+            return min(self.keys, key=lambda key: key.cooldown_until)
+        return max(ready, key=lambda key: (key.capacity, -key.in_flight))
+
+    async def acquire(self) -> APIKey:
+        """
+        Take a key for one request, waiting for its cooldown and rate limit.
+        Call :meth:`release` when the request is done.
+
+        :return: The key to send the request with.
+        """
+        key = self.select()
+        delay = key.cooldown_until - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if key.rate_limiter is not None:
+            await key.rate_limiter.acquire()
+        key.in_flight += 1
+        key.requests += 1
+        return key
+
+    def release(self, key: APIKey) -> None:
+        """Mark a request taken with :meth:`acquire` as done."""
+        key.in_flight = max(key.in_flight - 1, 0)
+
+    def report_success(self, key: APIKey) -> None:
+        """Record a successful response; resets the key's cooldown backoff."""
+        key._strikes = 0
+
+    def report_throttled(self, key: APIKey, retry_after: Optional[float] = None) -> None:
+        """
+        Record a 429 response and put the key on cooldown.
+
+        :param key: The key that was throttled.
+        :param retry_after: The server-provided delay in seconds, if any.
+        """
+        key.throttled += 1
+        key._strikes += 1
+        if retry_after is None:
+            retry_after = self.cooldown * 2 ** (key._strikes - 1)
+        key.cooldown_until = max(key.cooldown_until, time.monotonic() + min(retry_after, self.max_cooldown))
+
+    def acquire_stream(self) -> APIKey:
+        """
+        Take a stream slot for a long-lived connection. Call :meth:`release_stream` when it closes.
+
+        :return: The key with the most free stream slots.
+        :raises TONAPISSELimitReachedError: If no key has a free stream slot.
+        """
+        candidates = [key for key in self.keys if key.free_streams > 0]
+        if not candidates:
+            raise TONAPISSELimitReachedError("All API keys have reached their limit of streaming connections")
+        key = max(candidates, key=lambda key: (key.free_streams, -key.streams))
+        key.streams += 1
+        return key
+
+    def release_stream(self, key: APIKey) -> None:
+        """Free a stream slot taken with :meth:`acquire_stream`."""
+        key.streams = max(key.streams - 1, 0)
+
+    def report_stream_limit(self, key: APIKey) -> None:
+        """
+        Record that the server refused a stream of the key. The key gets no new streams
+        for ``stream_cooldown`` seconds; its configured limit is kept.
+        """
+        key.stream_cooldown_until = time.monotonic() + self.stream_cooldown
@@ -1,25 +1,56 @@
-from .accounts import AccountsMethod
-from .blockchain import BlockchainMethod
-from .dns import DnsMethod
-from .emulate import EmulateMethod
-from .events import EventsMethod
-from .extra_currency import ExtraCurrencyMethod
-from .gasless import GaslessMethod
-from .jettons import JettonsMethod
-from .liteserver import LiteserverMethod
-from .multisig import MultisigMethod
-from .nft import NftMethod
-from .purchases import PurchasesMethod
-from .rates import RatesMethod
-from .sse import SSEMethod
-from .staking import StakingMethod
-from .storage import StorageMethod
-from .tonconnect import TonconnectMethod
-from .traces import TracesMethod
-from .utilites import UtilitiesMethod
-from .wallet import WalletMethod
-from .webhooks import WebhooksMethod
-from .websocket import WebSocketMethod
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .accounts import AccountsMethod
+    from .blockchain import BlockchainMethod
+    from .dns import DnsMethod
+    from .emulate import EmulateMethod
+    from .events import EventsMethod
+    from .extra_currency import ExtraCurrencyMethod
+    from .gasless import GaslessMethod
+    from .jettons import JettonsMethod
+    from .liteserver import LiteserverMethod
+    from .multisig import MultisigMethod
+    from .nft import NftMethod
+    from .purchases import PurchasesMethod
+    from .rates import RatesMethod
+    from .sse import SSEMethod
+    from .staking import StakingMethod
+    from .storage import StorageMethod
+    from .tonconnect import TonconnectMethod
+    from .traces import TracesMethod
+    from .utilites import UtilitiesMethod
+    from .wallet import WalletMethod
+    from .webhooks import WebhooksMethod
+    from .websocket import WebSocketMethod
+
+# Namespaces are imported on first access, so importing the package does not load
+# every method module and the schema modules they depend on.
+_MODULES = {
+    "AccountsMethod": "accounts",
+    "BlockchainMethod": "blockchain",
+    "DnsMethod": "dns",
+    "EmulateMethod": "emulate",
+    "EventsMethod": "events",
+    "ExtraCurrencyMethod": "extra_currency",
+    "GaslessMethod": "gasless",
+    "JettonsMethod": "jettons",
+    "LiteserverMethod": "liteserver",
+    "MultisigMethod": "multisig",
+    "NftMethod": "nft",
+    "PurchasesMethod": "purchases",
+    "RatesMethod": "rates",
+    "SSEMethod": "sse",
+    "StakingMethod": "staking",
+    "StorageMethod": "storage",
+    "TonconnectMethod": "tonconnect",
+    "TracesMethod": "traces",
+    "UtilitiesMethod": "utilites",
+    "WalletMethod": "wallet",
+    "WebhooksMethod": "webhooks",
+    "WebSocketMethod": "websocket",
+}
 
 __all__ = [
     "AccountsMethod",
@@ -33,6 +64,7 @@ __all__ = [
     "LiteserverMethod",
     "EmulateMethod",
     "NftMethod",
+    "PurchasesMethod",
     "RatesMethod",
     "SSEMethod",
     "StakingMethod",
@@ -44,3 +76,16 @@ __all__ = [
     "WebhooksMethod",
     "WebSocketMethod",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
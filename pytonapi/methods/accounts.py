@@ -1,6 +1,6 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncGenerator, Dict, List, Optional
 
-from pytonapi.base import AsyncTonapiClientBase
+from pytonapi.base import AsyncTonapiClientBase, BULK_CHUNK_SIZE
 from pytonapi.schema.accounts import (
     Account,
     Accounts,
@@ -12,26 +12,33 @@ from pytonapi.schema.accounts import (
 )
 from pytonapi.schema.domains import DomainNames
 from pytonapi.schema.events import AccountEvents, AccountEvent
-from pytonapi.schema.jettons import JettonBalance, JettonsBalances, JettonOperations
+from pytonapi.schema.jettons import JettonBalance, JettonsBalances, JettonOperation, JettonOperations
 from pytonapi.schema.multisig import Multisigs
-from pytonapi.schema.nft import NftItems, NftOperations
+from pytonapi.schema.nft import NftItem, NftItems, NftOperation, NftOperations
 from pytonapi.schema.traces import TraceIds
+from pytonapi.utils import normalize_address
 
 
 class AccountsMethod(AsyncTonapiClientBase):
 
-    async def get_bulk_info(self, account_ids: List[str]) -> Accounts:
+    async def get_bulk_info(
+            self,
+            account_ids: List[str],
+            chunk_size: int = BULK_CHUNK_SIZE,
+            max_concurrency: int = 4,
+    ) -> Accounts:
         """
         Get human-friendly information about multiple accounts without low-level details.
+        Large lists are split into chunks that are requested concurrently.
 
         :param account_ids: List of account IDs
+        :param chunk_size: Maximum number of account IDs per request. Default value: 100
+        :param max_concurrency: Maximum number of chunk requests in flight. Default value: 4
         :return: :class:`Accounts`
+        :raises TONAPIBulkRequestError: If some chunks failed; holds the accounts of the others.
         """
         method = f"v2/accounts/_bulk"
-        params = {"account_ids": account_ids}
-        response = await self._post(method=method, body=params)
-
-        return Accounts(**response)
+        return await self._post_bulk(method, account_ids, Accounts, "accounts", chunk_size, max_concurrency)
 
     async def get_info(self, account_id: str) -> Account:
         """
@@ -43,7 +50,28 @@ class AccountsMethod(AsyncTonapiClientBase):
         method = f"v2/accounts/{account_id}"
         response = await self._get(method=method)
 
-        return Account(**response)
+        return self._parse(Account, response)
+
+    async def load_info(self, account_id: str) -> Account:
+        """
+        Get account information like :meth:`get_info`, but batch concurrent calls
+        into :meth:`get_bulk_info` requests.
+
+        :param account_id: Account ID
+        :return: :class:`Account`
+        """
+        try:
+            key = normalize_address(account_id)
+        except ValueError:
+            return await self.get_info(account_id)
+
+        loader = self._get_loader("accounts.info", self._load_bulk_info)
+        return self._parse(Account, await loader.load(key))
+
+    async def _load_bulk_info(self, account_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        with self.use_response_mode("raw"):
+            response = await self.get_bulk_info(account_ids)
+        return {normalize_address(account["address"]): account for account in response["accounts"]}
 
     async def get_domains(self, account_id: str) -> DomainNames:
         """
@@ -55,7 +83,7 @@ class AccountsMethod(AsyncTonapiClientBase):
         method = f"v2/accounts/{account_id}/dns/backresolve"
         response = await self._get(method=method)
 
-        return DomainNames(**response)
+        return self._parse(DomainNames, response)
 
     async def get_jettons_balances(
             self,
@@ -77,7 +105,7 @@ class AccountsMethod(AsyncTonapiClientBase):
             params["currencies"] = ",".join(currencies)
         response = await self._get(method=method, params=params)
 
-        return JettonsBalances(**response)
+        return self._parse(JettonsBalances, response)
 
     async def get_jetton_balance(
             self,
@@ -101,7 +129,7 @@ class AccountsMethod(AsyncTonapiClientBase):
             params["currencies"] = ",".join(currencies)
         response = await self._get(method=method, params=params)
 
-        return JettonBalance(**response)
+        return self._parse(JettonBalance, response)
 
     async def get_jettons_history(
             self,
@@ -123,7 +151,36 @@ class AccountsMethod(AsyncTonapiClientBase):
             params["before_lt"] = before_lt
         response = await self._get(method=method, params=params)
 
-        return JettonOperations(**response)
+        return self._parse(JettonOperations, response)
+
+    async def iter_jettons_history(
+            self,
+            account_id: str,
+            limit: int = 100,
+            before_lt: Optional[int] = None,
+            until_lt: Optional[int] = None,
+            since: Optional[int] = None,
+            max_items: Optional[int] = None,
+    ) -> AsyncGenerator[JettonOperation, None]:
+        """
+        Iterate over the transfer jettons history for account, newest first.
+        The next page is fetched while the current one is being processed.
+
+        :param account_id: account ID
+        :param limit: Page size. Default value: 100
+        :param before_lt: omit this parameter to start from the last operation
+        :param until_lt: Stop at the first operation with an lt lower or equal to this one
+        :param since: Stop at the first operation older than this unix time
+        :param max_items: Stop after this number of operations
+        :return: An asynchronous generator of :class:`JettonOperation`
+        """
+        method = f"v2/accounts/{account_id}/jettons/history"
+        params = {"limit": limit}
+        async for operation in self._paginate(
+                method, "operations", JettonOperation, params,
+                before_lt=before_lt, until_lt=until_lt, since=since, max_items=max_items,
+        ):
+            yield operation
 
     async def get_nfts(
             self,
@@ -154,7 +211,38 @@ class AccountsMethod(AsyncTonapiClientBase):
             params["collection"] = collection
         response = await self._get(method=method, params=params)
 
-        return NftItems(**response)
+        return self._parse(NftItems, response)
+
+    def stream_nfts(
+            self,
+            account_id: str,
+            limit: int = 1000,
+            offset: int = 0,
+            collection: Optional[str] = None,
+            indirect_ownership: bool = False,
+    ) -> AsyncGenerator[NftItem, None]:
+        """
+        Get NFT items by owner address like :meth:`get_nfts`, but parse the response
+        incrementally and yield the items as they arrive.
+        Close the generator with ``aclose()`` if you stop early.
+
+        :param account_id: account ID
+        :param limit: Default value: 1000
+        :param collection: filter NFT by collection address
+        :param offset: Default value: 0
+        :param indirect_ownership: Selling nft items in ton implemented usually via transfer items
+         to special selling account. This option enables including items which owned not directly.
+        :return: An asynchronous generator of :class:`NftItem`
+        """
+        method = f"v2/accounts/{account_id}/nfts"
+        params = {
+            "limit": limit,
+            "offset": offset,
+            "indirect_ownership": "true" if indirect_ownership else "false"
+        }
+        if collection:
+            params["collection"] = collection
+        return self._stream(method, "nft_items", NftItem, params=params)
 
     async def get_events(
             self,
@@ -200,7 +288,100 @@ class AccountsMethod(AsyncTonapiClientBase):
         headers = {"Accept-Language": accept_language}
         response = await self._get(method=method, params=params, headers=headers)
 
-        return AccountEvents(**response)
+        return self._parse(AccountEvents, response)
+
+    async def iter_events(
+            self,
+            account_id: str,
+            limit: int = 100,
+            before_lt: Optional[int] = None,
+            accept_language: str = "en",
+            initiator: bool = False,
+            subject_only: bool = False,
+            start_date: Optional[int] = None,
+            end_date: Optional[int] = None,
+            until_lt: Optional[int] = None,
+            since: Optional[int] = None,
+            max_items: Optional[int] = None,
+    ) -> AsyncGenerator[AccountEvent, None]:
+        """
+        Iterate over events for an account, newest first, like :meth:`get_events`.
+        The next page is fetched while the current one is being processed.
+
+        :param account_id: account ID
+        :param limit: Page size. Default value: 100
+        :param before_lt: omit this parameter to start from the last event
+        :param accept_language: Default value: en
+        :param initiator: Show only events that are initiated by this account. Default value : false
+        :param subject_only: filter actions where requested account is not real subject
+          (for example sender or receiver jettons). Default value: False
+        :param start_date: Default value: None
+        :param end_date: Default value: None
+        :param until_lt: Stop at the first event with an lt lower or equal to this one
+        :param since: Stop at the first event older than this unix time
+        :param max_items: Stop after this number of events
+        :return: An asynchronous generator of :class:`AccountEvent`
+        """
+        method = f"v2/accounts/{account_id}/events"
+        params = {
+            "limit": limit,
+            "initiator": initiator,
+            "subject_only": subject_only
+        }
+        if start_date:
+            params["start_date"] = start_date
+        if end_date:
+            params["end_date"] = end_date
+        headers = {"Accept-Language": accept_language}
+        async for event in self._paginate(
+                method, "events", AccountEvent, params, headers,
+                before_lt=before_lt, until_lt=until_lt, since=since, max_items=max_items, time_field="timestamp",
+        ):
+            yield event
+
+    async def scan_events(
+            self,
+            account_id: str,
+            start_date: int,
+            end_date: int,
+            limit: int = 100,
+            accept_language: str = "en",
+            initiator: bool = False,
+            subject_only: bool = False,
+            min_window: int = 60,
+            max_concurrency: int = 4,
+            descending: bool = True,
+    ) -> List[AccountEvent]:
+        """
+        Get all events for an account between two dates. The range is split into
+        time windows that are fetched in parallel; busy windows are split further.
+
+        :param account_id: account ID
+        :param start_date: Start of the range, unix time
+        :param end_date: End of the range, unix time
+        :param limit: Page size. Default value: 100
+        :param accept_language: Default value: en
+        :param initiator: Show only events that are initiated by this account. Default value : false
+        :param subject_only: filter actions where requested account is not real subject
+          (for example sender or receiver jettons). Default value: False
+        :param min_window: Time windows shorter than this number of seconds are not split further.
+         Default value: 60
+        :param max_concurrency: Maximum number of pages requested at the same time. Default value: 4
+        :param descending: Newest events first if True, oldest first otherwise. Default value: True
+        :return: A list of :class:`AccountEvent` sorted by lt
+        """
+        method = f"v2/accounts/{account_id}/events"
+        params = {
+            "limit": limit,
+            "initiator": initiator,
+            "subject_only": subject_only
+        }
+        headers = {"Accept-Language": accept_language}
+        return await self._scan(
+            method, "events", AccountEvent, params, start_date, end_date, headers,
+            id_fields=("event_id",), time_field="timestamp",
+            min_window=min_window, max_concurrency=max_concurrency, descending=descending,
+        )
 
     async def get_event(
             self,
@@ -223,7 +404,7 @@ class AccountsMethod(AsyncTonapiClientBase):
         headers = {"Accept-Language": accept_language}
         response = await self._get(method=method, params=params, headers=headers)
 
-        return AccountEvent(**response)
+        return self._parse(AccountEvent, response)
 
     async def get_traces(self, account_id: str, limit: int = 100, before_lt: Optional[int] = None) -> TraceIds:
         """
@@ -240,7 +421,7 @@ class AccountsMethod(AsyncTonapiClientBase):
             params["before_lt"] = before_lt
         response = await self._get(method=method, params=params)
 
-        return TraceIds(**response)
+        return self._parse(TraceIds, response)
 
     async def get_nft_history(
             self,
@@ -265,7 +446,39 @@ class AccountsMethod(AsyncTonapiClientBase):
         headers = {"Accept-Language": accept_language}
         response = await self._get(method=method, params=params, headers=headers)
 
-        return NftOperations(**response)
+        return self._parse(NftOperations, response)
+
+    async def iter_nft_history(
+            self,
+            account_id: str,
+            limit: int = 100,
+            before_lt: Optional[int] = None,
+            accept_language: str = "en",
+            until_lt: Optional[int] = None,
+            since: Optional[int] = None,
+            max_items: Optional[int] = None,
+    ) -> AsyncGenerator[NftOperation, None]:
+        """
+        Iterate over the transfer nft history, newest first.
+        The next page is fetched while the current one is being processed.
+
+        :param account_id: account ID
+        :param limit: Page size. Default value: 100
+        :param before_lt: omit this parameter to start from the last operation
+        :param accept_language: Default value: en
+        :param until_lt: Stop at the first operation with an lt lower or equal to this one
+        :param since: Stop at the first operation older than this unix time
+        :param max_items: Stop after this number of operations
+        :return: An asynchronous generator of :class:`NftOperation`
+        """
+        method = f"v2/accounts/{account_id}/nfts/history"
+        params = {"limit": limit}
+        headers = {"Accept-Language": accept_language}
+        async for operation in self._paginate(
+                method, "operations", NftOperation, params, headers,
+                before_lt=before_lt, until_lt=until_lt, since=since, max_items=max_items,
+        ):
+            yield operation
 
     async def get_subscriptions(self, account_id: str) -> Subscriptions:
         """
@@ -277,7 +490,7 @@ class AccountsMethod(AsyncTonapiClientBase):
         method = f"v2/accounts/{account_id}/subscriptions"
         response = await self._get(method=method)
 
-        return Subscriptions(**response)
+        return self._parse(Subscriptions, response)
 
     async def reindex(self, account_id: str) -> None:
         """
@@ -300,7 +513,7 @@ class AccountsMethod(AsyncTonapiClientBase):
         params = {"name": name}
         response = await self._get(method=method, params=params)
 
-        return FoundAccounts(**response)
+        return self._parse(FoundAccounts, response)
 
     async def get_expiring_dns(self, account_id: str, period: Optional[int] = None) -> DnsExpiring:
         """
@@ -314,7 +527,7 @@ class AccountsMethod(AsyncTonapiClientBase):
         params = {"period": period} if period else {}
         response = await self._get(method=method, params=params)
 
-        return DnsExpiring(**response)
+        return self._parse(DnsExpiring, response)
 
     async def get_public_key(self, account_id: str) -> PublicKey:
         """
@@ -326,7 +539,7 @@ class AccountsMethod(AsyncTonapiClientBase):
         method = f"v2/accounts/{account_id}/publickey"
         response = await self._get(method=method)
 
-        return PublicKey(**response)
+        return self._parse(PublicKey, response)
 
     async def get_account_multisigs(self, account_id: str) -> Multisigs:
         """
@@ -338,7 +551,7 @@ class AccountsMethod(AsyncTonapiClientBase):
         method = f"v2/accounts/{account_id}/multisigs"
         response = await self._get(method=method)
 
-        return Multisigs(**response)
+        return self._parse(Multisigs, response)
 
     async def get_balance_change(
             self,
@@ -358,7 +571,7 @@ class AccountsMethod(AsyncTonapiClientBase):
         params = {"start_date": start_date, "end_date": end_date}
         response = await self._get(method=method, params=params)
 
-        return BalanceChange(**response)
+        return self._parse(BalanceChange, response)
 
     async def get_extra_currency_history(
             self,
@@ -393,7 +606,44 @@ class AccountsMethod(AsyncTonapiClientBase):
         headers = {"Accept-Language": accept_language}
         response = await self._get(method=method, params=params, headers=headers)
 
-        return AccountEvents(**response)
+        return self._parse(AccountEvents, response)
+
+    async def scan_extra_currency_history(
+            self,
+            account_id: str,
+            currency_id: int,
+            start_date: int,
+            end_date: int,
+            limit: int = 100,
+            accept_language: str = "en",
+            min_window: int = 60,
+            max_concurrency: int = 4,
+            descending: bool = True,
+    ) -> List[AccountEvent]:
+        """
+        Get extra currency history between two dates. The range is split into
+        time windows that are fetched in parallel; busy windows are split further.
+
+        :param account_id: account ID
+        :param currency_id: currency ID
+        :param start_date: Start of the range, unix time
+        :param end_date: End of the range, unix time
+        :param limit: Page size. Default value: 100
+        :param accept_language: Default value: en
+        :param min_window: Time windows shorter than this number of seconds are not split further.
+         Default value: 60
+        :param max_concurrency: Maximum number of pages requested at the same time. Default value: 4
+        :param descending: Newest events first if True, oldest first otherwise. Default value: True
+        :return: A list of :class:`AccountEvent` sorted by lt
+        """
+        method = f"v2/accounts/{account_id}/extra-currency/{currency_id}/history"
+        params = {"limit": limit}
+        headers = {"Accept-Language": accept_language}
+        return await self._scan(
+            method, "events", AccountEvent, params, start_date, end_date, headers,
+            id_fields=("event_id",), time_field="timestamp",
+            min_window=min_window, max_concurrency=max_concurrency, descending=descending,
+        )
 
     async def get_jettons_history_by_jetton(
             self,
@@ -428,7 +678,44 @@ class AccountsMethod(AsyncTonapiClientBase):
         headers = {"Accept-Language": accept_language}
         response = await self._get(method=method, params=params, headers=headers)
 
-        return JettonOperations(**response)
+        return self._parse(JettonOperations, response)
+
+    async def scan_jettons_history_by_jetton(
+            self,
+            account_id: str,
+            jetton_id: str,
+            start_date: int,
+            end_date: int,
+            limit: int = 100,
+            accept_language: str = "en",
+            min_window: int = 60,
+            max_concurrency: int = 4,
+            descending: bool = True,
+    ) -> List[JettonOperation]:
+        """
+        Get jettons history by jetton master address between two dates. The range is split
+        into time windows that are fetched in parallel; busy windows are split further.
+
+        :param account_id: account ID
+        :param jetton_id: jetton master address
+        :param start_date: Start of the range, unix time
+        :param end_date: End of the range, unix time
+        :param limit: Page size. Default value: 100
+        :param accept_language: Default value: en
+        :param min_window: Time windows shorter than this number of seconds are not split further.
+         Default value: 60
+        :param max_concurrency: Maximum number of pages requested at the same time. Default value: 4
+        :param descending: Newest operations first if True, oldest first otherwise. Default value: True
+        :return: A list of :class:`JettonOperation` sorted by lt
+        """
+        method = f"v2/jettons/{jetton_id}/accounts/{account_id}/history"
+        params = {"limit": limit}
+        headers = {"Accept-Language": accept_language}
+        return await self._scan(
+            method, "operations", JettonOperation, params, start_date, end_date, headers,
+            id_fields=("lt", "transaction_hash", "operation", "query_id"),
+            min_window=min_window, max_concurrency=max_concurrency, descending=descending,
+        )
 
     async def emulate_event(
             self,
@@ -451,6 +738,6 @@ class AccountsMethod(AsyncTonapiClientBase):
         method = f"v2/accounts/{account_id}/events/emulate"
         params = {"ignore_signature_check": ignore_signature_check} if ignore_signature_check is not None else {}
         headers = {"Accept-Language": accept_language}
-        response = await self._post(method=method, params=params, body=body, headers=headers)
+        response = await self._post(method=method, params=params, body=body, headers=headers, idempotent=True)
 
-        return AccountEvent(**response)
+        return self._parse(AccountEvent, response)
@@ -1,6 +1,7 @@
-from typing import Literal, Optional, Dict, Any
+from typing import Literal, Optional, Dict, Any, AsyncGenerator
 
 from pytonapi.base import AsyncTonapiClientBase
+from pytonapi.scheduler import Priority
 from pytonapi.schema.blockchain import (
     Transactions,
     Transaction,
@@ -31,7 +32,7 @@ class BlockchainMethod(AsyncTonapiClientBase):
         params = {"from": from_, "to": to_}
         response = await self._get(method=method, params=params)
 
-        return ReducedBlocks(**response)
+        return self._parse(ReducedBlocks, response)
 
     async def get_block_data(self, block_id: str) -> BlockchainBlock:
         """
@@ -43,7 +44,7 @@ class BlockchainMethod(AsyncTonapiClientBase):
         method = f"v2/blockchain/blocks/{block_id}"
         response = await self._get(method=method)
 
-        return BlockchainBlock(**response)
+        return self._parse(BlockchainBlock, response)
 
     async def get_block_boc(self, block_id: str) -> str:
         """
@@ -67,7 +68,7 @@ class BlockchainMethod(AsyncTonapiClientBase):
         method = f"v2/blockchain/masterchain/{masterchain_seqno}/shards"
         response = await self._get(method=method)
 
-        return BlockchainBlockShards(**response)
+        return self._parse(BlockchainBlockShards, response)
 
     async def get_blocks(self, masterchain_seqno: int) -> BlockchainBlocks:
         """
@@ -82,7 +83,7 @@ class BlockchainMethod(AsyncTonapiClientBase):
         method = f"v2/blockchain/masterchain/{masterchain_seqno}/blocks"
         response = await self._get(method=method)
 
-        return BlockchainBlocks(**response)
+        return self._parse(BlockchainBlocks, response)
 
     async def get_transactions_shards(self, masterchain_seqno: int) -> Transactions:
         """
@@ -97,7 +98,19 @@ class BlockchainMethod(AsyncTonapiClientBase):
         method = f"v2/blockchain/masterchain/{masterchain_seqno}/transactions"
         response = await self._get(method=method)
 
-        return Transactions(**response)
+        return self._parse(Transactions, response)
+
+    def stream_transactions_shards(self, masterchain_seqno: int) -> AsyncGenerator[Transaction, None]:
+        """
+        Get all transactions in all shards and workchains like :meth:`get_transactions_shards`,
+        but parse the response incrementally and yield the transactions as they arrive.
+        Close the generator with ``aclose()`` if you stop early.
+
+        :param masterchain_seqno: masterchain block seqno
+        :return: An asynchronous generator of :class:`Transaction`
+        """
+        method = f"v2/blockchain/masterchain/{masterchain_seqno}/transactions"
+        return self._stream(method, "transactions", Transaction)
 
     async def get_blockchain_config(self, masterchain_seqno: int) -> BlockchainConfig:
         """
@@ -109,7 +122,7 @@ class BlockchainMethod(AsyncTonapiClientBase):
         method = f"v2/blockchain/masterchain/{masterchain_seqno}/config"
         response = await self._get(method=method)
 
-        return BlockchainConfig(**response)
+        return self._parse(BlockchainConfig, response)
 
     async def get_raw_blockchain_config(self, masterchain_seqno: int) -> RawBlockchainConfig:
         """
@@ -121,7 +134,7 @@ class BlockchainMethod(AsyncTonapiClientBase):
         method = f"v2/blockchain/masterchain/{masterchain_seqno}/config/raw"
         response = await self._get(method=method)
 
-        return RawBlockchainConfig(**response)
+        return self._parse(RawBlockchainConfig, response)
 
     async def get_transaction_from_block(self, block_id: str) -> Transactions:
         """
@@ -133,7 +146,7 @@ class BlockchainMethod(AsyncTonapiClientBase):
         method = f"v2/blockchain/blocks/{block_id}/transactions"
         response = await self._get(method=method)
 
-        return Transactions(**response)
+        return self._parse(Transactions, response)
 
     async def get_transaction_data(self, transaction_id: str) -> Transaction:
         """
@@ -146,7 +159,7 @@ class BlockchainMethod(AsyncTonapiClientBase):
         method = f"v2/blockchain/transactions/{transaction_id}"
         response = await self._get(method=method)
 
-        return Transaction(**response)
+        return self._parse(Transaction, response)
 
     async def get_transaction_by_message(self, msg_id: str) -> Transaction:
         """
@@ -158,7 +171,7 @@ class BlockchainMethod(AsyncTonapiClientBase):
         method = f"v2/blockchain/messages/{msg_id}/transaction"
         response = await self._get(method=method)
 
-        return Transaction(**response)
+        return self._parse(Transaction, response)
 
     async def get_validators(self) -> Validators:
         """
@@ -169,7 +182,7 @@ class BlockchainMethod(AsyncTonapiClientBase):
         method = f"v2/blockchain/validators"
         response = await self._get(method=method)
 
-        return Validators(**response)
+        return self._parse(Validators, response)
 
     async def get_last_masterchain_block(self) -> BlockchainBlock:
         """
@@ -180,7 +193,7 @@ class BlockchainMethod(AsyncTonapiClientBase):
         method = f"v2/blockchain/masterchain-head"
         response = await self._get(method=method)
 
-        return BlockchainBlock(**response)
+        return self._parse(BlockchainBlock, response)
 
     async def get_account_info(self, account_id: str) -> BlockchainRawAccount:
         """
@@ -192,7 +205,7 @@ class BlockchainMethod(AsyncTonapiClientBase):
         method = f"v2/blockchain/accounts/{account_id}"
         response = await self._get(method=method)
 
-        return BlockchainRawAccount(**response)
+        return self._parse(BlockchainRawAccount, response)
 
     async def get_account_transactions(
             self,
@@ -220,7 +233,36 @@ class BlockchainMethod(AsyncTonapiClientBase):
             params["after_lt"] = after_lt
         response = await self._get(method=method, params=params)
 
-        return Transactions(**response)
+        return self._parse(Transactions, response)
+
+    async def iter_account_transactions(
+            self,
+            account_id: str,
+            limit: int = 100,
+            before_lt: Optional[int] = None,
+            until_lt: Optional[int] = None,
+            since: Optional[int] = None,
+            max_items: Optional[int] = None,
+    ) -> AsyncGenerator[Transaction, None]:
+        """
+        Iterate over account transactions, newest first.
+        The next page is fetched while the current one is being processed.
+
+        :param account_id: account ID
+        :param limit: Page size. Default value : 100
+        :param before_lt: omit this parameter to start from the last transaction
+        :param until_lt: Stop at the first transaction with an lt lower or equal to this one
+        :param since: Stop at the first transaction older than this unix time
+        :param max_items: Stop after this number of transactions
+        :return: An asynchronous generator of :class:`Transaction`
+        """
+        method = f"v2/blockchain/accounts/{account_id}/transactions"
+        params = {"limit": limit, "sort_order": "desc"}
+        async for transaction in self._paginate(
+                method, "transactions", Transaction, params,
+                before_lt=before_lt, until_lt=until_lt, since=since, max_items=max_items,
+        ):
+            yield transaction
 
     async def execute_get_method(
             self,
@@ -242,7 +284,7 @@ class BlockchainMethod(AsyncTonapiClientBase):
             method += f"?{query_params}"
         response = await self._get(method=method)
 
-        return MethodExecutionResult(**response)
+        return self._parse(MethodExecutionResult, response)
 
     async def send_message(self, body: Dict[str, Any]) -> None:
         """
@@ -252,7 +294,7 @@ class BlockchainMethod(AsyncTonapiClientBase):
         :return: bool
         """
         method = "v2/blockchain/message"
-        await self._post(method=method, body=body)
+        await self._post(method=method, body=body, priority=Priority.interactive)
 
     async def get_config(self) -> BlockchainConfig:
         """
@@ -263,7 +305,7 @@ class BlockchainMethod(AsyncTonapiClientBase):
         method = "v2/blockchain/config"
         response = await self._get(method=method)
 
-        return BlockchainConfig(**response)
+        return self._parse(BlockchainConfig, response)
 
     async def get_raw_config(self) -> RawBlockchainConfig:
         """
@@ -274,7 +316,7 @@ class BlockchainMethod(AsyncTonapiClientBase):
         method = "v2/blockchain/config/raw"
         response = await self._get(method=method)
 
-        return RawBlockchainConfig(**response)
+        return self._parse(RawBlockchainConfig, response)
 
     async def inspect_account(self, account_id: str) -> BlockchainAccountInspect:
         """
@@ -286,4 +328,4 @@ class BlockchainMethod(AsyncTonapiClientBase):
         method = f"v2/blockchain/accounts/{account_id}/inspect"
         response = await self._get(method=method)
 
-        return BlockchainAccountInspect(**response)
+        return self._parse(BlockchainAccountInspect, response)
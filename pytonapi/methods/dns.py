@@ -15,7 +15,7 @@ class DnsMethod(AsyncTonapiClientBase):
         method = f"v2/dns/{domain_name}"
         response = await self._get(method=method)
 
-        return DomainInfo(**response)
+        return self._parse(DomainInfo, response)
 
     async def resolve(self, domain_name: str) -> DNSRecord:
         """
@@ -27,7 +27,7 @@ class DnsMethod(AsyncTonapiClientBase):
         method = f"v2/dns/{domain_name}/resolve"
         response = await self._get(method=method)
 
-        return DNSRecord(**response)
+        return self._parse(DNSRecord, response)
 
     async def bids(self, domain_name: str) -> DomainBids:
         """
@@ -39,7 +39,7 @@ class DnsMethod(AsyncTonapiClientBase):
         method = f"v2/dns/{domain_name}/bids"
         response = await self._get(method=method)
 
-        return DomainBids(**response)
+        return self._parse(DomainBids, response)
 
     async def get_auctions(self, tld: str = "ton") -> Auctions:
         """
@@ -52,4 +52,4 @@ class DnsMethod(AsyncTonapiClientBase):
         params = {"tld": tld}
         response = await self._get(method=method, params=params)
 
-        return Auctions(**response)
+        return self._parse(Auctions, response)
@@ -1,6 +1,7 @@
 from typing import Dict, Any, Optional
 
 from pytonapi.base import AsyncTonapiClientBase
+from pytonapi.scheduler import Priority
 from pytonapi.schema.blockchain import DecodedMessage
 from pytonapi.schema.events import Event, AccountEvent, MessageConsequences
 from pytonapi.schema.traces import Trace
@@ -23,8 +24,9 @@ class EmulateMethod(AsyncTonapiClientBase):
         response = await self._post(
             method=method,
             body=body,
+            idempotent=True,
         )
-        return DecodedMessage(**response)
+        return self._parse(DecodedMessage, response)
 
     async def emulate_events(
             self,
@@ -52,8 +54,9 @@ class EmulateMethod(AsyncTonapiClientBase):
             params=params,
             body=body,
             headers=headers,
+            idempotent=True,
         )
-        return Event(**response)
+        return self._parse(Event, response)
 
     async def emulate_traces(
             self,
@@ -77,8 +80,9 @@ class EmulateMethod(AsyncTonapiClientBase):
             method=method,
             params=params,
             body=body,
+            idempotent=True,
         )
-        return Trace(**response)
+        return self._parse(Trace, response)
 
     async def emulate_wallet(
             self,
@@ -108,8 +112,10 @@ class EmulateMethod(AsyncTonapiClientBase):
             method=method,
             body=body,
             headers=headers,
+            idempotent=True,
+            priority=Priority.interactive,
         )
-        return MessageConsequences(**response)
+        return self._parse(MessageConsequences, response)
 
     async def emulate_account_event(
             self,
@@ -135,5 +141,6 @@ class EmulateMethod(AsyncTonapiClientBase):
             method=method,
             body=body,
             headers=headers,
+            idempotent=True,
         )
-        return AccountEvent(**response)
+        return self._parse(AccountEvent, response)
@@ -29,7 +29,7 @@ class EventsMethod(AsyncTonapiClientBase):
         headers = {"Accept-Language": accept_language}
         response = await self._get(method=method, headers=headers)
 
-        return Event(**response)
+        return self._parse(Event, response)
 
     async def emulate(
             self, body: Dict[str, Any],
@@ -51,6 +51,6 @@ class EventsMethod(AsyncTonapiClientBase):
         method = "v2/events/emulate"
         params = {"ignore_signature_check": ignore_signature_check} if ignore_signature_check else {}
         headers = {"Accept-Language": accept_language}
-        response = await self._post(method=method, params=params, body=body, headers=headers)
+        response = await self._post(method=method, params=params, body=body, headers=headers, idempotent=True)
 
-        return Event(**response)
+        return self._parse(Event, response)
@@ -14,4 +14,4 @@ class ExtraCurrencyMethod(AsyncTonapiClientBase):
         method = f"v2/extra-currency/{currency_id}"
         response = await self._get(method=method)
 
-        return EcPreview(**response)
+        return self._parse(EcPreview, response)
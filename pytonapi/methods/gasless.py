@@ -15,7 +15,7 @@ class GaslessMethod(AsyncTonapiClientBase):
         method = "v2/gasless/config"
         response = await self._get(method=method)
 
-        return GaslessConfig(**response)
+        return self._parse(GaslessConfig, response)
 
     async def estimate_gas_price(self, master_id: str, body: Dict[str, Any]) -> SignRawParams:
         """
@@ -35,9 +35,9 @@ class GaslessMethod(AsyncTonapiClientBase):
         :return: :class:`int`
         """
         method = f"v2/gasless/estimate/{master_id}"
-        response = await self._post(method=method, body=body)
+        response = await self._post(method=method, body=body, idempotent=True)
 
-        return SignRawParams(**response)
+        return self._parse(SignRawParams, response)
 
     async def send(self, body: Dict[str, Any]) -> None:
         """
@@ -1,6 +1,9 @@
-from pytonapi.base import AsyncTonapiClientBase
+from typing import Any, AsyncGenerator, Dict, List, Optional
+
+from pytonapi.base import AsyncTonapiClientBase, BULK_CHUNK_SIZE
 from pytonapi.schema.events import Event
-from pytonapi.schema.jettons import JettonInfo, JettonHolders, Jettons, JettonTransferPayload
+from pytonapi.schema.jettons import JettonInfo, JettonHolder, JettonHolders, Jettons, JettonTransferPayload
+from pytonapi.utils import normalize_address
 
 
 class JettonsMethod(AsyncTonapiClientBase):
@@ -15,7 +18,28 @@ class JettonsMethod(AsyncTonapiClientBase):
         method = f"v2/jettons/{account_id}"
         response = await self._get(method=method)
 
-        return JettonInfo(**response)
+        return self._parse(JettonInfo, response)
+
+    async def load_info(self, account_id: str) -> JettonInfo:
+        """
+        Get jetton metadata like :meth:`get_info`, but batch concurrent calls
+        into :meth:`get_bulk_jettons` requests.
+
+        :param account_id: Account ID
+        :return: JettonInfo
+        """
+        try:
+            key = normalize_address(account_id)
+        except ValueError:
+            return await self.get_info(account_id)
+
+        loader = self._get_loader("jettons.info", self._load_bulk_jettons)
+        return self._parse(JettonInfo, await loader.load(key))
+
+    async def _load_bulk_jettons(self, account_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        with self.use_response_mode("raw"):
+            response = await self.get_bulk_jettons(account_ids)
+        return {normalize_address(jetton["metadata"]["address"]): jetton for jetton in response["jettons"]}
 
     async def get_holders(self, account_id: str, limit: int = 1000, offset: int = 0) -> JettonHolders:
         """
@@ -30,20 +54,72 @@ class JettonsMethod(AsyncTonapiClientBase):
         params = {"limit": limit, "offset": offset}
         response = await self._get(method=method, params=params)
 
-        return JettonHolders(**response)
+        return self._parse(JettonHolders, response)
+
+    def stream_holders(
+            self,
+            account_id: str,
+            limit: int = 1000,
+            offset: int = 0,
+    ) -> AsyncGenerator[JettonHolder, None]:
+        """
+        Get jetton"s holders like :meth:`get_holders`, but parse the response
+        incrementally and yield the holders as they arrive.
+        Close the generator with ``aclose()`` if you stop early.
+
+        :param account_id: Account ID
+        :param limit: Default value - 1000
+        :param offset: Default value - 0
+        :return: An asynchronous generator of JettonHolder
+        """
+        method = f"v2/jettons/{account_id}/holders"
+        params = {"limit": limit, "offset": offset}
+        return self._stream(method, "addresses", JettonHolder, params=params)
+
+    async def iter_holders(
+            self,
+            account_id: str,
+            page_size: int = 1000,
+            offset: int = 0,
+            max_items: Optional[int] = None,
+            max_concurrency: int = 4,
+    ) -> AsyncGenerator[JettonHolder, None]:
+        """
+        Iterate over all jetton"s holders, fetching pages concurrently.
+        The holders are yielded in the order of the API.
 
-    async def get_bulk_jettons(self, account_ids: list[str]) -> Jettons:
+        :param account_id: Account ID
+        :param page_size: Holders per request. Default value - 1000
+        :param offset: Offset of the first holder. Default value - 0
+        :param max_items: Stop after this number of holders
+        :param max_concurrency: Maximum number of pages requested at the same time. Default value: 4
+        :return: An asynchronous generator of JettonHolder
+        """
+        method = f"v2/jettons/{account_id}/holders"
+        async for holder in self._paginate_offset(
+                method, "addresses", JettonHolder,
+                page_size=page_size, offset=offset, max_items=max_items, max_concurrency=max_concurrency,
+        ):
+            yield holder
+
+    async def get_bulk_jettons(
+            self,
+            account_ids: List[str],
+            chunk_size: int = BULK_CHUNK_SIZE,
+            max_concurrency: int = 4,
+    ) -> Jettons:
         """
         Get a list of jetton masters by their addresses.
+        Large lists are split into chunks that are requested concurrently.
 
         :param account_ids: A list of account IDs
+        :param chunk_size: Maximum number of account IDs per request. Default value: 100
+        :param max_concurrency: Maximum number of chunk requests in flight. Default value: 4
         :return: :class:`Jettons`
+        :raises TONAPIBulkRequestError: If some chunks failed; holds the jettons of the others.
         """
         method = "v2/jettons/_bulk"
-        params = {"account_ids": account_ids}
-        response = await self._post(method=method, body=params)
-
-        return Jettons(**response)
+        return await self._post_bulk(method, account_ids, Jettons, "jettons", chunk_size, max_concurrency)
 
     async def get_all_jettons(self, limit: int = 100, offset: int = 0) -> Jettons:
         """
@@ -57,7 +133,30 @@ class JettonsMethod(AsyncTonapiClientBase):
         params = {"limit": limit, "offset": offset}
         response = await self._get(method=method, params=params)
 
-        return Jettons(**response)
+        return self._parse(Jettons, response)
+
+    async def iter_all_jettons(
+            self,
+            page_size: int = 100,
+            offset: int = 0,
+            max_items: Optional[int] = None,
+            max_concurrency: int = 4,
+    ) -> AsyncGenerator[JettonInfo, None]:
+        """
+        Iterate over all indexed jetton masters in the blockchain, fetching pages concurrently.
+
+        :param page_size: Jettons per request. Default value - 100
+        :param offset: Offset of the first jetton. Default value - 0
+        :param max_items: Stop after this number of jettons
+        :param max_concurrency: Maximum number of pages requested at the same time. Default value: 4
+        :return: An asynchronous generator of :class:`JettonInfo`
+        """
+        method = "v2/jettons"
+        async for jetton in self._paginate_offset(
+                method, "jettons", JettonInfo,
+                page_size=page_size, offset=offset, max_items=max_items, max_concurrency=max_concurrency,
+        ):
+            yield jetton
 
     async def get_jetton_transfer_event(self, event_id: str) -> Event:
         """
@@ -69,7 +168,7 @@ class JettonsMethod(AsyncTonapiClientBase):
         method = f"v2/events/{event_id}/jettons"
         response = await self._get(method=method)
 
-        return Event(**response)
+        return self._parse(Event, response)
 
     async def get_jetton_transfer_payload(self, jetton_id: str, account_id: str) -> JettonTransferPayload:
         """
@@ -82,4 +181,4 @@ class JettonsMethod(AsyncTonapiClientBase):
         method = f"v2/jettons/{jetton_id}/transfer/{account_id}/payload"
         response = await self._get(method=method)
 
-        return JettonTransferPayload(**response)
+        return self._parse(JettonTransferPayload, response)
@@ -30,7 +30,7 @@ class LiteserverMethod(AsyncTonapiClientBase):
         method = "v2/liteserver/get_masterchain_info"
         response = await self._get(method=method)
 
-        return RawMasterChainInfo(**response)
+        return self._parse(RawMasterChainInfo, response)
 
     async def get_masterchain_info_ext(self, mode: int) -> RawMasterChainInfoExt:
         """
@@ -42,7 +42,7 @@ class LiteserverMethod(AsyncTonapiClientBase):
         params = {"mode": mode}
         response = await self._get(method, params=params)
 
-        return RawMasterChainInfoExt(**response)
+        return self._parse(RawMasterChainInfoExt, response)
 
     async def get_time(self) -> Union[int, None]:
         """
@@ -65,7 +65,7 @@ class LiteserverMethod(AsyncTonapiClientBase):
         method = f"v2/liteserver/get_block/{block_id}"
         response = await self._get(method=method)
 
-        return RawGetBlock(**response)
+        return self._parse(RawGetBlock, response)
 
     async def get_raw_state(self, block_id: str) -> RawBlockState:
         """
@@ -77,7 +77,7 @@ class LiteserverMethod(AsyncTonapiClientBase):
         method = f"v2/liteserver/get_state/{block_id}"
         response = await self._get(method=method)
 
-        return RawBlockState(**response)
+        return self._parse(RawBlockState, response)
 
     async def get_raw_header(self, block_id: str, mode: int) -> RawBlockHeader:
         """
@@ -92,7 +92,7 @@ class LiteserverMethod(AsyncTonapiClientBase):
         params = {"mode": mode}
         response = await self._get(method=method, params=params)
 
-        return RawBlockHeader(**response)
+        return self._parse(RawBlockHeader, response)
 
     async def send_message(self, body: Dict[str, Any]) -> Union[int, None]:
         """
@@ -122,7 +122,7 @@ class LiteserverMethod(AsyncTonapiClientBase):
         params = {"target_block": target_block} if target_block else {}
         response = await self._get(method=method, params=params)
 
-        return RawAccountState(**response)
+        return self._parse(RawAccountState, response)
 
     async def get_shard_info(
             self,
@@ -144,7 +144,7 @@ class LiteserverMethod(AsyncTonapiClientBase):
         params = {"workchain": workchain, "shard": shard, "exact": exact}
         response = await self._get(method=method, params=params)
 
-        return RawShardInfo(**response)
+        return self._parse(RawShardInfo, response)
 
     async def get_all_raw_shards_info(self, block_id: str) -> RawShardsInfo:
         """
@@ -156,7 +156,7 @@ class LiteserverMethod(AsyncTonapiClientBase):
         method = f"v2/liteserver/get_all_shards_info/{block_id}"
         response = await self._get(method=method)
 
-        return RawShardsInfo(**response)
+        return self._parse(RawShardsInfo, response)
 
     async def get_raw_transactions(
             self,
@@ -178,7 +178,7 @@ class LiteserverMethod(AsyncTonapiClientBase):
         params = {"lt": lt, "hash": hash_, "count": count}
         response = await self._get(method=method, params=params)
 
-        return RawTransactions(**response)
+        return self._parse(RawTransactions, response)
 
     async def get_raw_list_block_transaction(
             self,
@@ -209,7 +209,7 @@ class LiteserverMethod(AsyncTonapiClientBase):
             params["lt"] = lt
         response = await self._get(method=method, params=params)
 
-        return RawListBlockTransactions(**response)
+        return self._parse(RawListBlockTransactions, response)
 
     async def get_block_proof(
             self,
@@ -234,7 +234,7 @@ class LiteserverMethod(AsyncTonapiClientBase):
             params["target_block"] = target_block
         response = await self._get(method=method, params=params)
 
-        return RawBlockProof(**response)
+        return self._parse(RawBlockProof, response)
 
     async def get_config_all(
             self,
@@ -252,7 +252,7 @@ class LiteserverMethod(AsyncTonapiClientBase):
         params = {"mode": mode}
         response = await self._get(method=method, params=params)
 
-        return RawConfig(**response)
+        return self._parse(RawConfig, response)
 
     async def get_shard_block_proof(self, block_id: str) -> RawShardProof:
         """
@@ -264,7 +264,7 @@ class LiteserverMethod(AsyncTonapiClientBase):
         method = f"v2/liteserver/get_shard_block_proof/{block_id}"
         response = await self._get(method=method)
 
-        return RawShardProof(**response)
+        return self._parse(RawShardProof, response)
 
     async def get_out_msg_queue_size(self) -> OutMsgQueueSize:
         """
@@ -275,4 +275,4 @@ class LiteserverMethod(AsyncTonapiClientBase):
         method = "v2/liteserver/get_out_msg_queue_sizes"
         response = await self._get(method=method)
 
-        return OutMsgQueueSize(**response)
+        return self._parse(OutMsgQueueSize, response)
@@ -14,7 +14,7 @@ class MultisigMethod(AsyncTonapiClientBase):
         method = f"v2/multisig/{account_id}"
         response = await self._get(method=method)
 
-        return Multisig(**response)
+        return self._parse(Multisig, response)
 
     async def get_order_info(self, account_id: str) -> MultisigOrder:
         """
@@ -26,4 +26,4 @@ class MultisigMethod(AsyncTonapiClientBase):
         method = f"v2/multisig/order/{account_id}"
         response = await self._get(method=method)
 
-        return MultisigOrder(**response)
+        return self._parse(MultisigOrder, response)
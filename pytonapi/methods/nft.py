@@ -1,8 +1,9 @@
-from typing import List, Optional
+from typing import Any, AsyncGenerator, Dict, List, Optional
 
-from pytonapi.base import AsyncTonapiClientBase
-from pytonapi.schema.events import AccountEvents
+from pytonapi.base import AsyncTonapiClientBase, BULK_CHUNK_SIZE
+from pytonapi.schema.events import AccountEvent, AccountEvents
 from pytonapi.schema.nft import NftCollections, NftCollection, NftItems, NftItem
+from pytonapi.utils import normalize_address
 
 
 class NftMethod(AsyncTonapiClientBase):
@@ -19,7 +20,30 @@ class NftMethod(AsyncTonapiClientBase):
         params = {"limit": limit, "offset": offset}
         response = await self._get(method=method, params=params)
 
-        return NftCollections(**response)
+        return self._parse(NftCollections, response)
+
+    async def iter_collections(
+            self,
+            page_size: int = 100,
+            offset: int = 0,
+            max_items: Optional[int] = None,
+            max_concurrency: int = 4,
+    ) -> AsyncGenerator[NftCollection, None]:
+        """
+        Iterate over all NFT collections, fetching pages concurrently.
+
+        :param page_size: Collections per request. Default value: 100
+        :param offset: Offset of the first collection. Default value: 0
+        :param max_items: Stop after this number of collections
+        :param max_concurrency: Maximum number of pages requested at the same time. Default value: 4
+        :return: An asynchronous generator of :class:`NftCollection`
+        """
+        method = "v2/nfts/collections"
+        async for collection in self._paginate_offset(
+                method, "nft_collections", NftCollection,
+                page_size=page_size, offset=offset, max_items=max_items, max_concurrency=max_concurrency,
+        ):
+            yield collection
 
     async def get_collection_by_collection_address(self, account_id: str) -> NftCollection:
         """
@@ -31,20 +55,49 @@ class NftMethod(AsyncTonapiClientBase):
         method = f"v2/nfts/collections/{account_id}"
         response = await self._get(method=method)
 
-        return NftCollection(**response)
+        return self._parse(NftCollection, response)
+
+    async def load_collection(self, account_id: str) -> NftCollection:
+        """
+        Get NFT collection like :meth:`get_collection_by_collection_address`, but batch
+        concurrent calls into :meth:`get_bulk_collections` requests.
+
+        :param account_id: Account ID
+        :return: :class:`NftCollection`
+        """
+        try:
+            key = normalize_address(account_id)
+        except ValueError:
+            return await self.get_collection_by_collection_address(account_id)
+
+        loader = self._get_loader("nft.collections", self._load_bulk_collections)
+        return self._parse(NftCollection, await loader.load(key))
 
-    async def get_bulk_collections(self, account_ids: List[str]) -> NftCollections:
+    async def _load_bulk_collections(self, account_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        with self.use_response_mode("raw"):
+            response = await self.get_bulk_collections(account_ids)
+        return {normalize_address(item["address"]): item for item in response["nft_collections"]}
+
+    async def get_bulk_collections(
+            self,
+            account_ids: List[str],
+            chunk_size: int = BULK_CHUNK_SIZE,
+            max_concurrency: int = 4,
+    ) -> NftCollections:
         """
         Get NFT collections by their addresses.
+        Large lists are split into chunks that are requested concurrently.
 
         :param account_ids: A list of account IDs
+        :param chunk_size: Maximum number of account IDs per request. Default value: 100
+        :param max_concurrency: Maximum number of chunk requests in flight. Default value: 4
         :return: :class:`NftCollections`
+        :raises TONAPIBulkRequestError: If some chunks failed; holds the collections of the others.
         """
         method = f"v2/nfts/collections/_bulk"
-        params = {"account_ids": account_ids}
-        response = await self._post(method=method, body=params)
-
-        return NftCollections(**response)
+        return await self._post_bulk(
+            method, account_ids, NftCollections, "nft_collections", chunk_size, max_concurrency,
+        )
 
     async def get_items_by_collection_address(
             self,
@@ -64,7 +117,52 @@ class NftMethod(AsyncTonapiClientBase):
         params = {"limit": limit, "offset": offset}
         response = await self._get(method=method, params=params)
 
-        return NftItems(**response)
+        return self._parse(NftItems, response)
+
+    def stream_items_by_collection_address(
+            self,
+            account_id: str,
+            limit: int = 1000,
+            offset: int = 0,
+    ) -> AsyncGenerator[NftItem, None]:
+        """
+        Get NFT items from collection like :meth:`get_items_by_collection_address`,
+        but parse the response incrementally and yield the items as they arrive.
+        Close the generator with ``aclose()`` if you stop early.
+
+        :param account_id: Account ID
+        :param limit: Default value: 1000
+        :param offset: Default value: 0
+        :return: An asynchronous generator of :class:`NftItem`
+        """
+        method = f"v2/nfts/collections/{account_id}/items"
+        params = {"limit": limit, "offset": offset}
+        return self._stream(method, "nft_items", NftItem, params=params)
+
+    async def iter_items_by_collection_address(
+            self,
+            account_id: str,
+            page_size: int = 1000,
+            offset: int = 0,
+            max_items: Optional[int] = None,
+            max_concurrency: int = 4,
+    ) -> AsyncGenerator[NftItem, None]:
+        """
+        Iterate over all NFT items from collection by collection address, fetching pages concurrently.
+
+        :param account_id: Account ID
+        :param page_size: Items per request. Default value: 1000
+        :param offset: Offset of the first item. Default value: 0
+        :param max_items: Stop after this number of items
+        :param max_concurrency: Maximum number of pages requested at the same time. Default value: 4
+        :return: An asynchronous generator of :class:`NftItem`
+        """
+        method = f"v2/nfts/collections/{account_id}/items"
+        async for item in self._paginate_offset(
+                method, "nft_items", NftItem,
+                page_size=page_size, offset=offset, max_items=max_items, max_concurrency=max_concurrency,
+        ):
+            yield item
 
     async def get_item_by_address(self, account_id: str) -> NftItem:
         """
@@ -76,20 +174,47 @@ class NftMethod(AsyncTonapiClientBase):
         method = f"v2/nfts/{account_id}"
         response = await self._get(method=method)
 
-        return NftItem(**response)
+        return self._parse(NftItem, response)
+
+    async def load_item(self, account_id: str) -> NftItem:
+        """
+        Get NFT item like :meth:`get_item_by_address`, but batch concurrent calls
+        into :meth:`get_bulk_items` requests.
+
+        :param account_id: Account ID
+        :return: :class:`NftItem`
+        """
+        try:
+            key = normalize_address(account_id)
+        except ValueError:
+            return await self.get_item_by_address(account_id)
+
+        loader = self._get_loader("nft.items", self._load_bulk_items)
+        return self._parse(NftItem, await loader.load(key))
+
+    async def _load_bulk_items(self, account_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        with self.use_response_mode("raw"):
+            response = await self.get_bulk_items(account_ids)
+        return {normalize_address(item["address"]): item for item in response["nft_items"]}
 
-    async def get_bulk_items(self, account_ids: List[str]) -> NftItems:
+    async def get_bulk_items(
+            self,
+            account_ids: List[str],
+            chunk_size: int = BULK_CHUNK_SIZE,
+            max_concurrency: int = 4,
+    ) -> NftItems:
         """
         Get NFT items by their addresses.
+        Large lists are split into chunks that are requested concurrently.
 
         :param account_ids: A list of account IDs
+        :param chunk_size: Maximum number of account IDs per request. Default value: 100
+        :param max_concurrency: Maximum number of chunk requests in flight. Default value: 4
         :return: :class:`NftItems`
+        :raises TONAPIBulkRequestError: If some chunks failed; holds the items of the others.
         """
         method = f"v2/nfts/_bulk"
-        params = {"account_ids": account_ids}
-        response = await self._post(method=method, body=params)
-
-        return NftItems(**response)
+        return await self._post_bulk(method, account_ids, NftItems, "nft_items", chunk_size, max_concurrency)
 
     async def get_nft_history(
             self,
@@ -122,4 +247,44 @@ class NftMethod(AsyncTonapiClientBase):
         headers = {"Accept-Language": accept_language}
         response = await self._get(method=method, params=params, headers=headers)
 
-        return AccountEvents(**response)
+        return self._parse(AccountEvents, response)
+
+    async def iter_nft_history(
+            self,
+            account_id: str,
+            limit: int = 100,
+            before_lt: Optional[int] = None,
+            accept_language: str = "en",
+            start_date: Optional[int] = None,
+            end_date: Optional[int] = None,
+            until_lt: Optional[int] = None,
+            since: Optional[int] = None,
+            max_items: Optional[int] = None,
+    ) -> AsyncGenerator[AccountEvent, None]:
+        """
+        Iterate over the transfer NFTs history for account, newest first.
+        The next page is fetched while the current one is being processed.
+
+        :param account_id: Account ID
+        :param limit: Page size. Default value: 100
+        :param before_lt: Default value: None (omit this parameter to start from the last event)
+        :param accept_language: Default value: en
+        :param start_date: Default value: None
+        :param end_date: Default value: None
+        :param until_lt: Stop at the first event with an lt lower or equal to this one
+        :param since: Stop at the first event older than this unix time
+        :param max_items: Stop after this number of events
+        :return: An asynchronous generator of :class:`AccountEvent`
+        """
+        method = f"v2/nfts/{account_id}/history"
+        params = {"limit": limit}
+        if start_date:
+            params["start_date"] = start_date
+        if end_date:
+            params["end_date"] = end_date
+        headers = {"Accept-Language": accept_language}
+        async for event in self._paginate(
+                method, "events", AccountEvent, params, headers,
+                before_lt=before_lt, until_lt=until_lt, since=since, max_items=max_items, time_field="timestamp",
+        ):
+            yield event
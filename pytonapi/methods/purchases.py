@@ -1,7 +1,7 @@
-from typing import Optional
+from typing import AsyncGenerator, Optional
 
 from pytonapi.base import AsyncTonapiClientBase
-from pytonapi.schema.purchases import Purchases
+from pytonapi.schema.purchases import Purchase, Purchases
 
 
 class PurchasesMethod(AsyncTonapiClientBase):
@@ -26,4 +26,33 @@ class PurchasesMethod(AsyncTonapiClientBase):
             params["before_lt"] = before_lt
         response = await self._get(method=method, params=params)
 
-        return Purchases(**response)
+        return self._parse(Purchases, response)
+
+    async def iter_purchases_history(
+            self,
+            account_id: str,
+            limit: int = 100,
+            before_lt: Optional[int] = None,
+            until_lt: Optional[int] = None,
+            since: Optional[int] = None,
+            max_items: Optional[int] = None,
+    ) -> AsyncGenerator[Purchase, None]:
+        """
+        Iterate over the history of purchases, newest first.
+        The next page is fetched while the current one is being processed.
+
+        :param account_id: account ID
+        :param limit: Page size. Default value : 100
+        :param before_lt: omit this parameter to start from the last invoice
+        :param until_lt: Stop at the first purchase with an lt lower or equal to this one
+        :param since: Stop at the first purchase older than this unix time
+        :param max_items: Stop after this number of purchases
+        :return: An asynchronous generator of :class:`Purchase`
+        """
+        method = f"v2/purchases/{account_id}/history"
+        params = {"limit": limit}
+        async for purchase in self._paginate(
+                method, "purchases", Purchase, params,
+                before_lt=before_lt, until_lt=until_lt, since=since, max_items=max_items,
+        ):
+            yield purchase
@@ -23,7 +23,7 @@ class RatesMethod(AsyncTonapiClientBase):
         method = f"v2/rates"
         response = await self._get(method=method, params=params)
 
-        return Rates(**response)
+        return self._parse(Rates, response)
 
     async def get_chart(
             self,
@@ -49,7 +49,7 @@ class RatesMethod(AsyncTonapiClientBase):
         method = f"v2/rates/chart"
         response = await self._get(method=method, params=params)
 
-        return ChartRates(**response)
+        return self._parse(ChartRates, response)
 
     async def get_ton_price_from_markets(self) -> MarketsTonRates:
         """
@@ -60,4 +60,4 @@ class RatesMethod(AsyncTonapiClientBase):
         method = f"v2/rates/markets"
         response = await self._get(method=method)
 
-        return MarketsTonRates(**response)
+        return self._parse(MarketsTonRates, response)
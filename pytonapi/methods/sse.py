@@ -1,7 +1,33 @@
-from typing import List, Callable, Any, Awaitable, Tuple, Optional
+import asyncio
+import functools
+import math
+from collections import OrderedDict
+from typing import List, Callable, Any, Awaitable, Tuple, Optional, Dict, AsyncGenerator, Mapping, Union
 
-from pytonapi.base import AsyncTonapiClientBase
+from pytonapi.base import SSE_BUFFER_SIZE, AsyncTonapiClientBase
+from pytonapi.dispatch import block_keys, trace_keys, transaction_keys
+from pytonapi.eventstream import EventStream, OverflowPolicy
+from pytonapi.exceptions import TONAPISSELimitReachedError
 from pytonapi.schema.events import TransactionEventData, TraceEventData, MempoolEventData, BlockEventData
+from pytonapi.utils import address_key
+
+ALL_ACCOUNTS = "accounts"
+
+# Number of recent transaction hashes remembered to drop duplicates of merged streams
+SEEN_EVENTS = 100_000
+
+
+def _matches_operations(transaction: Dict[str, Any], operations: Optional[List[str]]) -> bool:
+    """Whether the inbound message of a transaction has one of the operations of an SSE filter."""
+    if not operations:
+        return True
+    in_msg = transaction.get("in_msg") or {}
+    op_code = (in_msg.get("op_code") or "").lower()
+    op_name = (in_msg.get("decoded_op_name") or "").replace("_", "").lower()
+    return any(
+        operation.lower() == op_code if operation.startswith("0x") else operation.lower() == op_name
+        for operation in operations
+    )
 
 
 class SSEMethod(AsyncTonapiClientBase):
@@ -12,6 +38,9 @@ class SSEMethod(AsyncTonapiClientBase):
             accounts: List[str],
             operations: Optional[List[str]] = None,
             args: Tuple = (),
+            resilient: bool = False,
+            workers: int = 1,
+            max_pending: int = 1000,
     ) -> None:
         """
         Subscribes to transactions SSE events for the specified accounts.
@@ -29,66 +58,356 @@ class SSEMethod(AsyncTonapiClientBase):
          The advantage of using hex strings is that it"s possible to get transactions for operations
          that are not yet present on `the list <https://github.com/tonkeeper/tongo/blob/master/abi/messages.md>`_.
         :param args: Additional arguments to pass to the handler
+        :param resilient: Reconnect on disconnects and backfill the missed transactions,
+         see :meth:`iter_transactions`.
+        :param workers: Number of events handled at the same time. Events of one account are
+         handled in order; with the default of 1 each event is handled before the next is read.
+        :param max_pending: Maximum number of events read ahead of the handlers when ``workers`` > 1.
         """
+        if resilient:
+            events = self.__transaction_events(accounts, operations, None, None, True)
+        else:
+            method = "v2/sse/accounts/transactions"
+            params = {"accounts": ",".join(accounts)}
+            if operations:
+                params["operations"] = ",".join(operations)
+            events = self._subscribe(method=method, params=params)
+
+        await self._handle_events(
+            events, TransactionEventData, handler, args, transaction_keys, workers, max_pending,
+        )
+
+    async def iter_transactions(
+            self,
+            accounts: List[str],
+            operations: Optional[List[str]] = None,
+            last_lts: Optional[Mapping[str, int]] = None,
+            max_reconnects: Optional[int] = None,
+            backfill: bool = True,
+    ) -> AsyncGenerator[TransactionEventData, None]:
+        """
+        Iterate over transactions SSE events of the accounts, surviving disconnects.
+
+        The stream reconnects with the retry policy's backoff. After every (re)connect the
+        transactions missed since the last seen lt of each account are fetched with
+        ``blockchain.get_account_transactions`` before the live stream resumes, so each
+        transaction is yielded once and, per account, in lt order. With the special value
+        "accounts" (all accounts) there is nothing to backfill from, so only reconnects happen.
+
+        :param accounts: A list of account IDs.
+        :param operations: Operation names or opcodes to filter by, see :meth:`subscribe_to_transactions`.
+        :param last_lts: The last processed lt per account, to resume after a restart.
+         Other accounts start at their latest transaction.
+        :param max_reconnects: Give up after this number of consecutive failed reconnects. None retries forever.
+        :param backfill: Fetch the transactions missed while disconnected. If False, events
+         sent while the stream was down are lost, but no transactions requests are made.
+        :return: An asynchronous generator of :class:`TransactionEventData`.
+        """
+        events = self.__transaction_events(accounts, operations, last_lts, max_reconnects, backfill)
+        async for data in events:
+            yield self._parse(TransactionEventData, data)
+
+    async def __transaction_events(
+            self,
+            accounts: List[str],
+            operations: Optional[List[str]],
+            last_lts: Optional[Mapping[str, int]],
+            max_reconnects: Optional[int],
+            backfill: bool,
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """Decoded transactions SSE events of :meth:`iter_transactions`."""
         method = "v2/sse/accounts/transactions"
         params = {"accounts": ",".join(accounts)}
         if operations:
             params["operations"] = ",".join(operations)
 
-        async for data in self._subscribe(method=method, params=params):
-            event = TransactionEventData(**data)
-            await handler(event, *args)
+        targets = []
+        if backfill and ALL_ACCOUNTS not in accounts:
+            targets = list(dict.fromkeys(address_key(a) for a in accounts))
+        cursors: Dict[str, int] = {address_key(a): lt for a, lt in (last_lts or {}).items()}
+        missing = [account for account in targets if account not in cursors]
+        latest = await asyncio.gather(*(self.__latest_lt(account) for account in missing))
+        cursors.update(zip(missing, latest))
+
+        async def resume() -> AsyncGenerator[Dict[str, Any], None]:
+            pages = await asyncio.gather(*(self.__transactions_after(a, cursors[a]) for a in targets))
+            for transactions in pages:
+                for tx in transactions:
+                    if _matches_operations(tx, operations):
+                        yield {"account_id": tx["account"]["address"], "lt": tx["lt"], "tx_hash": tx["hash"]}
+
+        # Accounts with a cursor (the backfilled ones and last_lts) are deduplicated by lt.
+        # Others, e.g. of the all-accounts stream, by the hashes of recent transactions,
+        # so that memory does not grow with the number of accounts seen.
+        seen: "OrderedDict[str, None]" = OrderedDict()
+        async for data in self._subscribe_resumable(method, params, resume, max_reconnects):
+            account = address_key(data["account_id"])
+            if account in cursors:
+                if data["lt"] <= cursors[account]:
+                    continue  # already seen in the backfill or before a reconnect
+                cursors[account] = data["lt"]
+            else:
+                if data["tx_hash"] in seen:
+                    continue
+                seen[data["tx_hash"]] = None
+                if len(seen) > SEEN_EVENTS:
+                    seen.popitem(last=False)
+            yield data
+
+    async def iter_transactions_sharded(
+            self,
+            accounts: List[str],
+            operations: Optional[List[str]] = None,
+            accounts_per_connection: int = 100,
+            connections: Optional[int] = None,
+            last_lts: Optional[Mapping[str, int]] = None,
+            max_reconnects: Optional[int] = None,
+            backfill: bool = True,
+    ) -> AsyncGenerator[TransactionEventData, None]:
+        """
+        Iterate over transactions SSE events of a large set of accounts over several connections.
+
+        The accounts are split into shards, each watched by its own resilient stream
+        (see :meth:`iter_transactions`), and the streams are merged into one. Events are
+        yielded as they arrive, in lt order per account; an event delivered by more than
+        one stream is yielded once. With the special value "accounts" (all accounts) a single
+        stream is opened, as with :meth:`iter_transactions`.
+
+        :param accounts: A list of account IDs.
+        :param operations: Operation names or opcodes to filter by, see :meth:`subscribe_to_transactions`.
+        :param accounts_per_connection: Maximum number of accounts per connection, which keeps
+         the URL short (about 7 KB with raw addresses for the default of 100).
+        :param connections: Number of connections. Defaults to the fewest that fit
+         ``accounts_per_connection``.
+        :param last_lts: The last processed lt per account, to resume after a restart.
+         Not supported with "accounts".
+        :param max_reconnects: Give up after this number of consecutive failed reconnects of a connection.
+        :param backfill: Fetch the transactions missed while disconnected, see :meth:`iter_transactions`.
+        :return: An asynchronous generator of :class:`TransactionEventData`.
+        :raises TONAPISSELimitReachedError: If the connections exceed the free stream slots of the key pool,
+         or, without a key pool, the connection limit of the session.
+        :raises ValueError: If ``last_lts`` is given with "accounts".
+        """
+        if ALL_ACCOUNTS in accounts:
+            if last_lts:
+                raise ValueError("The stream of all accounts cannot be resumed from last_lts")
+            events = self.iter_transactions([ALL_ACCOUNTS], operations, None, max_reconnects, backfill)
+            async for event in events:
+                yield event
+            return
+        targets = list(dict.fromkeys(address_key(a) for a in accounts))
+        if not targets:
+            raise ValueError("At least one account is required")
+        needed = max(math.ceil(len(targets) / max(accounts_per_connection, 1)), 1)
+        count = max(connections or needed, needed)
+        if self.key_pool is not None:
+            budget = sum(key.free_streams for key in self.key_pool.keys)
+        else:
+            # Each stream holds a pooled connection for good; one is left for the backfill requests.
+            budget = self.session.limit - 1 if self.session.limit else math.inf
+        if count > budget:
+            raise TONAPISSELimitReachedError(
+                f"{len(targets)} accounts need {count} streaming connections, but only {budget} are free"
+            )
+        shards = [targets[i::count] for i in range(count)]
+        cursors = {address_key(a): lt for a, lt in (last_lts or {}).items()}
+
+        # Bounded, so that a slow consumer stops the shards from reading their connections.
+        queue: "asyncio.Queue[Any]" = asyncio.Queue(SSE_BUFFER_SIZE)
+
+        async def pump(shard: List[str]) -> None:
+            try:
+                shard_lts = {account: cursors[account] for account in shard if account in cursors}
+                async for data in self.__transaction_events(shard, operations, shard_lts, max_reconnects, backfill):
+                    await queue.put(data)
+            except Exception as e:
+                await queue.put(e)
+
+        seen: "OrderedDict[str, None]" = OrderedDict()
+        tasks = [asyncio.ensure_future(pump(shard)) for shard in shards if shard]
+        try:
+            while True:
+                data = await queue.get()
+                if isinstance(data, BaseException):
+                    raise data
+                if data["tx_hash"] in seen:
+                    continue
+                seen[data["tx_hash"]] = None
+                if len(seen) > SEEN_EVENTS:
+                    seen.popitem(last=False)
+                yield self._parse(TransactionEventData, data)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def __latest_lt(self, account: str) -> int:
+        """Get the lt of the latest transaction of an account, 0 if it has none."""
+        method = f"v2/blockchain/accounts/{account}/transactions"
+        response = await self._get(method=method, params={"limit": 1, "sort_order": "desc"})
+        transactions = response.get("transactions") or []
+        return transactions[0]["lt"] if transactions else 0
+
+    async def __transactions_after(self, account: str, after_lt: int, limit: int = 100) -> List[Dict[str, Any]]:
+        """Get all transactions of an account after the lt, oldest first."""
+        method = f"v2/blockchain/accounts/{account}/transactions"
+        result: List[Dict[str, Any]] = []
+        while True:
+            params = {"after_lt": after_lt, "limit": limit, "sort_order": "asc"}
+            transactions = (await self._get(method=method, params=params)).get("transactions") or []
+            result.extend(tx for tx in transactions if tx["lt"] > after_lt)
+            if len(transactions) < limit:
+                return result
+            after_lt = transactions[-1]["lt"]
 
     async def subscribe_to_traces(
             self,
             handler: Callable[[TraceEventData, Any], Awaitable[Any]],
             accounts: List[str],
             args: Tuple = (),
+            workers: int = 1,
+            max_pending: int = 1000,
     ) -> None:
         """
         Subscribes to traces SSE events for the specified accounts.
 
         :handler: A callable function to handle the SSEEvent
         :accounts: A list of account addresses to subscribe to
+        :param workers: Number of events handled at the same time. Traces that share an account
+         are handled in order; with the default of 1 each event is handled before the next is read.
+        :param max_pending: Maximum number of events read ahead of the handlers when ``workers`` > 1.
         """
         method = "v2/sse/accounts/traces"
         params = {"accounts": ",".join(accounts)}
-        async for data in self._subscribe(method=method, params=params):
-            event = TraceEventData(**data)
-            await handler(event, *args)
+        events = self._subscribe(method=method, params=params)
+        await self._handle_events(events, TraceEventData, handler, args, trace_keys, workers, max_pending)
 
     async def subscribe_to_mempool(
             self,
             handler: Callable[[MempoolEventData, Any], Awaitable[Any]],
             accounts: List[str],
             args: Tuple = (),
+            workers: int = 1,
+            max_pending: int = 1000,
     ) -> None:
         """
         Subscribes to mempool SSE events for the specified accounts.
 
         :handler: A callable function to handle the SSEEvent
         :accounts: A list of account addresses to subscribe to
+        :param workers: Number of events handled at the same time, in any order.
+         With the default of 1 each event is handled before the next is read.
+        :param max_pending: Maximum number of events read ahead of the handlers when ``workers`` > 1.
         """
         method = "v2/sse/mempool"
         params = {"accounts": ",".join(accounts)}
-        async for data in self._subscribe(method=method, params=params):
-            event = MempoolEventData(**data)
-            await handler(event, *args)
+        events = self._subscribe(method=method, params=params)
+        await self._handle_events(events, MempoolEventData, handler, args, None, workers, max_pending)
 
     async def subscribe_to_blocks(
             self,
             handler: Callable[[BlockEventData, Any], Awaitable[Any]],
             workchain: Optional[int] = None,
             args: Tuple = (),
+            workers: int = 1,
+            max_pending: int = 1000,
     ) -> None:
         """
         Subscribes to blocks SSE events for the specified workchains.
 
         :handler: A callable function to handle the SSEEvent
         :workchain: The ID of the workchain to subscribe to. If None, subscribes to all workchains.
+        :param workers: Number of events handled at the same time. Blocks of one shard are
+         handled in order; with the default of 1 each event is handled before the next is read.
+        :param max_pending: Maximum number of events read ahead of the handlers when ``workers`` > 1.
         """
         method = "v2/sse/blocks"
         params = {} if workchain is None else {"workchain": workchain}
-        async for data in self._subscribe(method=method, params=params):
-            event = BlockEventData(**data)
-            await handler(event, *args)
+        events = self._subscribe(method=method, params=params)
+        await self._handle_events(events, BlockEventData, handler, args, block_keys, workers, max_pending)
+
+    def transactions(
+            self,
+            accounts: List[str],
+            operations: Optional[List[str]] = None,
+            resilient: bool = False,
+            maxsize: int = 1000,
+            overflow: Union[OverflowPolicy, str] = OverflowPolicy.block,
+    ) -> EventStream[TransactionEventData]:
+        """
+        Stream transactions SSE events for the specified accounts.
+
+        Use as ``async for event in tonapi.sse.transactions(accounts)``.
+
+        :param accounts: A list of account IDs, or ["accounts"] for all accounts.
+        :param operations: Operation names or opcodes to filter by, see :meth:`subscribe_to_transactions`.
+        :param resilient: Reconnect on disconnects and backfill the missed transactions,
+         see :meth:`iter_transactions`.
+        :param maxsize: Maximum number of events read ahead of the consumer.
+        :param overflow: What to do when ``maxsize`` events are queued: "block" (default),
+         "drop_oldest" or "drop_newest".
+        :return: An :class:`EventStream` of :class:`TransactionEventData`.
+        """
+        if resilient:
+            events = self.__transaction_events(accounts, operations, None, None, True)
+        else:
+            params = {"accounts": ",".join(accounts)}
+            if operations:
+                params["operations"] = ",".join(operations)
+            events = self._subscribe(method="v2/sse/accounts/transactions", params=params)
+        return EventStream(events, functools.partial(self._parse, TransactionEventData), maxsize, overflow)
+
+    def traces(
+            self,
+            accounts: List[str],
+            maxsize: int = 1000,
+            overflow: Union[OverflowPolicy, str] = OverflowPolicy.block,
+    ) -> EventStream[TraceEventData]:
+        """
+        Stream traces SSE events for the specified accounts.
+
+        :param accounts: A list of account addresses to subscribe to.
+        :param maxsize: Maximum number of events read ahead of the consumer.
+        :param overflow: What to do when ``maxsize`` events are queued: "block" (default),
+         "drop_oldest" or "drop_newest".
+        :return: An :class:`EventStream` of :class:`TraceEventData`.
+        """
+        events = self._subscribe(method="v2/sse/accounts/traces", params={"accounts": ",".join(accounts)})
+        return EventStream(events, functools.partial(self._parse, TraceEventData), maxsize, overflow)
+
+    def mempool(
+            self,
+            accounts: List[str],
+            maxsize: int = 1000,
+            overflow: Union[OverflowPolicy, str] = OverflowPolicy.block,
+    ) -> EventStream[MempoolEventData]:
+        """
+        Stream mempool SSE events for the specified accounts.
+
+        :param accounts: A list of account addresses to subscribe to.
+        :param maxsize: Maximum number of events read ahead of the consumer.
+        :param overflow: What to do when ``maxsize`` events are queued: "block" (default),
+         "drop_oldest" or "drop_newest".
+        :return: An :class:`EventStream` of :class:`MempoolEventData`.
+        """
+        events = self._subscribe(method="v2/sse/mempool", params={"accounts": ",".join(accounts)})
+        return EventStream(events, functools.partial(self._parse, MempoolEventData), maxsize, overflow)
+
+    def blocks(
+            self,
+            workchain: Optional[int] = None,
+            maxsize: int = 1000,
+            overflow: Union[OverflowPolicy, str] = OverflowPolicy.block,
+    ) -> EventStream[BlockEventData]:
+        """
+        Stream blocks SSE events for the specified workchain.
+
+        :param workchain: The ID of the workchain to subscribe to. If None, subscribes to all workchains.
+        :param maxsize: Maximum number of events read ahead of the consumer.
+        :param overflow: What to do when ``maxsize`` events are queued: "block" (default),
+         "drop_oldest" or "drop_newest".
+        :return: An :class:`EventStream` of :class:`BlockEventData`.
+        """
+        params = {} if workchain is None else {"workchain": workchain}
+        events = self._subscribe(method="v2/sse/blocks", params=params)
+        return EventStream(events, functools.partial(self._parse, BlockEventData), maxsize, overflow)
@@ -21,7 +21,7 @@ class StakingMethod(AsyncTonapiClientBase):
         method = f"v2/staking/nominator/{account_id}/pools"
         response = await self._get(method=method)
 
-        return AccountStaking(**response)
+        return self._parse(AccountStaking, response)
 
     async def get_pool_info(
             self,
@@ -39,7 +39,7 @@ class StakingMethod(AsyncTonapiClientBase):
         headers = {"Accept-Language": accept_language}
         response = await self._get(method=method, headers=headers)
 
-        return StakingPoolInfo(**response)
+        return self._parse(StakingPoolInfo, response)
 
     async def get_pool_history(self, account_id: str) -> StakingPoolHistory:
         """
@@ -51,7 +51,7 @@ class StakingMethod(AsyncTonapiClientBase):
         method = f"v2/staking/pool/{account_id}/history"
         response = await self._get(method=method)
 
-        return StakingPoolHistory(**response)
+        return self._parse(StakingPoolHistory, response)
 
     async def get_all_network_pools(
             self,
@@ -76,4 +76,4 @@ class StakingMethod(AsyncTonapiClientBase):
         headers = {"Accept-Language": accept_language}
         response = await self._get(method=method, params=params, headers=headers)
 
-        return StakingPools(**response)
+        return self._parse(StakingPools, response)
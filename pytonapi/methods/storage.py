@@ -13,4 +13,4 @@ class StorageMethod(AsyncTonapiClientBase):
         method = f"v2/storage/providers"
         response = await self._get(method=method)
 
-        return StorageProviders(**response)
+        return self._parse(StorageProviders, response)
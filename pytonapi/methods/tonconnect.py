@@ -13,7 +13,7 @@ class TonconnectMethod(AsyncTonapiClientBase):
         method = "v2/tonconnect/payload"
         response = await self._get(method=method)
 
-        return TonconnectPayload(**response)
+        return self._parse(TonconnectPayload, response)
 
     async def get_info_by_state_init(self, state_init: str) -> AccountInfoByStateInit:
         """
@@ -23,6 +23,6 @@ class TonconnectMethod(AsyncTonapiClientBase):
         """
         method = "v2/tonconnect/stateinit"
         body = {"state_init": state_init}
-        response = await self._post(method=method, body=body)
+        response = await self._post(method=method, body=body, idempotent=True)
 
-        return AccountInfoByStateInit(**response)
+        return self._parse(AccountInfoByStateInit, response)
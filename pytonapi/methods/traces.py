@@ -21,7 +21,7 @@ class TracesMethod(AsyncTonapiClientBase):
         method = f"v2/traces/{trace_id}"
         response = await self._get(method=method)
 
-        return Trace(**response)
+        return self._parse(Trace, response)
 
     async def emulate(self, body: Dict[str, Any], ignore_signature_check: Optional[bool] = None) -> Trace:
         """
@@ -37,6 +37,6 @@ class TracesMethod(AsyncTonapiClientBase):
         """
         method = "v2/traces/emulate"
         params = {"ignore_signature_check": ignore_signature_check} if ignore_signature_check else {}
-        response = await self._post(method=method, params=params, body=body)
+        response = await self._post(method=method, params=params, body=body, idempotent=True)
 
-        return Trace(**response)
+        return self._parse(Trace, response)
@@ -14,7 +14,7 @@ class UtilitiesMethod(AsyncTonapiClientBase):
         method = f"v2/address/{account_id}/parse"
         response = await self._get(method=method)
 
-        return AddressForm(**response)
+        return self._parse(AddressForm, response)
 
     async def status(self) -> ServiceStatus:
         """
@@ -25,4 +25,4 @@ class UtilitiesMethod(AsyncTonapiClientBase):
         method = "v2/status"
         response = await self._get(method=method)
 
-        return ServiceStatus(**response)
+        return self._parse(ServiceStatus, response)
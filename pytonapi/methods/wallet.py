@@ -1,6 +1,7 @@
 from typing import Dict, Any, Union
 
 from pytonapi.base import AsyncTonapiClientBase
+from pytonapi.scheduler import Priority
 from pytonapi.schema.accounts import Accounts
 from pytonapi.schema.events import MessageConsequences
 from pytonapi.schema.wallet import Wallet
@@ -50,7 +51,7 @@ class WalletMethod(AsyncTonapiClientBase):
         method = f"v2/pubkeys/{public_key}/wallets"
         response = await self._get(method=method)
 
-        return Accounts(**response)
+        return self._parse(Accounts, response)
 
     async def get_account_seqno(
             self,
@@ -63,7 +64,7 @@ class WalletMethod(AsyncTonapiClientBase):
         :return: :class:`int` seqno
         """
         method = f"v2/wallet/{account_id}/seqno"
-        response = await self._get(method=method)
+        response = await self._get(method=method, priority=Priority.interactive)
 
         return response.get("seqno", None)
 
@@ -86,9 +87,11 @@ class WalletMethod(AsyncTonapiClientBase):
         """
         method = "v2/wallet/emulate"
         headers = {"Accept-Language": accept_language}
-        response = await self._post(method=method, body=body, headers=headers)
+        response = await self._post(
+            method=method, body=body, headers=headers, idempotent=True, priority=Priority.interactive,
+        )
 
-        return MessageConsequences(**response)
+        return self._parse(MessageConsequences, response)
 
     async def get_info(self, account_id: str) -> Wallet:
         """
@@ -100,4 +103,4 @@ class WalletMethod(AsyncTonapiClientBase):
         method = f"v2/wallet/{account_id}"
         response = await self._get(method=method)
 
-        return Wallet(**response)
+        return self._parse(Wallet, response)
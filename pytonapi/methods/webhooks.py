@@ -1,14 +1,13 @@
-from typing import List
+from typing import AsyncGenerator, List, Optional
 
 from pytonapi.base import AsyncTonapiClientBase
-from pytonapi.schema.webhooks import WebhookCreate, WebhookList, AccountSubscriptions
+from pytonapi.schema.webhooks import WebhookCreate, WebhookList, AccountSubscriptions, AccountTxSubscription
 
 
 class WebhooksMethod(AsyncTonapiClientBase):
-
-    def __init__(self, *args, **kwargs) -> None:
-        super().__init__(*args, **kwargs)
-        self.base_url = "https://rt.tonapi.io/"
+    # Webhooks live on a separate host. A class attribute shadows the shared
+    # base_url of the core, so the other namespaces are not affected.
+    base_url = "https://rt.tonapi.io/"
 
     async def create_webhook(self, endpoint: str) -> WebhookCreate:
         """
@@ -21,7 +20,7 @@ class WebhooksMethod(AsyncTonapiClientBase):
         method = "webhooks"
         body = {"endpoint": endpoint}
         response = await self._post(method=method, body=body)
-        return WebhookCreate(**response)
+        return self._parse(WebhookCreate, response)
 
     async def list_webhooks(self) -> WebhookList:
         """
@@ -32,7 +31,7 @@ class WebhooksMethod(AsyncTonapiClientBase):
         """
         method = "webhooks"
         response = await self._get(method=method)
-        return WebhookList(**response)
+        return self._parse(WebhookList, response)
 
     async def delete_webhook(self, webhook_id: int) -> None:
         """
@@ -78,4 +77,29 @@ class WebhooksMethod(AsyncTonapiClientBase):
         method = f"webhooks/{webhook_id}/account-tx/subscriptions"
         params = {"offset": offset, "limit": limit}
         response = await self._get(method=method, params=params)
-        return AccountSubscriptions(**response)
+        return self._parse(AccountSubscriptions, response)
+
+    async def iter_subscriptions(
+            self,
+            webhook_id: int,
+            page_size: int = 100,
+            offset: int = 0,
+            max_items: Optional[int] = None,
+            max_concurrency: int = 4,
+    ) -> AsyncGenerator[AccountTxSubscription, None]:
+        """
+        Iterate over all subscriptions for a given webhook, fetching pages concurrently.
+
+        :param webhook_id: The ID of the webhook.
+        :param page_size: The maximum number of subscriptions per request. Default is 100.
+        :param offset: The offset of the first subscription. Default is 0.
+        :param max_items: Stop after this number of subscriptions.
+        :param max_concurrency: The maximum number of pages requested at the same time. Default is 4.
+        :return: An asynchronous generator of :class:`AccountTxSubscription`.
+        """
+        method = f"webhooks/{webhook_id}/account-tx/subscriptions"
+        async for subscription in self._paginate_offset(
+                method, "account_tx_subscriptions", AccountTxSubscription,
+                page_size=page_size, offset=offset, max_items=max_items, max_concurrency=max_concurrency,
+        ):
+            yield subscription
@@ -1,6 +1,9 @@
-from typing import List, Callable, Any, Awaitable, Tuple
+import functools
+from typing import List, Callable, Any, Awaitable, Tuple, Union
 
 from pytonapi.base import AsyncTonapiClientBase
+from pytonapi.dispatch import trace_keys, transaction_keys
+from pytonapi.eventstream import EventStream, OverflowPolicy
 from pytonapi.schema.events import TransactionEventData, TraceEventData, MempoolEventData
 
 
@@ -11,6 +14,8 @@ class WebSocketMethod(AsyncTonapiClientBase):
             accounts: List[str],
             handler: Callable[[TransactionEventData, Any], Awaitable[Any]],
             args: Tuple = (),
+            workers: int = 1,
+            max_pending: int = 1000,
     ) -> None:
         """
         Subscribes to transactions WebSocket events for the specified accounts.
@@ -18,45 +23,114 @@ class WebSocketMethod(AsyncTonapiClientBase):
         :param handler: A callable function to handle the WSMessage
         :param accounts: A list of account addresses to subscribe to
         :param args: Additional arguments to pass to the handler
+        :param workers: Number of events handled at the same time. Events of one account are
+         handled in order; with the default of 1 each event is handled before the next is read.
+        :param max_pending: Maximum number of events read ahead of the handlers when ``workers`` > 1.
         """
         method = "subscribe_account"
         params = accounts
-        async for data in self._subscribe_websocket(method=method, params=params):
-            event = TransactionEventData(**data)
-            await handler(event, *args)
+        events = self._subscribe_websocket(method=method, params=params)
+        await self._handle_events(
+            events, TransactionEventData, handler, args, transaction_keys, workers, max_pending,
+        )
 
     async def subscribe_to_traces(
             self,
             accounts: List[str],
             handler: Callable[[TraceEventData, Any], Awaitable[Any]],
             args: Tuple = (),
+            workers: int = 1,
+            max_pending: int = 1000,
     ) -> None:
         """
         Subscribes to traces WebSocket events for the specified accounts.
 
         :handler: A callable function to handle the WSMessage
         :accounts: A list of account addresses to subscribe to
+        :param workers: Number of events handled at the same time. Traces that share an account
+         are handled in order; with the default of 1 each event is handled before the next is read.
+        :param max_pending: Maximum number of events read ahead of the handlers when ``workers`` > 1.
         """
         method = "subscribe_trace"
         params = accounts
-        async for data in self._subscribe_websocket(method=method, params=params):
-            event = TraceEventData(**data)
-            await handler(event, *args)
+        events = self._subscribe_websocket(method=method, params=params)
+        await self._handle_events(events, TraceEventData, handler, args, trace_keys, workers, max_pending)
 
     async def subscribe_to_mempool(
             self,
             accounts: List[str],
             handler: Callable[[MempoolEventData, Any], Awaitable[Any]],
             args: Tuple = (),
+            workers: int = 1,
+            max_pending: int = 1000,
     ) -> None:
         """
         Subscribes to mempool WebSocket events for the specified accounts.
 
         :handler: A callable function to handle the WSMessage
         :accounts: A list of account addresses to subscribe to
+        :param workers: Number of events handled at the same time, in any order.
+         With the default of 1 each event is handled before the next is read.
+        :param max_pending: Maximum number of events read ahead of the handlers when ``workers`` > 1.
         """
         method = "subscribe_mempool"
         params = ["accounts=" + ",".join(accounts)]
-        async for data in self._subscribe_websocket(method=method, params=params):
-            event = MempoolEventData(**data)
-            await handler(event, *args)
+        events = self._subscribe_websocket(method=method, params=params)
+        await self._handle_events(events, MempoolEventData, handler, args, None, workers, max_pending)
+
+    def transactions(
+            self,
+            accounts: List[str],
+            maxsize: int = 1000,
+            overflow: Union[OverflowPolicy, str] = OverflowPolicy.block,
+    ) -> EventStream[TransactionEventData]:
+        """
+        Stream transactions WebSocket events for the specified accounts.
+
+        Use as ``async for event in tonapi.websocket.transactions(accounts)``.
+
+        :param accounts: A list of account addresses to subscribe to.
+        :param maxsize: Maximum number of events read ahead of the consumer.
+        :param overflow: What to do when ``maxsize`` events are queued: "block" (default),
+         "drop_oldest" or "drop_newest".
+        :return: An :class:`EventStream` of :class:`TransactionEventData`.
+        """
+        events = self._subscribe_websocket(method="subscribe_account", params=accounts)
+        return EventStream(events, functools.partial(self._parse, TransactionEventData), maxsize, overflow)
+
+    def traces(
+            self,
+            accounts: List[str],
+            maxsize: int = 1000,
+            overflow: Union[OverflowPolicy, str] = OverflowPolicy.block,
+    ) -> EventStream[TraceEventData]:
+        """
+        Stream traces WebSocket events for the specified accounts.
+
+        :param accounts: A list of account addresses to subscribe to.
+        :param maxsize: Maximum number of events read ahead of the consumer.
+        :param overflow: What to do when ``maxsize`` events are queued: "block" (default),
+         "drop_oldest" or "drop_newest".
+        :return: An :class:`EventStream` of :class:`TraceEventData`.
+        """
+        events = self._subscribe_websocket(method="subscribe_trace", params=accounts)
+        return EventStream(events, functools.partial(self._parse, TraceEventData), maxsize, overflow)
+
+    def mempool(
+            self,
+            accounts: List[str],
+            maxsize: int = 1000,
+            overflow: Union[OverflowPolicy, str] = OverflowPolicy.block,
+    ) -> EventStream[MempoolEventData]:
+        """
+        Stream mempool WebSocket events for the specified accounts.
+
+        :param accounts: A list of account addresses to subscribe to.
+        :param maxsize: Maximum number of events read ahead of the consumer.
+        :param overflow: What to do when ``maxsize`` events are queued: "block" (default),
+         "drop_oldest" or "drop_newest".
+        :return: An :class:`EventStream` of :class:`MempoolEventData`.
+        """
+        params = ["accounts=" + ",".join(accounts)]
+        events = self._subscribe_websocket(method="subscribe_mempool", params=params)
+        return EventStream(events, functools.partial(self._parse, MempoolEventData), maxsize, overflow)
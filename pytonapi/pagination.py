@@ -0,0 +1,219 @@
+import asyncio
+from collections import deque
+from typing import Any, AsyncGenerator, Awaitable, Callable, Deque, Dict, List, Optional, Sequence, Tuple
+
+
+def next_before_lt(
+        page: Dict[str, Any],
+        items: List[Dict[str, Any]],
+        limit: int,
+        before_lt: Optional[int],
+) -> Optional[int]:
+    """
+    Get the ``before_lt`` cursor of the page that follows a history page.
+
+    The server-provided ``next_from`` is used if the endpoint returns one (0 marks
+    the last page); otherwise the lt of the last item continues a full page.
+
+    :param page: The decoded page.
+    :param items: The items of the page.
+    :param limit: The page size that was requested.
+    :param before_lt: The cursor the page was requested with.
+    :return: The next cursor, or None if there are no more pages.
+    """
+    if "next_from" in page:
+        cursor = page["next_from"] or None
+    elif items and len(items) >= limit:
+        cursor = items[-1]["lt"]
+    else:
+        cursor = None
+
+    if cursor is not None and before_lt is not None and cursor >= before_lt:
+        return None  # the cursor does not move, stop instead of looping
+    return cursor
+
+
+async def paginate_by_lt(
+        fetch: Callable[[Optional[int]], Awaitable[Dict[str, Any]]],
+        key: str,
+        limit: int,
+        before_lt: Optional[int] = None,
+        until_lt: Optional[int] = None,
+        since: Optional[int] = None,
+        max_items: Optional[int] = None,
+        time_field: str = "utime",
+) -> AsyncGenerator[Dict[str, Any], None]:
+    """
+    Walk a newest-first history endpoint backwards with the ``before_lt`` cursor.
+
+    The next page is requested as soon as the current one arrives, so it downloads
+    while the caller handles the current items. No page is prefetched once a stop
+    condition is reached.
+
+    :param fetch: Coroutine function that gets the page before the given lt (None for the newest page).
+    :param key: The name of the item list in the page, e.g. ``events``.
+    :param limit: The page size.
+    :param before_lt: Start below this lt. Omit to start from the newest item.
+    :param until_lt: Stop at the first item with an lt lower or equal to this one.
+    :param since: Stop at the first item older than this unix time.
+    :param max_items: Stop after this number of items.
+    :param time_field: The item field with the unix time, e.g. ``utime`` or ``timestamp``.
+    :return: An asynchronous generator of decoded items.
+    """
+    count = 0
+    task: Optional["asyncio.Future[Dict[str, Any]]"] = asyncio.ensure_future(fetch(before_lt))
+    try:
+        while task is not None:
+            page = await task
+            task = None
+
+            items = page.get(key) or []
+            cursor = next_before_lt(page, items, limit, before_lt)
+            last = items[-1] if items else None
+            if cursor is not None and not (
+                    (max_items is not None and count + len(items) >= max_items)
+                    or (last is not None and until_lt is not None and last["lt"] <= until_lt)
+                    or (last is not None and since is not None and last[time_field] < since)
+            ):
+                task = asyncio.ensure_future(fetch(cursor))
+
+            for item in items:
+                if before_lt is not None and item["lt"] >= before_lt:
+                    continue  # already yielded if the cursor is inclusive
+                if until_lt is not None and item["lt"] <= until_lt:
+                    return
+                if since is not None and item[time_field] < since:
+                    return
+                yield item
+                count += 1
+                if max_items is not None and count >= max_items:
+                    return
+            before_lt = cursor
+    finally:
+        if task is not None:
+            if task.done() and not task.cancelled():
+                task.exception()  # the prefetched page is not needed, nor is its error
+            task.cancel()
+
+
+async def paginate_by_offset(
+        fetch: Callable[[int, int], Awaitable[Dict[str, Any]]],
+        key: str,
+        page_size: int,
+        offset: int = 0,
+        max_items: Optional[int] = None,
+        max_concurrency: int = 4,
+) -> AsyncGenerator[Dict[str, Any], None]:
+    """
+    Fetch the pages of an offset-paginated endpoint concurrently and yield their items in order.
+
+    Up to ``max_concurrency`` pages are in flight at a time; a new page is requested
+    as soon as the oldest one has been consumed. The end is found from the ``total``
+    field if the endpoint returns one, otherwise from the first page that is not full
+    (so up to ``max_concurrency - 1`` requests past the end may be made and discarded).
+
+    :param fetch: Coroutine function that gets the page with the given offset and limit.
+    :param key: The name of the item list in the page, e.g. ``addresses``.
+    :param page_size: Maximum number of items per request.
+    :param offset: The offset of the first item.
+    :param max_items: Stop after this number of items.
+    :param max_concurrency: Maximum number of pages requested at the same time.
+    :return: An asynchronous generator of decoded items.
+    """
+    end = None if max_items is None else offset + max_items
+    next_offset = offset
+    pending: Deque[Tuple[int, "asyncio.Future[Dict[str, Any]]"]] = deque()
+    try:
+        while True:
+            while len(pending) < max(max_concurrency, 1) and (end is None or next_offset < end):
+                limit = page_size if end is None else min(page_size, end - next_offset)
+                pending.append((limit, asyncio.ensure_future(fetch(next_offset, limit))))
+                next_offset += limit
+            if not pending:
+                return
+
+            limit, task = pending.popleft()
+            page = await task
+            if "total" in page:
+                end = page["total"] if end is None else min(end, page["total"])
+
+            items = page.get(key) or []
+            for item in items:
+                yield item
+            if len(items) < limit:
+                return
+    finally:
+        for _, task in pending:
+            if task.done() and not task.cancelled():
+                task.exception()
+            task.cancel()
+
+
+async def scan_by_time(
+        fetch: Callable[[int, int, Optional[int]], Awaitable[Dict[str, Any]]],
+        key: str,
+        start_date: int,
+        end_date: int,
+        limit: int,
+        id_fields: Sequence[str] = ("lt",),
+        time_field: str = "utime",
+        min_window: int = 60,
+        max_concurrency: int = 4,
+        descending: bool = True,
+) -> List[Dict[str, Any]]:
+    """
+    Scan a history endpoint that filters by ``start_date``/``end_date`` in parallel time windows.
+
+    The range is split into ``max_concurrency`` windows that are walked concurrently
+    with the ``before_lt`` cursor. A window that still has more pages after its first
+    page is split again: the part below the oldest item seen is halved, and both halves
+    are scanned concurrently, down to windows of ``min_window`` seconds. Windows share
+    their boundaries, so items are deduplicated by ``id_fields`` and sorted by lt.
+
+    :param fetch: Coroutine function that gets a page of a window by start date, end date
+     and ``before_lt`` cursor (None for the newest page of the window).
+    :param key: The name of the item list in the page, e.g. ``events``.
+    :param start_date: Start of the range, unix time.
+    :param end_date: End of the range, unix time.
+    :param limit: The page size.
+    :param id_fields: Item fields that identify an item, e.g. ``("event_id",)``.
+    :param time_field: The item field with the unix time, e.g. ``utime`` or ``timestamp``.
+    :param min_window: Windows shorter than this number of seconds are not split.
+    :param max_concurrency: Maximum number of pages requested at the same time.
+    :param descending: Sort newest first (the API order) if True, oldest first otherwise.
+    :return: The decoded items of the range.
+    """
+    semaphore = asyncio.Semaphore(max(max_concurrency, 1))
+    found: Dict[Tuple[Any, ...], Dict[str, Any]] = {}
+
+    async def scan(start: int, end: int, before_lt: Optional[int]) -> None:
+        while True:
+            async with semaphore:
+                page = await fetch(start, end, before_lt)
+            items = page.get(key) or []
+            for item in items:
+                found.setdefault(tuple(item.get(field) for field in id_fields), item)
+
+            cursor = next_before_lt(page, items, limit, before_lt)
+            if cursor is None:
+                return
+            oldest = items[-1][time_field] if items else end
+            if oldest - start > min_window:
+                middle = start + (oldest - start) // 2
+                await scan_all([(start, middle, None), (middle, oldest, cursor)])
+                return
+            before_lt = cursor
+
+    async def scan_all(windows: List[Tuple[int, int, Optional[int]]]) -> None:
+        tasks = [asyncio.ensure_future(scan(*window)) for window in windows]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+    step = max((end_date - start_date) // max(max_concurrency, 1), min_window, 1)
+    bounds = list(range(start_date, end_date, step)) + [end_date]
+    await scan_all([(bounds[i], bounds[i + 1], None) for i in range(len(bounds) - 1)] or [(start_date, end_date, None)])
+    return sorted(found.values(), key=lambda item: item["lt"], reverse=descending)
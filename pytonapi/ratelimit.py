@@ -0,0 +1,73 @@
+import asyncio
+import math
+import time
+from typing import Optional
+
+
+class AsyncTokenBucket:
+    """
+    Asynchronous token-bucket rate limiter.
+
+    Tokens are refilled continuously at ``rate`` per second up to ``burst``.
+    Callers that find the bucket empty reserve a token in advance and sleep
+    until it is refilled, so waiters are served in arrival order without a lock.
+    """
+
+    def __init__(self, rate: float, burst: Optional[int] = None) -> None:
+        """
+        Initialize the AsyncTokenBucket.
+
+        :param rate: Number of tokens refilled per second (requests per second).
+        :param burst: Bucket capacity. Defaults to ``rate`` rounded up, but at least 1.
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+
+        self.rate = float(rate)
+        self.burst = burst if burst is not None else max(1, math.ceil(rate))
+        if self.burst < 1:
+            raise ValueError("burst must be at least 1")
+
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    @property
+    def available(self) -> float:
+        """Number of tokens that can be taken right now. Negative if callers are queued."""
+        self._refill()
+        return self._tokens
+
+    def try_acquire(self, tokens: int = 1) -> bool:
+        """
+        Take tokens without waiting.
+
+        :param tokens: Number of tokens to take.
+        :return: True if the tokens were taken, False if the bucket is short.
+        """
+        self._refill()
+        if self._tokens >= tokens:
+            self._tokens -= tokens
+            return True
+        return False
+
+    async def acquire(self, tokens: int = 1) -> None:
+        """
+        Take tokens, waiting until the bucket has refilled enough.
+
+        :param tokens: Number of tokens to take.
+        """
+        self._refill()
+        self._tokens -= tokens
+        if self._tokens >= 0:
+            return
+
+        try:
+            await asyncio.sleep(-self._tokens / self.rate)
+        except asyncio.CancelledError:
+            self._tokens += tokens
+            raise
@@ -0,0 +1,135 @@
+import asyncio
+import random
+from typing import Collection, Optional
+
+import aiohttp
+
+from pytonapi.exceptions import TONAPIError
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+class RetryBudget:
+    """
+    Caps retries to a fraction of the requests made through a client.
+
+    Every request deposits ``ratio`` tokens and every retry withdraws one, so during
+    an outage retries add at most ``ratio`` extra load instead of multiplying it.
+    """
+
+    def __init__(self, ratio: float = 0.2, min_tokens: float = 10.0, max_tokens: float = 100.0) -> None:
+        """
+        Initialize the RetryBudget.
+
+        :param ratio: Retry tokens earned per request.
+        :param min_tokens: Tokens available up front, so low-traffic clients can still retry.
+        :param max_tokens: Upper bound of saved tokens.
+        """
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self._tokens = min(min_tokens, max_tokens)
+
+    @property
+    def tokens(self) -> float:
+        """Number of retries currently allowed."""
+        return self._tokens
+
+    def deposit(self) -> None:
+        """Record a request."""
+        self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        """
+        Spend a token on a retry.
+
+        :return: True if the retry is allowed.
+        """
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+
+class RetryPolicy:
+    """
+    Decides whether and when a failed request is retried.
+
+    Responses with a status from ``retry_statuses``, timeouts and connection errors
+    are retried. Delays grow exponentially with full jitter and honour
+    the ``Retry-After`` header. Non-idempotent requests (POST by default) are retried
+    only when the server cannot have processed them: the connection was never
+    established or the request was rejected with 429.
+    """
+
+    def __init__(
+            self,
+            max_retries: int = 3,
+            base_delay: float = 0.5,
+            max_delay: float = 30.0,
+            retry_statuses: Collection[int] = (429, 500, 502, 503, 504),
+            respect_retry_after: bool = True,
+            budget: Optional[RetryBudget] = None,
+    ) -> None:
+        """
+        Initialize the RetryPolicy.
+
+        :param max_retries: Maximum number of retries per request.
+        :param base_delay: Delay cap of the first retry in seconds, doubled on each attempt.
+        :param max_delay: Upper bound of a single delay in seconds.
+        :param retry_statuses: HTTP statuses that are considered transient.
+        :param respect_retry_after: Wait for the server-provided ``Retry-After`` if present.
+        :param budget: Retry budget shared by all requests that use this policy.
+         A default budget is created if omitted.
+        """
+        self.max_retries = max(max_retries, 0)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_statuses = frozenset(retry_statuses)
+        self.respect_retry_after = respect_retry_after
+        self.budget = budget or RetryBudget()
+
+    def is_retryable(self, error: BaseException, idempotent: bool = True) -> bool:
+        """
+        Classify an error as transient.
+
+        :param error: The error raised by the request.
+        :param idempotent: Whether the request may safely be sent twice.
+        :return: True if the request can be retried.
+        """
+        if isinstance(error, TONAPIError):
+            if error.status == 429:
+                return 429 in self.retry_statuses
+            return idempotent and error.status in self.retry_statuses
+        if isinstance(error, aiohttp.ClientConnectorError):
+            return True
+        if isinstance(error, (asyncio.TimeoutError, aiohttp.ClientConnectionError, aiohttp.ClientPayloadError)):
+            return idempotent
+        if isinstance(error, aiohttp.ClientResponseError):
+            return idempotent and error.status in self.retry_statuses
+        return False
+
+    def should_retry(self, error: BaseException, attempt: int, idempotent: bool = True) -> bool:
+        """
+        Decide whether a failed attempt is retried. Spends a budget token if so.
+
+        :param error: The error raised by the attempt.
+        :param attempt: Zero-based number of the failed attempt.
+        :param idempotent: Whether the request may safely be sent twice.
+        :return: True if the request should be retried.
+        """
+        if attempt >= self.max_retries or not self.is_retryable(error, idempotent):
+            return False
+        return self.budget.withdraw()
+
+    def get_delay(self, attempt: int, error: Optional[BaseException] = None) -> float:
+        """
+        Get the delay before the next attempt.
+
+        :param attempt: Zero-based number of the failed attempt.
+        :param error: The error raised by the attempt.
+        :return: The delay in seconds.
+        """
+        retry_after = getattr(error, "retry_after", None)
+        if self.respect_retry_after and retry_after is not None:
+            return min(max(retry_after, 0.0), self.max_delay)
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
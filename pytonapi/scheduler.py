@@ -0,0 +1,143 @@
+import asyncio
+from collections import deque
+from enum import Enum
+from typing import Deque, Dict, Mapping, Optional, Tuple, Union
+
+from pytonapi.ratelimit import AsyncTokenBucket
+
+
+class Priority(str, Enum):
+    """
+    Scheduling lanes of requests.
+
+    * ``interactive`` - latency-critical calls, e.g. seqno lookups, sending and emulating messages.
+    * ``default`` - ordinary calls.
+    * ``bulk`` - backfills: paginated, scanned and streamed history.
+    """
+    interactive = "interactive"
+    default = "default"
+    bulk = "bulk"
+
+
+DEFAULT_WEIGHTS: Dict[Priority, float] = {
+    Priority.interactive: 16.0,
+    Priority.default: 4.0,
+    Priority.bulk: 1.0,
+}
+
+
+class PriorityScheduler:
+    """
+    Weighted fair queue over the client's rate limit and connection slots.
+
+    A request that finds no free token or slot waits in the queue of its lane.
+    Waiters are dispatched in order of their virtual finish time, so when all
+    lanes are backlogged each lane gets capacity in proportion to its weight,
+    and an idle lane's share goes to the others. An interactive request arriving
+    behind thousands of queued bulk requests is dispatched next.
+    """
+
+    def __init__(
+            self,
+            rate_limiter: Optional[AsyncTokenBucket] = None,
+            max_concurrency: Optional[int] = None,
+            weights: Optional[Mapping[Union[Priority, str], float]] = None,
+    ) -> None:
+        """
+        Initialize the PriorityScheduler.
+
+        :param rate_limiter: The shared token bucket. None if requests are not rate limited.
+        :param max_concurrency: Maximum number of requests in flight. None means no limit.
+        :param weights: Share of each lane, e.g. ``{"interactive": 16, "default": 4, "bulk": 1}``.
+        """
+        self.rate_limiter = rate_limiter
+        self.max_concurrency = max_concurrency or None
+        self.weights = dict(DEFAULT_WEIGHTS)
+        for lane, weight in (weights or {}).items():
+            if weight <= 0:
+                raise ValueError("Lane weights must be positive")
+            self.weights[Priority(lane)] = float(weight)
+
+        self.active = 0
+        self.dispatched: Dict[Priority, int] = {lane: 0 for lane in Priority}
+
+        self._queues: Dict[Priority, Deque[Tuple[float, "asyncio.Future[None]"]]] = {lane: deque() for lane in Priority}
+        self._finish: Dict[Priority, float] = {lane: 0.0 for lane in Priority}
+        self._virtual_time = 0.0
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    def queued(self, priority: Optional[Union[Priority, str]] = None) -> int:
+        """
+        Number of waiting requests.
+
+        :param priority: Count only this lane.
+        """
+        if priority is not None:
+            return len(self._queues[Priority(priority)])
+        return sum(len(queue) for queue in self._queues.values())
+
+    async def acquire(self, priority: Union[Priority, str] = Priority.default) -> None:
+        """
+        Wait for a token and a connection slot. Call :meth:`release` when the request is done.
+
+        :param priority: The lane of the request.
+        """
+        lane = Priority(priority)
+        if not self.queued() and self._take():
+            self.dispatched[lane] += 1
+            return
+
+        tag = max(self._virtual_time, self._finish[lane]) + 1 / self.weights[lane]
+        self._finish[lane] = tag
+        future = asyncio.get_running_loop().create_future()
+        self._queues[lane].append((tag, future))
+        if self._timer is None:
+            self._dispatch()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self.release()  # dispatched, then cancelled before it could run
+            raise
+
+    def release(self) -> None:
+        """Free the connection slot taken with :meth:`acquire`."""
+        self.active = max(self.active - 1, 0)
+        if self._timer is None:
+            self._dispatch()
+
+    def _take(self) -> bool:
+        if self.max_concurrency is not None and self.active >= self.max_concurrency:
+            return False
+        if self.rate_limiter is not None and not self.rate_limiter.try_acquire():
+            return False
+        self.active += 1
+        return True
+
+    def _next_lane(self) -> Optional[Priority]:
+        best = None
+        for lane, queue in self._queues.items():
+            while queue and queue[0][1].done():
+                queue.popleft()  # cancelled while waiting
+            if queue and (best is None or queue[0][0] < self._queues[best][0][0]):
+                best = lane
+        return best
+
+    def _dispatch(self) -> None:
+        self._timer = None
+        while True:
+            lane = self._next_lane()
+            if lane is None:
+                return
+            if not self._take():
+                if self.rate_limiter is not None and (
+                        self.max_concurrency is None or self.active < self.max_concurrency
+                ):
+                    # short of tokens: come back when the next one is refilled
+                    delay = max((1 - self.rate_limiter.available) / self.rate_limiter.rate, 0.0)
+                    self._timer = asyncio.get_running_loop().call_later(delay, self._dispatch)
+                return  # short of slots: release() dispatches
+            tag, future = self._queues[lane].popleft()
+            self._virtual_time = tag
+            self.dispatched[lane] += 1
+            future.set_result(None)
@@ -1,22 +1,50 @@
-from pytonapi.schema import accounts
-from pytonapi.schema import blockchain
-from pytonapi.schema import dns
-from pytonapi.schema import domains
-from pytonapi.schema import events
-from pytonapi.schema import extra_currency
-from pytonapi.schema import gasless
-from pytonapi.schema import jettons
-from pytonapi.schema import liteserver
-from pytonapi.schema import multisig
-from pytonapi.schema import nft
-from pytonapi.schema import purchases
-from pytonapi.schema import rates
-from pytonapi.schema import staking
-from pytonapi.schema import storage
-from pytonapi.schema import tonconnect
-from pytonapi.schema import traces
-from pytonapi.schema import utilites
-from pytonapi.schema import wallet
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from pytonapi.schema import accounts
+    from pytonapi.schema import blockchain
+    from pytonapi.schema import dns
+    from pytonapi.schema import domains
+    from pytonapi.schema import events
+    from pytonapi.schema import extra_currency
+    from pytonapi.schema import gasless
+    from pytonapi.schema import jettons
+    from pytonapi.schema import liteserver
+    from pytonapi.schema import multisig
+    from pytonapi.schema import nft
+    from pytonapi.schema import purchases
+    from pytonapi.schema import rates
+    from pytonapi.schema import staking
+    from pytonapi.schema import storage
+    from pytonapi.schema import tonconnect
+    from pytonapi.schema import traces
+    from pytonapi.schema import utilites
+    from pytonapi.schema import wallet
+
+# Schema modules are imported on first access, so importing one of them
+# does not load all the others.
+_MODULES = frozenset({
+    "accounts",
+    "blockchain",
+    "dns",
+    "domains",
+    "events",
+    "extra_currency",
+    "gasless",
+    "jettons",
+    "liteserver",
+    "multisig",
+    "nft",
+    "purchases",
+    "rates",
+    "staking",
+    "storage",
+    "tonconnect",
+    "traces",
+    "utilites",
+    "wallet",
+})
 
 __all__ = [
     "accounts",
@@ -36,3 +64,13 @@ __all__ = [
     "utilites",
     "wallet",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return import_module(f"{__name__}.{name}")
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | _MODULES)
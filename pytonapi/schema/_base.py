@@ -0,0 +1,13 @@
+from pydantic import BaseModel as PydanticBaseModel
+from pydantic import ConfigDict
+
+
+class BaseModel(PydanticBaseModel):
+    """
+    Base class of the response models.
+
+    Validators are built when a model is first used rather than at import time,
+    so importing the schema modules stays cheap.
+    """
+
+    model_config = ConfigDict(defer_build=True)
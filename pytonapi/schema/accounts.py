@@ -1,9 +1,8 @@
 from typing import Optional, List
 
-from pydantic import BaseModel
-
 from pytonapi.schema._address import Address
 from pytonapi.schema._balance import Balance
+from pytonapi.schema._base import BaseModel
 
 
 class Account(BaseModel):
@@ -2,9 +2,10 @@ from __future__ import annotations
 
 from typing import List, Optional, Dict, Any
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
 from pytonapi.schema._address import Address
+from pytonapi.schema._base import BaseModel
 from pytonapi.schema.accounts import AccountAddress
 from pytonapi.schema.traces import (
     AccountStatus,
@@ -1,8 +1,9 @@
-from typing import List, Optional
+from typing import Annotated, Any, Dict, List, Literal, Optional, Type, Union
 
-from pydantic import BaseModel
+from pydantic import Discriminator, SerializationInfo, SerializerFunctionWrapHandler, Tag, model_serializer
 
 from pytonapi.schema._address import Address
+from pytonapi.schema._base import BaseModel
 from pytonapi.schema.accounts import AccountAddress
 from pytonapi.schema.jettons import JettonPreview, JettonQuantity
 from pytonapi.schema.nft import NftItem, Price
@@ -182,36 +183,273 @@ class InscriptionMintAction(BaseModel):
 
 
 class Action(BaseModel):
+    """
+    An event action. Actions are parsed into the subclass that matches ``type``
+    (e.g. :class:`TonTransferEventAction`), which validates only its own payload;
+    actions of types unknown to this library stay plain :class:`Action`.
+    Payload attributes of the other types read as None.
+    """
     type: str
     status: str
+    simple_preview: ActionSimplePreview
+
+    def __getattr__(self, item: str) -> Any:
+        if item in ACTION_TYPES:
+            return None
+        return super().__getattr__(item)  # type: ignore[misc]
+
+    @property
+    def payload(self) -> Optional[BaseModel]:
+        """The payload of the action type, e.g. :class:`TonTransferAction`."""
+        return None
+
+    @model_serializer(mode="wrap")
+    def _serialize(self, handler: SerializerFunctionWrapHandler, info: SerializationInfo) -> Any:
+        # Dump the shape of the former single Action model, which had a key for every payload type.
+        data = handler(self)
+        if not isinstance(data, dict):
+            return data
+        fill = not (info.exclude_none or info.exclude_unset or info.exclude_defaults
+                    or info.include is not None or info.exclude is not None)
+        dumped = {key: data.pop(key) for key in ("type", "status") if key in data}
+        for action_type in ACTION_TYPES:
+            if action_type in data:
+                dumped[action_type] = data.pop(action_type)
+            elif fill:
+                dumped[action_type] = None
+        dumped.update(data)
+        return dumped
+
+
+class TonTransferEventAction(Action):
+    type: Literal["TonTransfer"]
     TonTransfer: Optional[TonTransferAction] = None
+
+    @property
+    def payload(self) -> Optional[TonTransferAction]:
+        return self.TonTransfer
+
+
+class ContractDeployEventAction(Action):
+    type: Literal["ContractDeploy"]
     ContractDeploy: Optional[ContractDeployAction] = None
+
+    @property
+    def payload(self) -> Optional[ContractDeployAction]:
+        return self.ContractDeploy
+
+
+class JettonTransferEventAction(Action):
+    type: Literal["JettonTransfer"]
     JettonTransfer: Optional[JettonTransferAction] = None
+
+    @property
+    def payload(self) -> Optional[JettonTransferAction]:
+        return self.JettonTransfer
+
+
+class JettonBurnEventAction(Action):
+    type: Literal["JettonBurn"]
     JettonBurn: Optional[JettonBurnAction] = None
+
+    @property
+    def payload(self) -> Optional[JettonBurnAction]:
+        return self.JettonBurn
+
+
+class JettonMintEventAction(Action):
+    type: Literal["JettonMint"]
     JettonMint: Optional[JettonMintAction] = None
+
+    @property
+    def payload(self) -> Optional[JettonMintAction]:
+        return self.JettonMint
+
+
+class NftItemTransferEventAction(Action):
+    type: Literal["NftItemTransfer"]
     NftItemTransfer: Optional[NftItemTransferAction] = None
+
+    @property
+    def payload(self) -> Optional[NftItemTransferAction]:
+        return self.NftItemTransfer
+
+
+class SubscribeEventAction(Action):
+    type: Literal["Subscribe"]
     Subscribe: Optional[SubscriptionAction] = None
+
+    @property
+    def payload(self) -> Optional[SubscriptionAction]:
+        return self.Subscribe
+
+
+class UnSubscribeEventAction(Action):
+    type: Literal["UnSubscribe"]
     UnSubscribe: Optional[UnSubscriptionAction] = None
+
+    @property
+    def payload(self) -> Optional[UnSubscriptionAction]:
+        return self.UnSubscribe
+
+
+class AuctionBidEventAction(Action):
+    type: Literal["AuctionBid"]
     AuctionBid: Optional[AuctionBidAction] = None
+
+    @property
+    def payload(self) -> Optional[AuctionBidAction]:
+        return self.AuctionBid
+
+
+class NftPurchaseEventAction(Action):
+    type: Literal["NftPurchase"]
     NftPurchase: Optional[NftPurchaseAction] = None
+
+    @property
+    def payload(self) -> Optional[NftPurchaseAction]:
+        return self.NftPurchase
+
+
+class DepositStakeEventAction(Action):
+    type: Literal["DepositStake"]
     DepositStake: Optional[DepositStakeAction] = None
+
+    @property
+    def payload(self) -> Optional[DepositStakeAction]:
+        return self.DepositStake
+
+
+class WithdrawStakeEventAction(Action):
+    type: Literal["WithdrawStake"]
     WithdrawStake: Optional[WithdrawStakeAction] = None
+
+    @property
+    def payload(self) -> Optional[WithdrawStakeAction]:
+        return self.WithdrawStake
+
+
+class WithdrawStakeRequestEventAction(Action):
+    type: Literal["WithdrawStakeRequest"]
     WithdrawStakeRequest: Optional[WithdrawStakeRequestAction] = None
+
+    @property
+    def payload(self) -> Optional[WithdrawStakeRequestAction]:
+        return self.WithdrawStakeRequest
+
+
+class ElectionsDepositStakeEventAction(Action):
+    type: Literal["ElectionsDepositStake"]
     ElectionsDepositStake: Optional[ElectionsDepositStakeAction] = None
+
+    @property
+    def payload(self) -> Optional[ElectionsDepositStakeAction]:
+        return self.ElectionsDepositStake
+
+
+class ElectionsRecoverStakeEventAction(Action):
+    type: Literal["ElectionsRecoverStake"]
     ElectionsRecoverStake: Optional[ElectionsRecoverStakeAction] = None
+
+    @property
+    def payload(self) -> Optional[ElectionsRecoverStakeAction]:
+        return self.ElectionsRecoverStake
+
+
+class JettonSwapEventAction(Action):
+    type: Literal["JettonSwap"]
     JettonSwap: Optional[JettonSwapAction] = None
+
+    @property
+    def payload(self) -> Optional[JettonSwapAction]:
+        return self.JettonSwap
+
+
+class SmartContractExecEventAction(Action):
+    type: Literal["SmartContractExec"]
     SmartContractExec: Optional[SmartContractAction] = None
+
+    @property
+    def payload(self) -> Optional[SmartContractAction]:
+        return self.SmartContractExec
+
+
+class DomainRenewEventAction(Action):
+    type: Literal["DomainRenew"]
     DomainRenew: Optional[DomainRenewAction] = None
+
+    @property
+    def payload(self) -> Optional[DomainRenewAction]:
+        return self.DomainRenew
+
+
+class InscriptionTransferEventAction(Action):
+    type: Literal["InscriptionTransfer"]
     InscriptionTransfer: Optional[InscriptionTransferAction] = None
+
+    @property
+    def payload(self) -> Optional[InscriptionTransferAction]:
+        return self.InscriptionTransfer
+
+
+class InscriptionMintEventAction(Action):
+    type: Literal["InscriptionMint"]
     InscriptionMint: Optional[InscriptionMintAction] = None
-    simple_preview: ActionSimplePreview
+
+    @property
+    def payload(self) -> Optional[InscriptionMintAction]:
+        return self.InscriptionMint
+
+
+ACTION_TYPES: Dict[str, Type[Action]] = {
+    "TonTransfer": TonTransferEventAction,
+    "ContractDeploy": ContractDeployEventAction,
+    "JettonTransfer": JettonTransferEventAction,
+    "JettonBurn": JettonBurnEventAction,
+    "JettonMint": JettonMintEventAction,
+    "NftItemTransfer": NftItemTransferEventAction,
+    "Subscribe": SubscribeEventAction,
+    "UnSubscribe": UnSubscribeEventAction,
+    "AuctionBid": AuctionBidEventAction,
+    "NftPurchase": NftPurchaseEventAction,
+    "DepositStake": DepositStakeEventAction,
+    "WithdrawStake": WithdrawStakeEventAction,
+    "WithdrawStakeRequest": WithdrawStakeRequestEventAction,
+    "ElectionsDepositStake": ElectionsDepositStakeEventAction,
+    "ElectionsRecoverStake": ElectionsRecoverStakeEventAction,
+    "JettonSwap": JettonSwapEventAction,
+    "SmartContractExec": SmartContractExecEventAction,
+    "DomainRenew": DomainRenewEventAction,
+    "InscriptionTransfer": InscriptionTransferEventAction,
+    "InscriptionMint": InscriptionMintEventAction,
+}
+
+
+def _action_tag(value: Any) -> str:
+    if isinstance(value, dict):
+        action_type = value.get("type")
+    elif type(value) is Action:
+        return "unknown"
+    else:
+        action_type = getattr(value, "type", None)
+    return action_type if action_type in ACTION_TYPES else "unknown"
+
+
+# Parses an action into the ACTION_TYPES model picked by its "type" field.
+AnyAction = Annotated[
+    Union[
+        tuple(Annotated[model, Tag(action_type)] for action_type, model in ACTION_TYPES.items())
+        + (Annotated[Action, Tag("unknown")],)
+    ],
+    Discriminator(_action_tag),
+]
 
 
 class AccountEvent(BaseModel):
     event_id: str
     account: AccountAddress
     timestamp: int
-    actions: List[Action]
+    actions: List[AnyAction]
     is_scam: bool
     lt: int
     in_progress: bool
@@ -239,7 +477,7 @@ class ValueFlow(BaseModel):
 class Event(BaseModel):
     event_id: str
     timestamp: int
-    actions: List[Action]
+    actions: List[AnyAction]
     value_flow: List[ValueFlow]
     is_scam: bool
     lt: int
@@ -1,9 +1,8 @@
 from enum import Enum
 from typing import Any, List, Optional
 
-from pydantic import BaseModel
-
 from pytonapi.schema._address import Address
+from pytonapi.schema._base import BaseModel
 from pytonapi.schema.accounts import AccountAddress
 from pytonapi.schema.rates import TokenRates
 
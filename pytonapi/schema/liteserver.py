@@ -1,6 +1,8 @@
 from typing import List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import Field
+
+from pytonapi.schema._base import BaseModel
 
 
 class BlockRaw(BaseModel):
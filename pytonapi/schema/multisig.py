@@ -1,8 +1,7 @@
 from typing import List, Optional
 
-from pydantic import BaseModel
-
 from pytonapi.schema._address import Address
+from pytonapi.schema._base import BaseModel
 from pytonapi.schema.jettons import JettonQuantity
 from pytonapi.schema.nft import NftItem
 
@@ -1,6 +1,6 @@
 from typing import Dict, Optional, List, Union
 
-from pydantic import BaseModel
+from pytonapi.schema._base import BaseModel
 
 
 class Rates(BaseModel):
@@ -1,8 +1,7 @@
 from typing import List
 
-from pydantic import BaseModel
-
 from pytonapi.schema._address import Address
+from pytonapi.schema._base import BaseModel
 
 
 class StorageProvider(BaseModel):
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pytonapi.schema._base import BaseModel
 
 
 class TonconnectPayload(BaseModel):
@@ -3,8 +3,7 @@ from __future__ import annotations
 from enum import Enum
 from typing import List, Optional, Union
 
-from pydantic import BaseModel
-
+from pytonapi.schema._base import BaseModel
 from .accounts import AccountAddress
 
 
@@ -1,7 +1,6 @@
 from typing import List, Optional
 
-from pydantic import BaseModel
-
+from pytonapi.schema._base import BaseModel
 from ._address import Address
 
 
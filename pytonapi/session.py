@@ -0,0 +1,88 @@
+import asyncio
+from typing import Optional
+
+import aiohttp
+
+
+class SessionManager:
+    """
+    Owns a single long-lived aiohttp session shared by a client and all of its namespaces.
+
+    The session is created lazily on first use, so the manager can be constructed
+    outside of a running event loop. If the loop that owns the session is gone
+    (for example between ``asyncio.run`` calls), it is closed and a fresh session is opened.
+    """
+
+    def __init__(
+            self,
+            limit: int = 100,
+            limit_per_host: int = 0,
+            ttl_dns_cache: Optional[int] = 300,
+            keepalive_timeout: float = 30.0,
+    ) -> None:
+        """
+        Initialize the SessionManager.
+
+        :param limit: Total number of simultaneous connections. 0 means no limit.
+        :param limit_per_host: Number of simultaneous connections to one host. 0 means no limit.
+        :param ttl_dns_cache: Seconds to cache resolved DNS entries. None caches forever.
+        :param keepalive_timeout: Seconds to keep an idle connection open for reuse.
+        """
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.ttl_dns_cache = ttl_dns_cache
+        self.keepalive_timeout = keepalive_timeout
+
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def closed(self) -> bool:
+        """Whether there is no open session."""
+        return self._session is None or self._session.closed
+
+    def get(self) -> aiohttp.ClientSession:
+        """
+        Get the shared session, opening it if needed.
+
+        :return: The aiohttp session bound to the running event loop.
+        """
+        loop = asyncio.get_running_loop()
+        if self._session is not None and self._loop is not loop:
+            self._close_stale(self._session, self._loop)
+        if self.closed or self._loop is not loop:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                ttl_dns_cache=self.ttl_dns_cache,
+                use_dns_cache=True,
+                keepalive_timeout=self.keepalive_timeout,
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+            self._loop = loop
+        return self._session
+
+    def _close_stale(self, session: aiohttp.ClientSession, loop: Optional[asyncio.AbstractEventLoop]) -> None:
+        """
+        Close a session left behind by another event loop.
+
+        :param session: The session of the other loop.
+        :param loop: The loop that opened it.
+        """
+        if session.closed:
+            return
+        if loop is not None and loop.is_running():
+            # still in use by another thread: close it there
+            asyncio.run_coroutine_threadsafe(session.close(), loop)
+            return
+        # The loop is gone and so are its connections; closing the session only
+        # drops them from the pool, which does not need the old loop.
+        task = asyncio.ensure_future(session.close())
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+
+    async def close(self) -> None:
+        """Close the shared session and release all pooled connections."""
+        session, self._session = self._session, None
+        if session is not None and not session.closed and self._loop is asyncio.get_running_loop():
+            await session.close()
+        self._loop = None
@@ -0,0 +1,70 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, Mapping, Optional, Tuple
+
+
+class RequestCoalescer:
+    """
+    Shares one in-flight call among concurrent callers with the same key.
+
+    The first caller starts the call as a task; callers that arrive while it is
+    running await the same task. The task is shielded, so a cancelled caller does
+    not cancel the call for the others. All callers receive the same result object.
+    """
+
+    def __init__(self) -> None:
+        self._calls: Dict[Hashable, "asyncio.Future[Any]"] = {}
+        self.calls = 0
+        self.shared = 0
+
+    @property
+    def in_flight(self) -> int:
+        """Number of distinct calls currently running."""
+        return len(self._calls)
+
+    def _forget(self, key: Hashable, future: "asyncio.Future[Any]") -> None:
+        self._calls.pop(key, None)
+        if not future.cancelled():
+            future.exception()  # mark as retrieved if every caller has gone away
+
+    async def do(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run ``factory`` unless a call with the same key is already running.
+
+        :param key: The key identifying equal calls.
+        :param factory: Zero-argument coroutine function that performs the call.
+        :return: The result of the shared call.
+        """
+        future = self._calls.get(key)
+        if future is None:
+            self.calls += 1
+            future = asyncio.ensure_future(factory())
+            self._calls[key] = future
+            future.add_done_callback(lambda f: self._forget(key, f))
+        else:
+            self.shared += 1
+        return await asyncio.shield(future)
+
+
+def request_key(
+        method: str,
+        url: str,
+        params: Optional[Mapping[str, Any]] = None,
+        headers: Optional[Mapping[str, Any]] = None,
+) -> Tuple[Any, ...]:
+    """
+    Build a hashable key that is equal for equivalent requests.
+
+    Parameters and headers are compared regardless of their order.
+
+    :param method: The HTTP method.
+    :param url: The request URL.
+    :param params: Query parameters.
+    :param headers: Request headers.
+    :return: The request key.
+    """
+    return (
+        method,
+        url,
+        tuple(sorted((k, str(v)) for k, v in (params or {}).items())),
+        tuple(sorted((k.lower(), str(v)) for k, v in (headers or {}).items())),
+    )
@@ -0,0 +1,325 @@
+import codecs
+import json
+import re
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_NESTED_TOKEN = re.compile(r'["\[\]{}]')
+_STRING_REST = re.compile(r'(?:[^"\\]+|\\.)*(["\\]?)', re.S)
+_SCALAR_END = re.compile(r"[,\]} \t\n\r]")
+
+_OBJECT_START, _FIELDS, _ITEMS, _DONE = range(4)
+
+
+class JSONArrayParser:
+    """
+    Incremental parser that yields the items of one array field of a JSON object.
+
+    Feed it the response body chunk by chunk; every call returns the items completed
+    so far, so only the current item is ever held as text. The end of an item is found
+    by scanning each chunk once, and the item is decoded when it is complete. Other
+    top-level fields are collected into :attr:`fields`.
+    """
+
+    def __init__(self, key: str) -> None:
+        """
+        Initialize the JSONArrayParser.
+
+        :param key: The name of the top-level array field, e.g. ``nft_items``.
+        """
+        self.key = key
+        self.fields: Dict[str, Any] = {}
+
+        self._decoder = json.JSONDecoder()
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._state = _OBJECT_START
+        self._found = False
+
+        # scan of a value that continues in the next chunks
+        self._scanning = False
+        self._scalar = False
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._tail: List[str] = []
+
+    def feed(self, data: bytes) -> List[Any]:
+        """
+        Parse the next chunk of the document.
+
+        :param data: The next chunk of the raw body.
+        :return: Items of the array completed by this chunk.
+        :raises ValueError: If the document is not a JSON object.
+        """
+        text = self._text_decoder.decode(data)
+        if self._scanning:
+            # only the new text is scanned, the value is joined once it is complete
+            self._tail.append(text)
+            if self._scan(text, 0) < 0:
+                return []
+            self._scanning = False
+            text = "".join(self._tail)
+            self._tail = []
+        self._buffer = self._buffer[self._pos:] + text
+        self._pos = 0
+
+        items: List[Any] = []
+        while self._state != _DONE and self._step(items):
+            pass
+        return items
+
+    @property
+    def complete(self) -> bool:
+        """Whether the end of the document has been parsed."""
+        return self._state == _DONE
+
+    def close(self) -> None:
+        """
+        Check that the document is complete.
+
+        :raises ValueError: If the document was truncated or has no such array field.
+        """
+        self._text_decoder.decode(b"", final=True)
+        if self._state != _DONE:
+            raise ValueError("Truncated or invalid JSON document")
+        if not self._found:
+            raise ValueError(f"No '{self.key}' array in the JSON document")
+
+    def _skip(self, pos: int) -> int:
+        return _WHITESPACE.match(self._buffer, pos).end()
+
+    def _decode(self, pos: int) -> Tuple[Any, int]:
+        """Decode the value at ``pos``; return an end of -1 if it continues in the next chunk."""
+        char = self._buffer[pos]
+        self._scalar = char not in "[{\""
+        self._depth = 0
+        self._in_string = char == '"'
+        self._escape = False
+        end = self._scan(self._buffer, pos + 1 if self._in_string else pos)
+        if end < 0:
+            self._scanning = True
+            return None, -1
+        value, decoded_end = self._decoder.raw_decode(self._buffer, pos)
+        if decoded_end != end:
+            raise ValueError("Invalid JSON value")
+        return value, end
+
+    def _scan(self, text: str, pos: int) -> int:
+        """Scan ``text`` for the end of the current value; return the index after it or -1."""
+        if self._scalar:
+            # a number or literal ends at the next "," "]" "}" or whitespace
+            match = _SCALAR_END.search(text, pos)
+            return match.start() if match else -1
+        while True:
+            if self._escape:
+                if pos >= len(text):
+                    return -1
+                self._escape = False
+                pos += 1
+            if self._in_string:
+                # the closing quote, or a backslash that escapes the first char of the next chunk
+                match = _STRING_REST.match(text, pos)
+                if match.group(1) != '"':
+                    self._escape = match.group(1) == "\\"
+                    return -1
+                pos = match.end()
+                self._in_string = False
+                if not self._depth:
+                    return pos
+                continue
+            match = _NESTED_TOKEN.search(text, pos)
+            if match is None:
+                return -1
+            pos = match.end()
+            char = match.group()
+            if char == '"':
+                self._in_string = True
+            elif char in "[{":
+                self._depth += 1
+            else:
+                self._depth -= 1
+                if not self._depth:
+                    return pos
+
+    def _step(self, items: List[Any]) -> bool:
+        """Consume one token group; return False if more data is needed."""
+        buffer = self._buffer
+        pos = self._skip(self._pos)
+        if pos >= len(buffer):
+            return False
+        char = buffer[pos]
+
+        if self._state == _OBJECT_START:
+            if char != "{":
+                raise ValueError("Expected a JSON object")
+            self._pos = pos + 1
+            self._state = _FIELDS
+            return True
+
+        if self._state == _ITEMS:
+            if char == ",":
+                self._pos = pos + 1
+                return True
+            if char == "]":
+                self._pos = pos + 1
+                self._state = _FIELDS
+                return True
+            item, end = self._decode(pos)
+            if end < 0:
+                return False
+            items.append(item)
+            self._pos = end
+            return True
+
+        # _FIELDS: a "key": value pair, a separator or the end of the object
+        if char == ",":
+            self._pos = pos + 1
+            return True
+        if char == "}":
+            self._pos = pos + 1
+            self._state = _DONE
+            return True
+
+        key, end = self._decode(pos)
+        if end < 0:
+            return False
+        if not isinstance(key, str):
+            raise ValueError("Expected a JSON object key")
+        pos = self._skip(end)
+        if pos >= len(buffer):
+            return False
+        if buffer[pos] != ":":
+            raise ValueError("Expected ':' after a JSON object key")
+        pos = self._skip(pos + 1)
+        if pos >= len(buffer):
+            return False
+
+        if key == self.key and buffer[pos] == "[":
+            self._found = True
+            self._pos = pos + 1
+            self._state = _ITEMS
+            return True
+
+        value, end = self._decode(pos)
+        if end < 0:
+            return False
+        self.fields[key] = value
+        self._pos = end
+        return True
+
+
+_BOM = b"\xef\xbb\xbf"
+
+
+class SSEEvent(NamedTuple):
+    """A dispatched Server-Sent Event."""
+    event: str
+    data: bytes
+    id: Optional[str] = None
+
+
+class SSEParser:
+    """
+    Incremental parser of a ``text/event-stream`` body.
+
+    Implements the framing of the HTML standard on bytes: CRLF, LF and CR line endings,
+    comments, multi-line ``data`` fields, ``event``, ``id`` and ``retry``. Lines are not
+    decoded to text, so the data of an event can be passed to the JSON codec as is,
+    and a line may be of any length. Events with empty data are not dispatched.
+
+    :attr:`last_event_id` and :attr:`retry` outlive a connection: to reconnect, call
+    :meth:`reset`, send ``last_event_id`` as the ``Last-Event-ID`` header and wait ``retry``
+    milliseconds if the server has set it.
+    """
+
+    def __init__(self) -> None:
+        self.last_event_id = ""
+        self.retry: Optional[int] = None
+
+        self._parts: List[bytes] = []  # pieces of the unfinished line
+        self._data: List[bytes] = []
+        self._event = b""
+        self._skip_lf = False
+        self._started = False
+
+    def reset(self) -> None:
+        """Drop the unfinished line and event of a broken connection."""
+        self._parts = []
+        self._data = []
+        self._event = b""
+        self._skip_lf = False
+        self._started = False
+
+    def feed(self, chunk: bytes) -> List[SSEEvent]:
+        """
+        Parse the next chunk of the stream.
+
+        :param chunk: The next chunk of the raw body.
+        :return: Events completed by this chunk.
+        """
+        if self._skip_lf and chunk[:1] == b"\n":
+            chunk = chunk[1:]
+        self._skip_lf = False
+        if not self._started:
+            chunk = b"".join(self._parts) + chunk  # at most the first bytes of a BOM
+            self._parts = []
+            if len(chunk) < len(_BOM) and _BOM.startswith(chunk):
+                self._parts.append(chunk)
+                return []
+            self._started = True
+            if chunk.startswith(_BOM):
+                chunk = chunk[len(_BOM):]
+
+        # Only the new chunk is scanned; the pieces of a long line are joined once, when it ends.
+        if b"\r" in chunk:
+            # a CR at the end may be the first half of a CRLF split between chunks
+            self._skip_lf = chunk.endswith(b"\r")
+            chunk = chunk.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+        if b"\n" not in chunk:
+            if chunk:
+                self._parts.append(chunk)
+            return []
+        lines = chunk.split(b"\n")
+        tail = lines.pop()
+        if self._parts:
+            self._parts.append(lines[0])
+            lines[0] = b"".join(self._parts)
+            self._parts = []
+        if tail:
+            self._parts.append(tail)
+
+        events: List[SSEEvent] = []
+        data = self._data
+        for line in lines:
+            if line.startswith(b"data: "):  # the common cases, without a call
+                data.append(line[6:])
+            elif line.startswith(b"event: "):
+                self._event = line[7:]
+            elif not line:
+                if data:
+                    value = data[0] if len(data) == 1 else b"\n".join(data)
+                    if value:
+                        event = self._event.decode(errors="replace") if self._event else "message"
+                        events.append(SSEEvent(event, value, self.last_event_id or None))
+                    data.clear()
+                self._event = b""
+            elif line[0] != 0x3A:  # lines starting with ":" are comments
+                self._field(line)
+        return events
+
+    def _field(self, line: bytes) -> None:
+        field, colon, value = line.partition(b":")
+        if colon and value[:1] == b" ":
+            value = value[1:]
+        if field == b"data":
+            self._data.append(value)
+        elif field == b"event":
+            self._event = value
+        elif field == b"id":
+            if b"\0" not in value:
+                self.last_event_id = value.decode(errors="replace")
+        elif field == b"retry":
+            if value.isdigit():
+                self.retry = int(value)
@@ -1,7 +1,18 @@
-from typing import Any, Dict, Optional
+from __future__ import annotations
+
+from functools import cached_property
+from typing import Any, Dict, Mapping, Optional, Union
 
 from pytonapi import methods
 from pytonapi.base import AsyncTonapiClientBase
+from pytonapi.balancer import EndpointBalancer
+from pytonapi.cache import CachePolicy, ResponseCache
+from pytonapi.codec import JSONCodec
+from pytonapi.core import ResponseMode
+from pytonapi.hedging import HedgePolicy
+from pytonapi.keypool import APIKeyPool
+from pytonapi.retry import RetryPolicy
+from pytonapi.session import SessionManager
 
 __all__ = [
     "AsyncTonapi",
@@ -21,19 +32,29 @@ class AsyncTonapi(AsyncTonapiClientBase):
             headers: Optional[Dict[str, Any]] = None,
             timeout: Optional[float] = None,
             debug: bool = False,
+            session: Optional[SessionManager] = None,
+            rps: Optional[float] = None,
+            burst: Optional[int] = None,
+            retry_policy: Optional[RetryPolicy] = None,
+            coalesce_requests: bool = False,
+            cache: Optional[ResponseCache] = None,
+            cache_policy: Optional[CachePolicy] = None,
+            batch_window: float = 0.005,
+            batch_size: int = 100,
+            json_codec: Optional[JSONCodec] = None,
+            response_mode: Union[ResponseMode, str] = ResponseMode.model,
+            key_pool: Optional[APIKeyPool] = None,
+            hedge_policy: Optional[HedgePolicy] = None,
+            balancer: Optional[EndpointBalancer] = None,
+            max_concurrency: Optional[int] = None,
+            priority_weights: Optional[Mapping[str, float]] = None,
+            sse_idle_timeout: Optional[float] = 60.0,
             **kwargs,
     ) -> None:
         """
         Initialize the AsyncTonapiClient.
 
-        :param api_key: The API key.
-        :param is_testnet: Use True if using the testnet.
-        :param max_retries: Maximum number of retries per request if rate limit is reached.
-        :param base_url: The base URL for the API.
-        :param websocket_url: The URL for the WebSocket server.
-        :param headers: Additional headers to include in requests.
-        :param timeout: Request timeout in seconds.
-        :param debug: Enable debug mode.
+        Takes the parameters of :class:`~pytonapi.core.ClientCore`, which documents them.
         """
         super().__init__(
             api_key=api_key,
@@ -44,93 +65,110 @@ class AsyncTonapi(AsyncTonapiClientBase):
             headers=headers,
             timeout=timeout,
             debug=debug,
+            session=session,
+            rps=rps,
+            burst=burst,
+            retry_policy=retry_policy,
+            coalesce_requests=coalesce_requests,
+            cache=cache,
+            cache_policy=cache_policy,
+            batch_window=batch_window,
+            batch_size=batch_size,
+            json_codec=json_codec,
+            response_mode=response_mode,
+            key_pool=key_pool,
+            hedge_policy=hedge_policy,
+            balancer=balancer,
+            max_concurrency=max_concurrency,
+            priority_weights=priority_weights,
+            sse_idle_timeout=sse_idle_timeout,
             **kwargs,
         )
 
-    @property
+    @cached_property
     def blockchain(self) -> methods.BlockchainMethod:
-        return methods.BlockchainMethod(**self.__dict__)
+        return methods.BlockchainMethod.from_core(self.core)
 
-    @property
+    @cached_property
     def accounts(self) -> methods.AccountsMethod:
-        return methods.AccountsMethod(**self.__dict__)
+        return methods.AccountsMethod.from_core(self.core)
 
-    @property
+    @cached_property
     def jettons(self) -> methods.JettonsMethod:
-        return methods.JettonsMethod(**self.__dict__)
+        return methods.JettonsMethod.from_core(self.core)
 
-    @property
+    @cached_property
     def liteserver(self) -> methods.LiteserverMethod:
-        return methods.LiteserverMethod(**self.__dict__)
+        return methods.LiteserverMethod.from_core(self.core)
 
-    @property
+    @cached_property
     def multisig(self) -> methods.MultisigMethod:
-        return methods.MultisigMethod(**self.__dict__)
+        return methods.MultisigMethod.from_core(self.core)
 
-    @property
+    @cached_property
     def dns(self) -> methods.DnsMethod:
-        return methods.DnsMethod(**self.__dict__)
+        return methods.DnsMethod.from_core(self.core)
 
-    @property
+    @cached_property
     def emulate(self) -> methods.EmulateMethod:
-        return methods.EmulateMethod(**self.__dict__)
+        return methods.EmulateMethod.from_core(self.core)
 
-    @property
+    @cached_property
     def events(self) -> methods.EventsMethod:
-        return methods.EventsMethod(**self.__dict__)
+        return methods.EventsMethod.from_core(self.core)
 
-    @property
+    @cached_property
     def gasless(self) -> methods.GaslessMethod:
-        return methods.GaslessMethod(**self.__dict__)
+        return methods.GaslessMethod.from_core(self.core)
 
-    @property
+    @cached_property
     def nft(self) -> methods.NftMethod:
-        return methods.NftMethod(**self.__dict__)
+        return methods.NftMethod.from_core(self.core)
 
-    @property
+    @cached_property
     def purchases(self) -> methods.PurchasesMethod:
-        return methods.PurchasesMethod(**self.__dict__)
+        return methods.PurchasesMethod.from_core(self.core)
 
-    @property
+    @cached_property
     def rates(self) -> methods.RatesMethod:
-        return methods.RatesMethod(**self.__dict__)
+        return methods.RatesMethod.from_core(self.core)
 
-    @property
+    @cached_property
     def sse(self) -> methods.SSEMethod:
-        return methods.SSEMethod(**self.__dict__)
+        return methods.SSEMethod.from_core(self.core)
 
-    @property
+    @cached_property
     def staking(self) -> methods.StakingMethod:
-        return methods.StakingMethod(**self.__dict__)
+        return methods.StakingMethod.from_core(self.core)
 
-    @property
+    @cached_property
     def storage(self) -> methods.StorageMethod:
-        return methods.StorageMethod(**self.__dict__)
+        return methods.StorageMethod.from_core(self.core)
 
-    @property
+    @cached_property
     def tonconnect(self) -> methods.TonconnectMethod:
-        return methods.TonconnectMethod(**self.__dict__)
+        return methods.TonconnectMethod.from_core(self.core)
 
-    @property
+    @cached_property
     def traces(self) -> methods.TracesMethod:
-        return methods.TracesMethod(**self.__dict__)
+        return methods.TracesMethod.from_core(self.core)
 
-    @property
+    @cached_property
     def utilities(self) -> methods.UtilitiesMethod:
-        return methods.UtilitiesMethod(**self.__dict__)
+        return methods.UtilitiesMethod.from_core(self.core)
 
-    @property
+    @cached_property
     def wallet(self) -> methods.WalletMethod:
-        return methods.WalletMethod(**self.__dict__)
+        return methods.WalletMethod.from_core(self.core)
 
-    @property
+    @cached_property
     def webhooks(self) -> methods.WebhooksMethod:
-        return methods.WebhooksMethod(**self.__dict__)
+        return methods.WebhooksMethod.from_core(self.core)
 
-    @property
+    @cached_property
     def websocket(self) -> methods.WebSocketMethod:
-        return methods.WebSocketMethod(**self.__dict__)
+        return methods.WebSocketMethod.from_core(self.core)
 
-    @property
+    @cached_property
     def extra_currency(self) -> methods.ExtraCurrencyMethod:
-        return methods.ExtraCurrencyMethod(**self.__dict__)
+        return methods.ExtraCurrencyMethod.from_core(self.core)
@@ -5,6 +5,7 @@ from typing import Union
 __all__ = [
     "raw_to_userfriendly",
     "userfriendly_to_raw",
+    "normalize_address",
     "to_amount",
     "to_nano"
 ]
@@ -64,6 +65,39 @@ def userfriendly_to_raw(address: str) -> str:
     return f"{workchain_id}:{key}"
 
 
+def normalize_address(address: str) -> str:
+    """
+    Converts a TON address in raw or user-friendly format to the canonical raw format,
+    so that different notations of the same address compare equal.
+
+    :param address: The TON address in raw or user-friendly format.
+    :return: The TON address in raw format with a lowercase key.
+    :raises ValueError: If the value is not a TON address (e.g. a DNS name).
+    """
+    if ":" in address:
+        workchain_id_str, key = address.split(":", 1)
+        if len(key) != 64:
+            raise ValueError(f"Invalid raw address: {address}")
+        return f"{int(workchain_id_str)}:{bytes.fromhex(key).hex()}"
+    if len(address) != 48:
+        raise ValueError(f"Invalid user-friendly address: {address}")
+    return userfriendly_to_raw(address)
+
+
+def address_key(address: str) -> str:
+    """
+    Returns a key under which notations of the same address compare equal. Unlike
+    :func:`normalize_address`, it accepts any account ID the API does.
+
+    :param address: The TON address in raw or user-friendly format, or another account ID (e.g. a DNS name).
+    :return: The TON address in raw format, or the value as is if it is not a TON address.
+    """
+    try:
+        return normalize_address(address)
+    except ValueError:
+        return address
+
+
 def to_amount(value: int, decimals: int = 9, precision: int = 2) -> Union[float, int]:
     """
     Converts a value from nanoton to TON and rounds it to the specified precision.
@@ -16,6 +16,9 @@ setuptools.setup(
         "aiohttp>=3.9.0,<=3.12.2",
         "pydantic>=2.4.1,<=2.11.5",
     ],
+    extras_require={
+        "speedups": ["orjson>=3.9.0"],
+    },
     classifiers=[
         "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3.10",
@@ -0,0 +1,90 @@
+from unittest import TestCase
+
+from pytonapi.schema.events import (
+    AccountEvent,
+    Action,
+    JettonSwapEventAction,
+    TonTransferAction,
+    TonTransferEventAction,
+)
+
+ACCOUNT = {"address": "0:" + "a" * 64, "is_scam": False, "is_wallet": True}
+PREVIEW = {"name": "Ton Transfer", "description": "Transferring 1 TON", "accounts": [ACCOUNT]}
+
+
+def make_event(*actions: dict) -> dict:
+    return {
+        "event_id": "e", "account": ACCOUNT, "timestamp": 1, "actions": list(actions),
+        "is_scam": False, "lt": 1, "in_progress": False, "extra": 0,
+    }
+
+
+class TestActionParsing(TestCase):
+
+    def test_action_is_parsed_by_type(self):
+        action = {
+            "type": "TonTransfer", "status": "ok", "simple_preview": PREVIEW,
+            "TonTransfer": {"sender": ACCOUNT, "recipient": ACCOUNT, "amount": 10},
+        }
+        parsed = AccountEvent(**make_event(action)).actions[0]
+
+        self.assertIsInstance(parsed, TonTransferEventAction)
+        self.assertIsInstance(parsed, Action)
+        self.assertIsInstance(parsed.payload, TonTransferAction)
+        self.assertIs(parsed.TonTransfer, parsed.payload)
+        self.assertIsNone(parsed.JettonSwap)
+
+    def test_other_payloads_are_ignored(self):
+        action = {
+            "type": "TonTransfer", "status": "ok", "simple_preview": PREVIEW,
+            "TonTransfer": {"sender": ACCOUNT, "recipient": ACCOUNT, "amount": 10},
+            "JettonSwap": {"broken": True},
+        }
+        parsed = AccountEvent(**make_event(action)).actions[0]
+        self.assertIsNone(parsed.JettonSwap)
+
+    def test_unknown_type_is_kept(self):
+        action = {"type": "SomethingNew", "status": "ok", "simple_preview": PREVIEW, "SomethingNew": {}}
+        parsed = AccountEvent(**make_event(action)).actions[0]
+
+        self.assertIs(type(parsed), Action)
+        self.assertIsNone(parsed.payload)
+        self.assertIsNone(parsed.TonTransfer)
+        with self.assertRaises(AttributeError):
+            parsed.unknown_attribute
+
+    def test_dispatch(self):
+        swap = {
+            "type": "JettonSwap", "status": "ok", "simple_preview": PREVIEW,
+            "JettonSwap": {
+                "dex": "stonfi", "amount_in": "1", "amount_out": "2",
+                "user_wallet": ACCOUNT, "router": ACCOUNT,
+            },
+        }
+        parsed = AccountEvent(**make_event(swap)).actions[0]
+
+        self.assertIsInstance(parsed, JettonSwapEventAction)
+        self.assertEqual(parsed.payload.dex, "stonfi")
+
+    def test_dump_keeps_the_former_shape(self):
+        transfer = {"sender": ACCOUNT, "recipient": ACCOUNT, "amount": 10}
+        action = {"type": "TonTransfer", "status": "ok", "simple_preview": PREVIEW, "TonTransfer": transfer}
+        event = AccountEvent(**make_event(action))
+
+        dumped = event.model_dump()["actions"][0]
+        payload_types = [
+            "TonTransfer", "ContractDeploy", "JettonTransfer", "JettonBurn", "JettonMint",
+            "NftItemTransfer", "Subscribe", "UnSubscribe", "AuctionBid", "NftPurchase",
+            "DepositStake", "WithdrawStake", "WithdrawStakeRequest", "ElectionsDepositStake",
+            "ElectionsRecoverStake", "JettonSwap", "SmartContractExec", "DomainRenew",
+            "InscriptionTransfer", "InscriptionMint",
+        ]
+        self.assertEqual(list(dumped), ["type", "status"] + payload_types + ["simple_preview"])
+        self.assertEqual([key for key in payload_types if dumped[key] is not None], ["TonTransfer"])
+        self.assertEqual(
+            list(event.model_dump(exclude_none=True)["actions"][0]),
+            ["type", "status", "TonTransfer", "simple_preview"],
+        )
+
+        self.assertEqual(AccountEvent(**event.model_dump()), event)
+        self.assertEqual(AccountEvent.model_validate_json(event.model_dump_json()), event)
@@ -0,0 +1,144 @@
+import asyncio
+from unittest import IsolatedAsyncioTestCase, TestCase
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from pytonapi import AsyncTonapi
+from pytonapi.balancer import EndpointBalancer
+from pytonapi.retry import RetryPolicy
+from pytonapi.scheduler import Priority
+
+
+class TestEndpointBalancer(TestCase):
+
+    def test_least_requests(self):
+        balancer = EndpointBalancer(["http://a", "http://b"])
+        a = balancer.acquire()
+        b = balancer.acquire()
+        self.assertEqual((a.url, b.url), ("http://a/", "http://b/"))
+        balancer.release(b, 0.1)
+        self.assertIs(balancer.select(), b)
+
+    def test_ewma(self):
+        balancer = EndpointBalancer(["http://a", "http://b"], strategy="ewma", decay=0.5)
+        a, b = balancer.endpoints
+        balancer.release(balancer.acquire(), 0.4)
+        self.assertIs(balancer.select(), b)  # no samples yet
+        balancer.release(balancer.acquire(), 0.1)
+        self.assertIs(balancer.select(), b)
+        balancer.release(balancer.acquire(), 0.9)
+        self.assertAlmostEqual(b.latency, 0.5)
+        self.assertIs(balancer.select(), a)
+
+    def test_ejection(self):
+        balancer = EndpointBalancer(["http://a", "http://b"], eject_after=2, max_latency=1.0)
+        a, b = balancer.endpoints
+        balancer.release(balancer.acquire(), failed=True)
+        self.assertFalse(a.ejected)
+        a.in_flight = 0
+        balancer.release(a, failed=True)
+        self.assertTrue(a.ejected)
+        self.assertIs(balancer.select(), b)
+
+        balancer.release(balancer.acquire(), 2.0)
+        self.assertTrue(b.ejected)
+        self.assertIn(balancer.select(), (a, b))  # all ejected: fall back to all endpoints
+
+
+class TestHealthCheck(IsolatedAsyncioTestCase):
+
+    async def test_lag_and_failures(self):
+        balancer = EndpointBalancer(["http://a", "http://b", "http://c"], max_lag=10)
+
+        async def probe(endpoint):
+            if endpoint.url == "http://c/":
+                raise ConnectionError("down")
+            return (1, 1000) if endpoint.url == "http://a/" else (2, 980)
+
+        await balancer.check(probe)
+        a, b, c = balancer.endpoints
+        self.assertEqual((a.lag, a.healthy), (1.0, True))
+        self.assertEqual((b.lag, b.healthy), (20.0, False))
+        self.assertFalse(c.healthy)
+        self.assertIs(balancer.select(), a)
+
+
+class TestBalancedClient(IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self) -> None:
+        self.hits = {"bad": 0, "good": 0}
+        self.webhook_hits = []
+
+        def make_app(name, lag):
+            async def rates(request: web.Request) -> web.Response:
+                self.hits[name] += 1
+                if name == "bad":
+                    return web.Response(status=502, text="bad gateway")
+                return web.json_response({"rates": {}})
+
+            async def status(request: web.Request) -> web.Response:
+                return web.json_response(
+                    {"rest_online": True, "indexing_latency": lag, "last_known_masterchain_seqno": 1}
+                )
+
+            async def get_time(request: web.Request) -> web.Response:
+                return web.json_response({"time": 1000})
+
+            async def webhooks(request: web.Request) -> web.Response:
+                self.webhook_hits.append(name)
+                return web.json_response({"webhooks": []})
+
+            app = web.Application()
+            app.router.add_get("/v2/rates", rates)
+            app.router.add_get("/v2/status", status)
+            app.router.add_get("/v2/liteserver/get_time", get_time)
+            app.router.add_get("/webhooks", webhooks)
+            return app
+
+        self.bad = TestServer(make_app("bad", 0))
+        self.good = TestServer(make_app("good", 0))
+        self.lagging = TestServer(make_app("good", 600))
+        for server in (self.bad, self.good, self.lagging):
+            await server.start_server()
+
+    async def asyncTearDown(self) -> None:
+        for server in (self.bad, self.good, self.lagging):
+            await server.close()
+
+    async def test_failing_endpoint_is_ejected(self):
+        balancer = EndpointBalancer(
+            [str(self.bad.make_url("/")), str(self.good.make_url("/"))], eject_after=1, check_interval=None,
+        )
+        retry_policy = RetryPolicy(max_retries=1, base_delay=0)
+        async with AsyncTonapi(api_key="", balancer=balancer, retry_policy=retry_policy) as tonapi:
+            await tonapi.rates.get_prices(tokens=["ton"], currencies=["usd"])
+            await tonapi.rates.get_prices(tokens=["ton"], currencies=["usd"])
+        self.assertEqual(self.hits, {"bad": 1, "good": 2})
+        self.assertTrue(balancer.endpoints[0].ejected)
+        self.assertEqual([endpoint.in_flight for endpoint in balancer.endpoints], [0, 0])
+
+    async def test_health_checks_run_in_background(self):
+        balancer = EndpointBalancer([str(self.lagging.make_url("/")), str(self.good.make_url("/"))])
+        async with AsyncTonapi(api_key="", balancer=balancer) as tonapi:
+            await tonapi.rates.get_prices(tokens=["ton"], currencies=["usd"])
+            await asyncio.sleep(0.1)
+            self.assertEqual([endpoint.healthy for endpoint in balancer.endpoints], [False, True])
+        self.assertIsNone(balancer._task)
+
+    async def test_namespace_with_own_host_bypasses_balancer(self):
+        balancer = EndpointBalancer([str(self.good.make_url("/"))], check_interval=None)
+        async with AsyncTonapi(api_key="", balancer=balancer) as tonapi:
+            tonapi.webhooks.base_url = str(self.bad.make_url("/"))
+            await tonapi.webhooks.list_webhooks()
+        self.assertEqual(self.webhook_hits, ["bad"])
+        self.assertEqual(balancer.endpoints[0].requests, 0)
+
+    async def test_health_checks_count_against_rate_limit(self):
+        balancer = EndpointBalancer([str(self.good.make_url("/")), str(self.lagging.make_url("/"))])
+        async with AsyncTonapi(api_key="", balancer=balancer, rps=50, burst=1) as tonapi:
+            await tonapi.rates.get_prices(tokens=["ton"], currencies=["usd"])
+            await asyncio.sleep(0.15)
+            self.assertEqual(tonapi.scheduler.dispatched[Priority.interactive], 4)
+            self.assertEqual([endpoint.healthy for endpoint in balancer.endpoints], [True, False])
+        self.assertEqual(tonapi.scheduler.active, 0)
@@ -0,0 +1,59 @@
+import asyncio
+from unittest import IsolatedAsyncioTestCase
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from pytonapi import AsyncTonapi, schema
+from pytonapi.batching import BatchLoader
+from pytonapi.exceptions import TONAPINotFoundError
+
+ACCOUNT_IDS = [f"0:{i:064x}" for i in range(250)]
+
+
+class TestBatchLoader(IsolatedAsyncioTestCase):
+
+    async def test_loads_are_batched(self):
+        batches = []
+
+        async def batch_fn(keys):
+            batches.append(keys)
+            return {key: key * 2 for key in keys if key != 3}
+
+        loader = BatchLoader(batch_fn, max_batch_size=4)
+        results = await asyncio.gather(*(loader.load(i) for i in [1, 2, 2, 4, 5, 6]))
+        self.assertEqual(results, [2, 4, 4, 8, 10, 12])
+        self.assertEqual(batches, [[1, 2, 4, 5], [6]])
+
+        with self.assertRaises(TONAPINotFoundError):
+            await loader.load(3)
+
+
+class TestLoadInfo(IsolatedAsyncioTestCase):
+
+    async def test_accounts_load_info(self):
+        requests = []
+
+        async def bulk(request: web.Request) -> web.Response:
+            account_ids = (await request.json())["account_ids"]
+            requests.append(account_ids)
+            accounts = [
+                {"address": account_id, "balance": 1, "last_activity": 0, "status": "active",
+                 "get_methods": [], "is_wallet": True}
+                for account_id in account_ids
+            ]
+            return web.json_response({"accounts": accounts})
+
+        app = web.Application()
+        app.router.add_post("/v2/accounts/_bulk", bulk)
+        server = TestServer(app)
+        await server.start_server()
+        tonapi = AsyncTonapi(api_key="", base_url=str(server.make_url("/")))
+        try:
+            accounts = await asyncio.gather(*(tonapi.accounts.load_info(i) for i in ACCOUNT_IDS))
+            self.assertEqual(len(requests), 3)
+            self.assertIsInstance(accounts[0], schema.accounts.Account)
+            self.assertEqual([a.address.root for a in accounts], ACCOUNT_IDS)
+        finally:
+            await tonapi.aclose()
+            await server.close()
@@ -0,0 +1,54 @@
+from unittest import IsolatedAsyncioTestCase
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from pytonapi import AsyncTonapi
+from pytonapi.exceptions import TONAPIBulkRequestError
+
+ACCOUNT_IDS = [f"0:{i:064x}" for i in range(250)]
+BROKEN_ID = ACCOUNT_IDS[120]
+
+
+def make_account(account_id: str) -> dict:
+    return {
+        "address": account_id, "balance": 1, "last_activity": 0,
+        "status": "active", "get_methods": [], "is_wallet": True,
+    }
+
+
+class TestChunkedBulkRequests(IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self) -> None:
+        self.requests = []
+
+        async def bulk(request: web.Request) -> web.Response:
+            account_ids = (await request.json())["account_ids"]
+            self.requests.append(account_ids)
+            if BROKEN_ID in account_ids:
+                return web.json_response({"error": "bad address"}, status=400)
+            return web.json_response({"accounts": [make_account(i) for i in account_ids]})
+
+        app = web.Application()
+        app.router.add_post("/v2/accounts/_bulk", bulk)
+        self.server = TestServer(app)
+        await self.server.start_server()
+        self.tonapi = AsyncTonapi(api_key="", base_url=str(self.server.make_url("/")))
+
+    async def asyncTearDown(self) -> None:
+        await self.tonapi.aclose()
+        await self.server.close()
+
+    async def test_results_are_merged_in_order(self):
+        account_ids = ACCOUNT_IDS[:100] + ACCOUNT_IDS[150:]
+        response = await self.tonapi.accounts.get_bulk_info(account_ids, chunk_size=40)
+        self.assertEqual(len(self.requests), 5)
+        self.assertEqual([a.address.root for a in response.accounts], account_ids)
+
+    async def test_failed_chunk_keeps_the_rest(self):
+        with self.assertRaises(TONAPIBulkRequestError) as ctx:
+            await self.tonapi.accounts.get_bulk_info(ACCOUNT_IDS, chunk_size=100)
+        error = ctx.exception
+        self.assertEqual(len(error.errors), 1)
+        self.assertEqual(error.errors[0][0], ACCOUNT_IDS[100:200])
+        self.assertEqual(len(error.result.accounts), 150)
@@ -0,0 +1,84 @@
+import asyncio
+from unittest import IsolatedAsyncioTestCase, TestCase
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from pytonapi import AsyncTonapi
+from pytonapi.cache import CachePolicy, LRUCache, ResponseCache, is_trace_finished
+
+
+class TestLRUCache(IsolatedAsyncioTestCase):
+
+    async def test_eviction_and_stats(self):
+        cache = LRUCache(maxsize=2)
+        await cache.set("a", 1)
+        await cache.set("b", 2)
+        await cache.get("a")
+        await cache.set("c", 3)
+        self.assertIsNone(await cache.get("b"))
+        self.assertEqual(await cache.get("a"), 1)
+        self.assertEqual(cache.stats.evictions, 1)
+        self.assertEqual(cache.stats.hits, 2)
+        self.assertEqual(cache.stats.misses, 1)
+
+    async def test_ttl(self):
+        cache = LRUCache()
+        await cache.set("a", 1, ttl=0.01)
+        await asyncio.sleep(0.02)
+        self.assertIsNone(await cache.get("a"))
+        self.assertEqual(cache.stats.expirations, 1)
+
+    async def test_incomplete_backend_fails_on_creation(self):
+        class GetOnlyCache(ResponseCache):
+            async def get(self, key):
+                return None
+
+        with self.assertRaises(TypeError):
+            GetOnlyCache()
+
+
+class TestCachePolicy(TestCase):
+
+    def test_default_rules(self):
+        policy = CachePolicy()
+        self.assertIsNone(policy.match("v2/blockchain/transactions/abc").ttl)
+        self.assertIsNone(policy.match("v2/blockchain/masterchain/123/config").ttl)
+        self.assertEqual(policy.match("/v2/rates").ttl, 30)
+        self.assertIsNotNone(policy.match("v2/accounts/EQabc"))
+        self.assertIsNone(policy.match("v2/accounts/search"))
+        self.assertIsNone(policy.match("v2/accounts/EQabc/events"))
+        self.assertIsNone(policy.match("v2/blockchain/masterchain-head"))
+
+    def test_trace_finished(self):
+        transaction = {"out_msgs": [{"msg_type": "int_msg"}, {"msg_type": "ext_out_msg"}]}
+        leaf = {"transaction": {"out_msgs": []}}
+        self.assertFalse(is_trace_finished({"transaction": transaction}))
+        self.assertTrue(is_trace_finished({"transaction": transaction, "children": [leaf]}))
+        self.assertFalse(is_trace_finished({"transaction": transaction, "children": [leaf], "emulated": True}))
+
+
+class TestCachedRequests(IsolatedAsyncioTestCase):
+
+    async def test_immutable_endpoint_is_cached(self):
+        calls = 0
+
+        async def handler(request: web.Request) -> web.Response:
+            nonlocal calls
+            calls += 1
+            return web.json_response({"hash": request.match_info["id"]})
+
+        app = web.Application()
+        app.router.add_get("/v2/blockchain/transactions/{id}", handler)
+        server = TestServer(app)
+        await server.start_server()
+        cache = LRUCache()
+        tonapi = AsyncTonapi(api_key="", base_url=str(server.make_url("/")), cache=cache)
+        try:
+            for _ in range(3):
+                await tonapi.blockchain._get("v2/blockchain/transactions/abc")
+            self.assertEqual(calls, 1)
+            self.assertEqual(cache.stats.hits, 2)
+        finally:
+            await tonapi.aclose()
+            await server.close()
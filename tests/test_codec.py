@@ -0,0 +1,26 @@
+from unittest import TestCase
+
+from pytonapi.codec import JSONCodec, get_codec
+
+DOCUMENT = b'{"balance": 1000000000, "amounts": [340282366920938463463374607431768211455], "name": "\xd1\x82\xd0\xbe\xd0\xbd"}'
+
+
+class TestJSONCodec(TestCase):
+
+    def test_codecs_agree(self):
+        expected = JSONCodec().loads(DOCUMENT)
+        for name in ("orjson", "msgspec", "json"):
+            try:
+                codec = get_codec(name)
+            except ImportError:
+                continue
+            with self.subTest(codec=name):
+                self.assertEqual(codec.loads(DOCUMENT), expected)
+                self.assertEqual(codec.loads(codec.dumps(expected)), expected)
+                with self.assertRaises(ValueError):
+                    codec.loads(b"not json")
+
+    def test_large_integers_keep_precision(self):
+        value = get_codec().loads(DOCUMENT)["amounts"][0]
+        self.assertIsInstance(value, int)
+        self.assertEqual(value, 2 ** 128 - 1)
@@ -0,0 +1,19 @@
+from tests import TestAsyncTonapi
+
+
+class TestClientCore(TestAsyncTonapi):
+
+    async def test_namespaces_are_built_once(self):
+        self.assertIs(self.tonapi.accounts, self.tonapi.accounts)
+        self.assertIs(self.tonapi.accounts.core, self.tonapi.core)
+        self.assertIs(self.tonapi.blockchain.core, self.tonapi.core)
+
+    async def test_core_attributes_are_shared(self):
+        self.tonapi.timeout = 5
+        self.assertEqual(self.tonapi.nft.timeout, 5)
+        self.assertIs(self.tonapi.nft.logger, self.tonapi.logger)
+
+    async def test_webhooks_keep_their_base_url(self):
+        self.assertEqual(self.tonapi.webhooks.base_url, "https://rt.tonapi.io/")
+        self.assertEqual(self.tonapi.accounts.base_url, self.tonapi.core.base_url)
+        self.assertNotEqual(self.tonapi.core.base_url, "https://rt.tonapi.io/")
@@ -0,0 +1,129 @@
+import asyncio
+import json
+import random
+from unittest import IsolatedAsyncioTestCase
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from pytonapi import AsyncTonapi
+from pytonapi.dispatch import KeyedDispatcher
+
+
+class TestKeyedDispatcher(IsolatedAsyncioTestCase):
+
+    async def test_order_per_key(self):
+        handled = {"a": [], "b": [], "c": []}
+        running = set()
+        overlap = []
+
+        async def handler(event, key):
+            self.assertNotIn(key, running)
+            running.add(key)
+            overlap.append(len(running))
+            await asyncio.sleep(random.random() / 1000)
+            handled[key].append(event)
+            running.discard(key)
+
+        async with KeyedDispatcher(handler, workers=4) as dispatcher:
+            for i in range(60):
+                key = "abc"[i % 3]
+                await dispatcher.submit(i, key, keys=[key])
+            await dispatcher.join()
+
+        self.assertEqual(handled["a"], list(range(0, 60, 3)))
+        self.assertEqual(handled["b"], list(range(1, 60, 3)))
+        self.assertGreater(max(overlap), 1)
+
+    async def test_event_with_several_keys_waits_for_all(self):
+        order = []
+
+        async def handler(event):
+            await asyncio.sleep(0.01 if event == "a1" else 0)
+            order.append(event)
+
+        async with KeyedDispatcher(handler, workers=4) as dispatcher:
+            await dispatcher.submit("a1", keys=["a"])
+            await dispatcher.submit("b1", keys=["b"])
+            await dispatcher.submit("ab", keys=["a", "b"])
+            await dispatcher.submit("b2", keys=["b"])
+            await dispatcher.join()
+
+        self.assertEqual(order, ["b1", "a1", "ab", "b2"])
+
+    async def test_backpressure(self):
+        release = asyncio.Event()
+
+        async def handler(event):
+            await release.wait()
+
+        async with KeyedDispatcher(handler, workers=2, max_pending=3) as dispatcher:
+            for i in range(3):
+                await dispatcher.submit(i)
+            blocked = asyncio.ensure_future(dispatcher.submit(3))
+            await asyncio.sleep(0.01)
+            self.assertFalse(blocked.done())
+            self.assertEqual(dispatcher.pending, 3)
+            release.set()
+            await asyncio.wait_for(blocked, 1)
+            await dispatcher.join()
+        self.assertEqual(dispatcher.pending, 0)
+
+    async def test_handler_error(self):
+        async def handler(event):
+            if event == 1:
+                raise RuntimeError("boom")
+
+        async with KeyedDispatcher(handler, workers=2) as dispatcher:
+            await dispatcher.submit(1)
+            with self.assertRaises(RuntimeError):
+                await dispatcher.join()
+
+        errors = []
+        async with KeyedDispatcher(handler, on_error=lambda e, event: errors.append(event)) as dispatcher:
+            for i in range(3):
+                await dispatcher.submit(i, keys=["a"])
+            await dispatcher.join()
+        self.assertEqual(errors, [1])
+
+
+class TestConcurrentSubscription(IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self) -> None:
+        self.accounts = ["0:" + c * 64 for c in "abcd"]
+
+        async def sse(request: web.Request) -> web.StreamResponse:
+            response = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+            await response.prepare(request)
+            for lt in range(1, 11):
+                for account in self.accounts:
+                    data = json.dumps({"account_id": account, "lt": lt, "tx_hash": f"{account[2:]}{lt}"})
+                    await response.write(f"event: message\ndata: {data}\n\n".encode())
+            return response
+
+        app = web.Application()
+        app.router.add_get("/v2/sse/accounts/transactions", sse)
+        self.server = TestServer(app)
+        await self.server.start_server()
+
+    async def asyncTearDown(self) -> None:
+        await self.server.close()
+
+    async def test_slow_handlers_run_in_parallel_in_account_order(self):
+        handled = {}
+
+        async def handler(event, tag):
+            await asyncio.sleep(0.01)
+            handled.setdefault(event.account_id.to_raw(), []).append((tag, event.lt))
+
+        async with AsyncTonapi(api_key="", base_url=str(self.server.make_url("/"))) as tonapi:
+            await asyncio.wait_for(
+                tonapi.sse.subscribe_to_transactions(
+                    handler, self.accounts, args=("tx",), workers=8, max_pending=8,
+                ),
+                0.3,  # 40 events of 10 ms each, handled inline, would take 0.4 s
+            )
+
+        self.assertEqual(sorted(handled), self.accounts)
+        for events in handled.values():
+            self.assertEqual(events, [("tx", lt) for lt in range(1, 11)])
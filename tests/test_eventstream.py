@@ -0,0 +1,114 @@
+import asyncio
+import json
+from unittest import IsolatedAsyncioTestCase
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from pytonapi import AsyncTonapi
+from pytonapi.eventstream import EventStream
+
+
+async def numbers(count, error=None):
+    for i in range(count):
+        yield i
+        await asyncio.sleep(0)
+    if error is not None:
+        raise error
+
+
+class TestEventStream(IsolatedAsyncioTestCase):
+
+    async def fill(self, stream):
+        """Start the stream, then let the source run ahead of the consumer."""
+        first = await stream.__anext__()
+        for _ in range(50):
+            await asyncio.sleep(0)
+        return [first] + [event async for event in stream]
+
+    async def test_block(self):
+        stream = EventStream(numbers(20), maxsize=3)
+        self.assertEqual(await self.fill(stream), list(range(20)))
+        self.assertEqual((stream.received, stream.dropped, stream.queued), (20, 0, 0))
+
+    async def test_drop_oldest(self):
+        stream = EventStream(numbers(20), maxsize=3, overflow="drop_oldest")
+        self.assertEqual(await self.fill(stream), [0, 17, 18, 19])
+        self.assertEqual((stream.received, stream.dropped), (20, 16))
+
+    async def test_drop_newest(self):
+        stream = EventStream(numbers(20), maxsize=3, overflow="drop_newest")
+        self.assertEqual(await self.fill(stream), [0, 1, 2, 3])
+        self.assertEqual(stream.dropped, 16)
+
+    async def test_parse_and_error_after_queued_events(self):
+        stream = EventStream(numbers(3, RuntimeError("closed")), parse=str)
+        events = []
+        with self.assertRaises(RuntimeError):
+            async for event in stream:
+                events.append(event)
+        self.assertEqual(events, ["0", "1", "2"])
+
+    async def test_aclose_stops_the_source(self):
+        closed = asyncio.Event()
+
+        async def source():
+            try:
+                while True:
+                    yield 1
+                    await asyncio.sleep(0)
+            finally:
+                closed.set()
+
+        async with EventStream(source(), maxsize=2) as stream:
+            await stream.__anext__()
+        self.assertTrue(closed.is_set())
+        with self.assertRaises(StopAsyncIteration):
+            await stream.__anext__()
+
+    async def test_break_stops_the_source(self):
+        closed = asyncio.Event()
+
+        async def source():
+            try:
+                while True:
+                    yield 1
+                    await asyncio.sleep(0)
+            finally:
+                closed.set()
+
+        stream = EventStream(source(), maxsize=2)
+        async for _ in stream:
+            break
+        await asyncio.wait_for(closed.wait(), 1)
+        self.assertTrue(stream._task.done())
+
+
+class TestSSEStreams(IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self) -> None:
+        async def blocks(request: web.Request) -> web.StreamResponse:
+            response = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+            await response.prepare(request)
+            for seqno in range(1, 4):
+                data = json.dumps({
+                    "workchain": int(request.query["workchain"]), "shard": "8000000000000000",
+                    "seqno": seqno, "root_hash": "", "file_hash": "",
+                })
+                await response.write(f"event: message\ndata: {data}\n\n".encode())
+            return response
+
+        app = web.Application()
+        app.router.add_get("/v2/sse/blocks", blocks)
+        self.server = TestServer(app)
+        await self.server.start_server()
+
+    async def asyncTearDown(self) -> None:
+        await self.server.close()
+
+    async def test_async_for(self):
+        async with AsyncTonapi(api_key="", base_url=str(self.server.make_url("/"))) as tonapi:
+            stream = tonapi.sse.blocks(workchain=-1)
+            events = [event async for event in stream]
+        self.assertEqual([(event.workchain, event.seqno) for event in events], [(-1, 1), (-1, 2), (-1, 3)])
+        self.assertEqual(stream.received, 3)
@@ -0,0 +1,114 @@
+import asyncio
+from unittest import IsolatedAsyncioTestCase, TestCase
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from pytonapi import AsyncTonapi
+from pytonapi.exceptions import TONAPIInternalServerError, TONAPINotFoundError
+from pytonapi.hedging import HedgePolicy, hedge
+
+
+class TestHedgePolicy(TestCase):
+
+    def test_delay_is_latency_percentile(self):
+        policy = HedgePolicy(["http://b/"], percentile=90, initial_delay=0.3, min_samples=10)
+        self.assertEqual(policy.delay, 0.3)
+        for i in range(1, 101):
+            policy.record(i / 1000)
+        self.assertAlmostEqual(policy.delay, 0.09)
+
+    def test_delay_bounds(self):
+        policy = HedgePolicy(["http://b/"], min_delay=0.05, max_delay=0.2, min_samples=1)
+        policy.record(0.001)
+        self.assertEqual(policy.delay, 0.05)
+        for _ in range(16):
+            policy.record(10)
+        self.assertEqual(policy.delay, 0.2)
+
+
+class TestHedge(IsolatedAsyncioTestCase):
+
+    def setUp(self) -> None:
+        self.policy = HedgePolicy(["http://b/"], initial_delay=0.02)
+        self.cancelled = []
+
+    def call(self, name, delay, error=None):
+        async def run():
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                self.cancelled.append(name)
+                raise
+            if error is not None:
+                raise error
+            return name
+        return run
+
+    async def test_fast_primary_is_not_hedged(self):
+        self.assertEqual(await hedge(self.policy, [self.call("a", 0), self.call("b", 0)]), "a")
+        self.assertEqual((self.policy.requests, self.policy.hedged), (1, 0))
+
+    async def test_slow_primary_loses_to_hedge(self):
+        result = await hedge(self.policy, [self.call("a", 1), self.call("b", 0.01)])
+        self.assertEqual(result, "b")
+        self.assertEqual(self.cancelled, ["a"])
+        self.assertEqual((self.policy.hedged, self.policy.hedge_wins, self.policy.hedge_rate), (1, 1, 1.0))
+
+    async def test_transient_error_fails_over(self):
+        calls = [self.call("a", 0, TONAPIInternalServerError("down")), self.call("b", 0)]
+        self.assertEqual(await hedge(self.policy, calls), "b")
+
+    async def test_client_error_is_final(self):
+        calls = [self.call("a", 0, TONAPINotFoundError("no")), self.call("b", 0)]
+        with self.assertRaises(TONAPINotFoundError):
+            await hedge(self.policy, calls)
+        self.assertEqual(self.policy.hedged, 0)
+
+
+class TestHedgedClient(IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self) -> None:
+        self.hits = {"slow": 0, "fast": 0}
+
+        def make_app(name, delay):
+            async def rates(request: web.Request) -> web.Response:
+                self.hits[name] += 1
+                await asyncio.sleep(delay)
+                return web.json_response({"rates": {"TON": {"prices": {"USD": 1 if name == "slow" else 2}}}})
+
+            async def webhooks(request: web.Request) -> web.Response:
+                self.hits[name] += 1
+                await asyncio.sleep(delay)
+                return web.json_response({"webhooks": []})
+
+            app = web.Application()
+            app.router.add_get("/v2/rates", rates)
+            app.router.add_get("/webhooks", webhooks)
+            return app
+
+        self.slow = TestServer(make_app("slow", 1))
+        self.fast = TestServer(make_app("fast", 0))
+        await self.slow.start_server()
+        await self.fast.start_server()
+
+    async def asyncTearDown(self) -> None:
+        await self.slow.close()
+        await self.fast.close()
+
+    async def test_hedges_to_other_base_url(self):
+        policy = HedgePolicy([str(self.fast.make_url("/"))], initial_delay=0.05)
+        async with AsyncTonapi(api_key="", base_url=str(self.slow.make_url("/")), hedge_policy=policy) as tonapi:
+            rates = await asyncio.wait_for(tonapi.rates.get_prices(tokens=["ton"], currencies=["usd"]), 0.5)
+        self.assertEqual(rates.rates["TON"]["prices"]["USD"], 2)
+        self.assertEqual(self.hits, {"slow": 1, "fast": 1})
+        self.assertEqual(policy.hedge_wins, 1)
+
+    async def test_namespace_with_own_host_is_not_hedged(self):
+        policy = HedgePolicy([str(self.fast.make_url("/"))], initial_delay=0.05)
+        async with AsyncTonapi(api_key="", base_url=str(self.fast.make_url("/")), hedge_policy=policy) as tonapi:
+            tonapi.webhooks.base_url = str(self.slow.make_url("/"))
+            result = await tonapi.webhooks.list_webhooks()
+        self.assertEqual(result.webhooks, [])
+        self.assertEqual(self.hits, {"slow": 1, "fast": 0})
+        self.assertEqual(policy.hedged, 0)
@@ -0,0 +1,46 @@
+import json
+import subprocess
+import sys
+from unittest import TestCase
+
+# Self time of the pytonapi modules loaded by "import pytonapi", in microseconds.
+# Third-party imports (aiohttp) are not counted, so the budget does not depend on them.
+IMPORT_TIME_BUDGET_US = 100_000
+
+
+def run_python(code: str, *options: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *options, "-c", code],
+        capture_output=True, text=True, check=True,
+    )
+
+
+class TestImportTime(TestCase):
+
+    def test_namespaces_and_schema_are_lazy(self):
+        code = "import sys, json, pytonapi; print(json.dumps(sorted(sys.modules)))"
+        modules = json.loads(run_python(code).stdout)
+
+        self.assertFalse([m for m in modules if m.startswith(("pytonapi.methods.", "pytonapi.schema"))])
+        self.assertNotIn("pydantic", modules)
+
+    def test_import_time_budget(self):
+        stderr = run_python("import pytonapi", "-X", "importtime").stderr
+        self_time = 0
+        for line in stderr.splitlines():
+            if not line.startswith("import time:") or "|" not in line:
+                continue
+            own, _, name = (part.strip() for part in line[len("import time:"):].split("|"))
+            if name == "pytonapi" or name.startswith("pytonapi."):
+                self_time += int(own)
+
+        self.assertLess(self_time, IMPORT_TIME_BUDGET_US)
+
+    def test_namespace_loads_on_first_use(self):
+        code = (
+            "import sys, pytonapi\n"
+            "tonapi = pytonapi.AsyncTonapi(api_key='')\n"
+            "tonapi.accounts\n"
+            "print('pytonapi.methods.accounts' in sys.modules, 'pytonapi.methods.nft' in sys.modules)"
+        )
+        self.assertEqual(run_python(code).stdout.split(), ["True", "False"])
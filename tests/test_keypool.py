@@ -0,0 +1,141 @@
+import asyncio
+import time
+from unittest import IsolatedAsyncioTestCase
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from pytonapi import AsyncTonapi
+from pytonapi.exceptions import TONAPISSELimitReachedError, TONAPITooManyRequestsError
+from pytonapi.keypool import APIKey, APIKeyPool
+
+
+class TestAPIKeyPool(IsolatedAsyncioTestCase):
+
+    async def test_spreads_by_capacity(self):
+        pool = APIKeyPool(["a", "b", APIKey("c", rps=1, burst=1)], rps=2, burst=2)
+        used = [(await pool.acquire()).key for _ in range(5)]
+        self.assertEqual(sorted(used), ["a", "a", "b", "b", "c"])
+
+    async def test_ties_go_to_fewer_in_flight(self):
+        pool = APIKeyPool(["a", "b"])
+        first = await pool.acquire()
+        second = await pool.acquire()
+        self.assertNotEqual(first.key, second.key)
+        pool.release(first)
+        self.assertIs(pool.select(), first)
+
+    async def test_throttled_key_cools_down(self):
+        pool = APIKeyPool(["a", "b"], cooldown=0.05)
+        a, b = pool.keys
+        pool.report_throttled(a)
+        self.assertIs(pool.select(), b)
+        pool.report_throttled(b, retry_after=10)
+        self.assertFalse(pool.has_ready_key())
+
+        started = time.monotonic()
+        self.assertIs(await pool.acquire(), a)  # the first key to recover
+        self.assertGreaterEqual(time.monotonic() - started, 0.04)
+
+    async def test_cooldown_backoff(self):
+        pool = APIKeyPool(["a"], cooldown=1, max_cooldown=3)
+        key = pool.keys[0]
+        for expected in (1, 2, 3, 3):
+            key.cooldown_until = 0
+            pool.report_throttled(key)
+            self.assertAlmostEqual(key.cooldown_until - time.monotonic(), expected, delta=0.1)
+        pool.report_success(key)
+        key.cooldown_until = 0
+        pool.report_throttled(key)
+        self.assertAlmostEqual(key.cooldown_until - time.monotonic(), 1, delta=0.1)
+        self.assertEqual(key.throttled, 5)
+
+    def test_stream_slots(self):
+        pool = APIKeyPool(["a", "b"], max_streams=1)
+        a = pool.acquire_stream()
+        b = pool.acquire_stream()
+        self.assertEqual({a.key, b.key}, {"a", "b"})
+        with self.assertRaises(TONAPISSELimitReachedError):
+            pool.acquire_stream()
+        pool.release_stream(a)
+        self.assertIs(pool.acquire_stream(), a)
+
+    def test_stream_limit_reported_by_server(self):
+        pool = APIKeyPool(["a", "b"], max_streams=5, stream_cooldown=0.05)
+        a = pool.acquire_stream()
+        pool.report_stream_limit(a)
+        pool.release_stream(a)
+        self.assertEqual((a.max_streams, a.free_streams), (5, 0))
+        b = pool.acquire_stream()
+        self.assertEqual(b.key, "b")
+        time.sleep(0.06)
+        self.assertEqual(a.free_streams, 5)
+        self.assertIs(pool.acquire_stream(), a)
+
+
+class TestClientKeyPool(IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self) -> None:
+        self.seen = []
+
+        async def rates(request: web.Request) -> web.Response:
+            key = request.headers["Authorization"]
+            self.seen.append(key)
+            if key == "Bearer throttled":
+                return web.Response(status=429, text='{"error": "rate limit"}', headers={"Retry-After": "30"})
+            return web.json_response({"rates": {}})
+
+        async def sse(request: web.Request) -> web.StreamResponse:
+            if request.headers["Authorization"] == "Bearer full":
+                return web.Response(status=401, text='{"error": "reached the limit of streaming connections"}')
+            response = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+            await response.prepare(request)
+            await response.write(b'event: message\nid: 1\ndata: {"boc": "te6c"}\n\n')
+            await response.write_eof()
+            return response
+
+        app = web.Application()
+        app.router.add_get("/v2/rates", rates)
+        app.router.add_get("/v2/sse/mempool", sse)
+        self.server = TestServer(app)
+        await self.server.start_server()
+
+    async def asyncTearDown(self) -> None:
+        await self.server.close()
+
+    def make_client(self, pool: APIKeyPool) -> AsyncTonapi:
+        return AsyncTonapi(api_key="", base_url=str(self.server.make_url("/")), key_pool=pool)
+
+    async def test_throttled_request_switches_key(self):
+        pool = APIKeyPool(["throttled", "ok"])
+        pool.keys[1].in_flight = 1  # make the throttled key the first choice
+        async with self.make_client(pool) as tonapi:
+            await tonapi.rates.get_prices(tokens=["ton"], currencies=["usd"])
+            await tonapi.rates.get_prices(tokens=["ton"], currencies=["usd"])
+        self.assertEqual(self.seen, ["Bearer throttled", "Bearer ok", "Bearer ok"])
+        self.assertEqual(pool.keys[0].throttled, 1)
+        self.assertGreater(pool.keys[0].cooldown_until - time.monotonic(), 20)
+
+    async def test_all_keys_throttled(self):
+        pool = APIKeyPool(["throttled"])
+        async with self.make_client(pool) as tonapi:
+            with self.assertRaises(TONAPITooManyRequestsError):
+                await tonapi.rates.get_prices(tokens=["ton"], currencies=["usd"])
+        self.assertEqual(pool.keys[0].in_flight, 0)
+
+    async def test_stream_pinned_to_key(self):
+        pool = APIKeyPool(["full", "free"])
+        pool.keys[1].streams = 1  # make the full key the first choice
+        received = []
+
+        async def handler(data):
+            received.append(data)
+
+        async with self.make_client(pool) as tonapi:
+            with self.assertRaises(TONAPISSELimitReachedError):
+                await tonapi.sse.subscribe_to_mempool(handler, accounts=[])
+            self.assertEqual(pool.keys[0].free_streams, 0)
+            pool.keys[1].streams = 0
+            await asyncio.wait_for(tonapi.sse.subscribe_to_mempool(handler, accounts=[]), 5)
+        self.assertTrue(received)
+        self.assertEqual([key.streams for key in pool.keys], [0, 0])
@@ -0,0 +1,192 @@
+import asyncio
+from unittest import IsolatedAsyncioTestCase
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from pytonapi import AsyncTonapi
+from pytonapi.pagination import paginate_by_lt, paginate_by_offset, scan_by_time
+from pytonapi.schema.blockchain import Transaction
+from pytonapi.schema.jettons import JettonHolder
+
+ACCOUNT = {"address": "0:" + "a" * 64, "is_scam": False, "is_wallet": True}
+
+
+def make_transaction(lt: int) -> dict:
+    return {
+        "hash": f"{lt:064x}", "lt": lt, "account": ACCOUNT, "success": True, "utime": 1000 + lt,
+        "orig_status": "active", "end_status": "active", "total_fees": 0, "end_balance": 0,
+        "transaction_type": "TransOrd", "state_update_old": "", "state_update_new": "",
+        "out_msgs": [], "block": "", "aborted": False, "destroyed": False, "raw": "",
+    }
+
+
+class TestPaginateByLt(IsolatedAsyncioTestCase):
+
+    def setUp(self) -> None:
+        self.cursors = []
+
+    async def fetch_events(self, before_lt):
+        # 10 events with lt 10..1, next_from points at the last event of the page
+        self.cursors.append(before_lt)
+        top = 10 if before_lt is None else before_lt - 1
+        events = [{"lt": lt, "timestamp": lt} for lt in range(top, max(top - 3, 0), -1)]
+        return {"events": events, "next_from": events[-1]["lt"] if events and events[-1]["lt"] > 1 else 0}
+
+    async def collect(self, **kwargs):
+        iterator = paginate_by_lt(self.fetch_events, "events", 3, time_field="timestamp", **kwargs)
+        return [item["lt"] async for item in iterator]
+
+    async def test_walks_all_pages(self):
+        self.assertEqual(await self.collect(), list(range(10, 0, -1)))
+        self.assertEqual(self.cursors, [None, 8, 5, 2])
+
+    async def test_stop_conditions(self):
+        self.assertEqual(await self.collect(until_lt=6), [10, 9, 8, 7])
+        self.assertEqual(await self.collect(since=5), [10, 9, 8, 7, 6, 5])
+        self.assertEqual(await self.collect(max_items=4), [10, 9, 8, 7])
+        self.assertEqual(await self.collect(before_lt=4), [3, 2, 1])
+
+    async def test_no_prefetch_after_stop(self):
+        await self.collect(max_items=3)
+        self.assertEqual(self.cursors, [None])
+
+    async def test_prefetches_next_page(self):
+        iterator = paginate_by_lt(self.fetch_events, "events", 3)
+        await iterator.__anext__()
+        await asyncio.sleep(0)
+        self.assertEqual(self.cursors, [None, 8])
+        await iterator.aclose()
+
+    async def test_cursor_without_next_from(self):
+        async def fetch(before_lt):
+            self.cursors.append(before_lt)
+            top = 7 if before_lt is None else before_lt  # inclusive cursor
+            return {"transactions": [{"lt": lt} for lt in range(top, max(top - 3, 0), -1)]}
+
+        items = [item["lt"] async for item in paginate_by_lt(fetch, "transactions", 3)]
+        self.assertEqual(items, list(range(7, 0, -1)))
+
+
+class TestPaginateByOffset(IsolatedAsyncioTestCase):
+
+    def setUp(self) -> None:
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def fetch(self, offset, limit, total=95, with_total=False):
+        self.requests.append((offset, limit))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01 * (offset % 3))  # pages complete out of order
+        self.in_flight -= 1
+        page = {"items": list(range(offset, min(offset + limit, total)))}
+        if with_total:
+            page["total"] = total
+        return page
+
+    async def collect(self, fetch, **kwargs):
+        return [item async for item in paginate_by_offset(fetch, "items", 10, **kwargs)]
+
+    async def test_items_in_order(self):
+        self.assertEqual(await self.collect(self.fetch, max_concurrency=4), list(range(95)))
+        self.assertLessEqual(self.max_in_flight, 4)
+        self.assertGreater(self.max_in_flight, 1)
+
+    async def test_total_bounds_requests(self):
+        async def fetch(offset, limit):
+            return await self.fetch(offset, limit, total=100, with_total=True)
+
+        self.assertEqual(await self.collect(fetch, max_concurrency=4), list(range(100)))
+        self.assertEqual(max(offset for offset, _ in self.requests), 90)
+
+    async def test_offset_and_max_items(self):
+        self.assertEqual(await self.collect(self.fetch, offset=5, max_items=12), list(range(5, 17)))
+        self.assertEqual(self.requests, [(5, 10), (15, 2)])
+
+
+class TestScanByTime(IsolatedAsyncioTestCase):
+
+    def setUp(self) -> None:
+        # busy hour at the start of the day, then one event every 10 minutes
+        self.events = [{"event_id": f"e{t}", "lt": t * 10, "timestamp": t} for t in range(0, 3600, 4)]
+        self.events += [{"event_id": f"e{t}", "lt": t * 10, "timestamp": t} for t in range(3600, 86400, 600)]
+        self.requests = []
+
+    async def fetch(self, start, end, before_lt):
+        self.requests.append((start, end, before_lt))
+        await asyncio.sleep(0)
+        matching = [
+            e for e in reversed(self.events)
+            if start <= e["timestamp"] <= end and (before_lt is None or e["lt"] < before_lt)
+        ]
+        page = matching[:50]
+        return {"events": page, "next_from": page[-1]["lt"] if len(matching) > 50 else 0}
+
+    async def test_scan_finds_every_event_once(self):
+        events = await scan_by_time(
+            self.fetch, "events", 0, 86400, 50, id_fields=("event_id",), time_field="timestamp",
+        )
+        self.assertEqual(events, sorted(self.events, key=lambda e: e["lt"], reverse=True))
+
+        busy = [r for r in self.requests if r[1] <= 3600]
+        self.assertGreater(len({(start, end) for start, end, _ in busy}), 1)  # the busy window was split
+
+    async def test_ascending(self):
+        events = await scan_by_time(
+            self.fetch, "events", 3600, 86400, 50, id_fields=("event_id",),
+            time_field="timestamp", descending=False,
+        )
+        self.assertEqual([e["timestamp"] for e in events], list(range(3600, 86400, 600)))
+
+
+class TestIterMethods(IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self) -> None:
+        async def transactions(request: web.Request) -> web.Response:
+            limit = int(request.query["limit"])
+            before_lt = int(request.query.get("before_lt", 26))
+            lts = range(before_lt - 1, max(before_lt - 1 - limit, 0), -1)
+            return web.json_response({"transactions": [make_transaction(lt) for lt in lts]})
+
+        async def holders(request: web.Request) -> web.Response:
+            offset, limit = int(request.query["offset"]), int(request.query["limit"])
+            addresses = [
+                {"address": ACCOUNT["address"], "owner": ACCOUNT, "balance": str(i)}
+                for i in range(offset, min(offset + limit, 2500))
+            ]
+            return web.json_response({"addresses": addresses, "total": 2500})
+
+        async def jetton_history(request: web.Request) -> web.Response:
+            return web.json_response({"operations": []})
+
+        app = web.Application()
+        app.router.add_get("/v2/blockchain/accounts/{account_id}/transactions", transactions)
+        app.router.add_get("/v2/jettons/{account_id}/holders", holders)
+        app.router.add_get("/v2/jettons/{jetton_id}/accounts/{account_id}/history", jetton_history)
+        self.server = TestServer(app)
+        await self.server.start_server()
+        self.tonapi = AsyncTonapi(api_key="", base_url=str(self.server.make_url("/")))
+
+    async def asyncTearDown(self) -> None:
+        await self.tonapi.aclose()
+        await self.server.close()
+
+    async def test_iter_account_transactions(self):
+        transactions = [
+            tx async for tx in self.tonapi.blockchain.iter_account_transactions(ACCOUNT["address"], limit=10)
+        ]
+        self.assertEqual([tx.lt for tx in transactions], list(range(25, 0, -1)))
+        self.assertIsInstance(transactions[0], Transaction)
+
+    async def test_iter_holders(self):
+        holders = [holder async for holder in self.tonapi.jettons.iter_holders(ACCOUNT["address"])]
+        self.assertEqual([holder.balance for holder in holders], [str(i) for i in range(2500)])
+        self.assertIsInstance(holders[0], JettonHolder)
+
+    async def test_scan_jettons_history_path(self):
+        operations = await self.tonapi.accounts.scan_jettons_history_by_jetton(
+            ACCOUNT["address"], ACCOUNT["address"], start_date=0, end_date=3600,
+        )
+        self.assertEqual(operations, [])
@@ -0,0 +1,36 @@
+import asyncio
+import time
+from unittest import IsolatedAsyncioTestCase
+
+from pytonapi import AsyncTonapi
+from pytonapi.ratelimit import AsyncTokenBucket
+
+
+class TestAsyncTokenBucket(IsolatedAsyncioTestCase):
+
+    async def test_burst_is_immediate(self):
+        bucket = AsyncTokenBucket(rate=10, burst=5)
+        start = time.monotonic()
+        for _ in range(5):
+            await bucket.acquire()
+        self.assertLess(time.monotonic() - start, 0.05)
+
+    async def test_rate_is_enforced(self):
+        bucket = AsyncTokenBucket(rate=50, burst=1)
+        start = time.monotonic()
+        await asyncio.gather(*(bucket.acquire() for _ in range(11)))
+        self.assertGreaterEqual(time.monotonic() - start, 0.19)
+
+    async def test_try_acquire(self):
+        bucket = AsyncTokenBucket(rate=1, burst=1)
+        self.assertTrue(bucket.try_acquire())
+        self.assertFalse(bucket.try_acquire())
+
+    async def test_limiter_is_shared_by_namespaces(self):
+        tonapi = AsyncTonapi(api_key="", rps=5)
+        self.assertIsNotNone(tonapi.rate_limiter)
+        self.assertIs(tonapi.accounts.rate_limiter, tonapi.jettons.rate_limiter)
+
+    async def test_burst_requires_rps(self):
+        with self.assertRaises(ValueError):
+            AsyncTonapi(api_key="", burst=10)
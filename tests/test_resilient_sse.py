@@ -0,0 +1,286 @@
+import asyncio
+import json
+from unittest import IsolatedAsyncioTestCase
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from pytonapi import AsyncTonapi
+from pytonapi.exceptions import TONAPIError, TONAPISSELimitReachedError, TONAPIUnauthorizedError
+from pytonapi.keypool import APIKeyPool
+from pytonapi.retry import RetryPolicy
+from pytonapi.session import SessionManager
+
+ACCOUNT = "0:" + "a" * 64
+
+
+def make_transaction(lt: int, op_code: str = "0x0f8a7ea5") -> dict:
+    return {"hash": f"{lt:064x}", "lt": lt, "account": {"address": ACCOUNT}, "in_msg": {"op_code": op_code}}
+
+
+class TestResilientTransactions(IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self) -> None:
+        self.transactions = [make_transaction(lt) for lt in range(1, 11)]
+        self.connections = 0
+        # live events sent on each connection; the stream drops after them
+        self.sessions = [[11, 12], [14, 15]]
+        self.status = 200
+        self.drop = False
+
+        async def sse(request: web.Request) -> web.StreamResponse:
+            if self.status != 200:
+                return web.Response(status=self.status, text="{}")
+            if self.drop:
+                self.connections += 1
+                return web.Response(headers={"Content-Type": "text/event-stream"})
+            session = self.sessions[min(self.connections, len(self.sessions) - 1)]
+            self.connections += 1
+            if self.connections == 2:
+                # transactions made while the client was disconnected
+                self.transactions += [make_transaction(13), make_transaction(14, "0xdeadbeef")]
+            response = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+            await response.prepare(request)
+            for lt in session:
+                if lt > self.transactions[-1]["lt"]:
+                    self.transactions.append(make_transaction(lt))
+                data = json.dumps({"account_id": ACCOUNT, "lt": lt, "tx_hash": f"{lt:064x}"})
+                await response.write(f"event: message\ndata: {data}\n\n".encode())
+            if self.connections > len(self.sessions):
+                await asyncio.sleep(10)  # stay connected
+            return response
+
+        async def transactions(request: web.Request) -> web.Response:
+            limit = int(request.query["limit"])
+            if request.query["sort_order"] == "desc":
+                return web.json_response({"transactions": self.transactions[::-1][:limit]})
+            after_lt = int(request.query["after_lt"])
+            return web.json_response({"transactions": [tx for tx in self.transactions if tx["lt"] > after_lt][:limit]})
+
+        app = web.Application()
+        app.router.add_get("/v2/sse/accounts/transactions", sse)
+        app.router.add_get("/v2/blockchain/accounts/{account_id}/transactions", transactions)
+        self.server = TestServer(app)
+        await self.server.start_server()
+        self.tonapi = AsyncTonapi(
+            api_key="", base_url=str(self.server.make_url("/")), retry_policy=RetryPolicy(base_delay=0),
+        )
+
+    async def asyncTearDown(self) -> None:
+        await self.tonapi.aclose()
+        await self.server.close()
+
+    async def collect(self, count, **kwargs):
+        events = []
+        async for event in self.tonapi.sse.iter_transactions([ACCOUNT], **kwargs):
+            events.append(event.lt)
+            if len(events) == count:
+                break
+        return events
+
+    async def test_reconnects_and_backfills_once_in_order(self):
+        events = await asyncio.wait_for(self.collect(5), 5)
+        self.assertEqual(events, [11, 12, 13, 14, 15])
+        self.assertEqual(self.connections, 2)
+
+    async def test_resume_from_last_lt(self):
+        events = await asyncio.wait_for(self.collect(3, last_lts={ACCOUNT: 8}), 5)
+        self.assertEqual(events, [9, 10, 11])
+
+    async def test_backfill_respects_operations(self):
+        events = await asyncio.wait_for(self.collect(4, operations=["0x0f8a7ea5"]), 5)
+        self.assertEqual(events, [11, 12, 13, 15])  # 14 has another operation
+
+    async def test_rejected_subscription_is_not_retried(self):
+        self.status = 401
+        with self.assertRaises(TONAPIUnauthorizedError):
+            await asyncio.wait_for(self.collect(1), 5)
+
+    async def test_max_reconnects(self):
+        self.status = 502
+        with self.assertRaises(TONAPIError):
+            await asyncio.wait_for(self.collect(1, max_reconnects=2), 5)
+
+    async def test_account_ids_that_are_not_addresses(self):
+        events = []
+        async for event in self.tonapi.sse.iter_transactions(["wallet.ton"], last_lts={"wallet.ton": 10}):
+            events.append(event.lt)
+            if len(events) == 2:
+                break
+        self.assertEqual(events, [11, 12])
+
+    async def test_connections_without_events_back_off(self):
+        self.drop = True  # every connection is accepted and closed at once
+        with self.assertRaises(TONAPIError):
+            await asyncio.wait_for(self.collect(1, max_reconnects=2), 5)
+        self.assertEqual(self.connections, 3)
+
+
+class TestReconnectState(IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self) -> None:
+        self.last_event_ids = []
+
+        async def sse(request: web.Request) -> web.StreamResponse:
+            self.last_event_ids.append(request.headers.get("Last-Event-ID"))
+            response = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+            await response.prepare(request)
+            lt = len(self.last_event_ids)
+            data = json.dumps({"account_id": ACCOUNT, "lt": lt, "tx_hash": f"{lt:064x}"})
+            # empty and malformed frames are skipped instead of ending the stream
+            await response.write(f"retry: 100\ndata:\n\ndata: {{\n\nid: {lt}\ndata: {data}\n\n".encode())
+            return response
+
+        app = web.Application()
+        app.router.add_get("/v2/sse/accounts/transactions", sse)
+        self.server = TestServer(app)
+        await self.server.start_server()
+
+    async def asyncTearDown(self) -> None:
+        await self.server.close()
+
+    async def test_last_event_id_and_retry(self):
+        base_url, retry_policy = str(self.server.make_url("/")), RetryPolicy(base_delay=0)
+        async with AsyncTonapi(api_key="", base_url=base_url, retry_policy=retry_policy) as tonapi:
+            events = []
+            started = asyncio.get_running_loop().time()
+            async for event in tonapi.sse.iter_transactions([ACCOUNT], backfill=False):
+                events.append(event.lt)
+                if len(events) == 3:
+                    break
+            elapsed = asyncio.get_running_loop().time() - started
+        self.assertEqual(events, [1, 2, 3])
+        self.assertEqual(self.last_event_ids, [None, "1", "2"])
+        self.assertGreaterEqual(elapsed, 0.2)
+
+
+class TestAllAccountsTransactions(IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self) -> None:
+        self.connections = 0
+
+        async def sse(request: web.Request) -> web.StreamResponse:
+            self.connections += 1
+            response = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+            await response.prepare(request)
+            # the second connection repeats the last event of the first one
+            for i in ([1, 2] if self.connections == 1 else [2, 3]):
+                data = json.dumps({"account_id": f"0:{i:064x}", "lt": 1, "tx_hash": f"{i:064x}"})
+                await response.write(f"data: {data}\n\n".encode())
+            if self.connections > 1:
+                await asyncio.sleep(10)
+            return response
+
+        app = web.Application()
+        app.router.add_get("/v2/sse/accounts/transactions", sse)
+        self.server = TestServer(app)
+        await self.server.start_server()
+
+    async def asyncTearDown(self) -> None:
+        await self.server.close()
+
+    async def test_repeated_events_are_dropped_by_hash(self):
+        base_url, retry_policy = str(self.server.make_url("/")), RetryPolicy(base_delay=0)
+        async with AsyncTonapi(api_key="", base_url=base_url, retry_policy=retry_policy) as tonapi:
+            events = []
+            async for event in tonapi.sse.iter_transactions(["accounts"]):
+                events.append(event.tx_hash)
+                if len(events) == 3:
+                    break
+        self.assertEqual(events, [f"{i:064x}" for i in (1, 2, 3)])
+        self.assertEqual(self.connections, 2)
+
+
+class TestShardedTransactions(IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self) -> None:
+        self.accounts = [f"0:{i:064x}" for i in range(250)]
+        self.connections = []
+
+        async def sse(request: web.Request) -> web.StreamResponse:
+            accounts = request.query["accounts"].split(",")
+            self.connections.append(accounts)
+            response = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+            await response.prepare(request)
+            for account in accounts + [self.accounts[0]]:  # every shard also repeats one event
+                lt = 1 if account == self.accounts[0] else 2
+                data = json.dumps({"account_id": account, "lt": lt, "tx_hash": f"{account[2:]}{lt}"})
+                await response.write(f"data: {data}\n\n".encode())
+            await asyncio.sleep(10)
+            return response
+
+        app = web.Application()
+        app.router.add_get("/v2/sse/accounts/transactions", sse)
+        self.server = TestServer(app)
+        await self.server.start_server()
+
+    async def asyncTearDown(self) -> None:
+        await self.server.close()
+
+    async def test_shards_are_merged_without_duplicates(self):
+        async with AsyncTonapi(api_key="", base_url=str(self.server.make_url("/"))) as tonapi:
+            events = []
+            iterator = tonapi.sse.iter_transactions_sharded(self.accounts, backfill=False)
+            async for event in iterator:
+                events.append(event)
+                if len(events) == len(self.accounts):
+                    break
+            await iterator.aclose()
+            await asyncio.sleep(0.05)
+
+        self.assertEqual(sorted(len(accounts) for accounts in self.connections), [83, 83, 84])
+        self.assertEqual(sorted(event.tx_hash for event in events), sorted(
+            f"{account[2:]}{1 if account == self.accounts[0] else 2}" for account in self.accounts
+        ))
+
+    async def test_connection_budget(self):
+        pool = APIKeyPool(["a", "b"], max_streams=1)
+        async with AsyncTonapi(api_key="", base_url=str(self.server.make_url("/")), key_pool=pool) as tonapi:
+            with self.assertRaises(TONAPISSELimitReachedError):
+                await tonapi.sse.iter_transactions_sharded(self.accounts, backfill=False).__anext__()
+
+    async def test_connection_budget_without_key_pool(self):
+        session = SessionManager(limit=3)
+        async with AsyncTonapi(api_key="", base_url=str(self.server.make_url("/")), session=session) as tonapi:
+            with self.assertRaises(TONAPISSELimitReachedError):
+                await tonapi.sse.iter_transactions_sharded(self.accounts, backfill=False).__anext__()
+
+    async def test_all_accounts_cannot_resume(self):
+        async with AsyncTonapi(api_key="", base_url=str(self.server.make_url("/"))) as tonapi:
+            iterator = tonapi.sse.iter_transactions_sharded(["accounts"], last_lts={self.accounts[0]: 1})
+            with self.assertRaises(ValueError):
+                await iterator.__anext__()
+
+
+class TestSSEIdleTimeout(IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self) -> None:
+        async def sse(request: web.Request) -> web.StreamResponse:
+            response = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+            await response.prepare(request)
+            for _ in range(int(request.query["heartbeats"])):
+                await asyncio.sleep(0.05)
+                await response.write(b"event: heartbeat\n\n")
+            # longer than the default line limit of aiohttp's StreamReader
+            data = json.dumps({"workchain": 0, "shard": "8" * 200_000, "seqno": 1, "root_hash": "", "file_hash": ""})
+            await response.write(f"data: {data}\n\n".encode())
+            await asyncio.sleep(10)
+            return response
+
+        app = web.Application()
+        app.router.add_get("/v2/sse/blocks", sse)
+        self.server = TestServer(app)
+        await self.server.start_server()
+        self.tonapi = AsyncTonapi(api_key="", base_url=str(self.server.make_url("/")), sse_idle_timeout=0.2)
+
+    async def asyncTearDown(self) -> None:
+        await self.tonapi.aclose()
+        await self.server.close()
+
+    async def test_heartbeats_keep_stream_alive(self):
+        events = []
+        with self.assertRaises(TONAPIError):
+            async for data in self.tonapi._subscribe("v2/sse/blocks", {"heartbeats": 8}):
+                events.append(data)
+        self.assertEqual([event["seqno"] for event in events], [1])  # 0.4 s of heartbeats, then idle
+        self.assertEqual(len(events[0]["shard"]), 200_000)
@@ -0,0 +1,71 @@
+from unittest import IsolatedAsyncioTestCase
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from pytonapi import AsyncTonapi
+from pytonapi.schema.accounts import Account
+
+ACCOUNT_ID = "0:" + "a" * 64
+ACCOUNT = {
+    "address": ACCOUNT_ID, "balance": 1, "last_activity": 0,
+    "status": "active", "get_methods": [], "is_wallet": True,
+}
+
+
+class TestResponseMode(IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self) -> None:
+        async def account(request: web.Request) -> web.Response:
+            return web.json_response(ACCOUNT)
+
+        async def bulk(request: web.Request) -> web.Response:
+            return web.json_response({"accounts": [ACCOUNT]})
+
+        app = web.Application()
+        app.router.add_get("/v2/accounts/{account_id}", account)
+        app.router.add_post("/v2/accounts/_bulk", bulk)
+        self.server = TestServer(app)
+        await self.server.start_server()
+        self.base_url = str(self.server.make_url("/"))
+        self.clients = []
+
+    async def asyncTearDown(self) -> None:
+        for client in self.clients:
+            await client.aclose()
+        await self.server.close()
+
+    def make_client(self, **kwargs) -> AsyncTonapi:
+        client = AsyncTonapi(api_key="", base_url=self.base_url, **kwargs)
+        self.clients.append(client)
+        return client
+
+    async def test_model_mode_validates(self):
+        account = await self.make_client().accounts.get_info(ACCOUNT_ID)
+        self.assertIsInstance(account, Account)
+        self.assertEqual(account.address.root, ACCOUNT_ID)
+
+    async def test_raw_mode_returns_dict(self):
+        account = await self.make_client(response_mode="raw").accounts.get_info(ACCOUNT_ID)
+        self.assertEqual(account, ACCOUNT)
+
+    async def test_construct_mode_skips_validation(self):
+        account = await self.make_client(response_mode="construct").accounts.get_info(ACCOUNT_ID)
+        self.assertIsInstance(account, Account)
+        self.assertEqual(account.address, ACCOUNT_ID)  # not converted to an Address model
+
+    async def test_context_override(self):
+        tonapi = self.make_client()
+        with tonapi.use_response_mode("raw"):
+            self.assertIsInstance(await tonapi.accounts.get_info(ACCOUNT_ID), dict)
+        self.assertIsInstance(await tonapi.accounts.get_info(ACCOUNT_ID), Account)
+
+    async def test_loader_follows_caller_mode(self):
+        tonapi = self.make_client()
+        with tonapi.use_response_mode("raw"):
+            self.assertIsInstance(await tonapi.accounts.load_info(ACCOUNT_ID), dict)
+        self.assertIsInstance(await tonapi.accounts.load_info(ACCOUNT_ID), Account)
+
+    async def test_unknown_mode(self):
+        with self.assertRaises(ValueError):
+            AsyncTonapi(api_key="", response_mode="fast")
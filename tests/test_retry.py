@@ -0,0 +1,92 @@
+from unittest import IsolatedAsyncioTestCase, TestCase
+
+import aiohttp
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from pytonapi import AsyncTonapi
+from pytonapi.base import parse_retry_after
+from pytonapi.exceptions import TONAPIError, TONAPITooManyRequestsError
+from pytonapi.retry import RetryBudget, RetryPolicy
+
+
+def make_error(error_class, status, retry_after=None):
+    error = error_class()
+    error.status = status
+    error.retry_after = retry_after
+    return error
+
+
+class TestRetryPolicy(TestCase):
+
+    def test_classification(self):
+        policy = RetryPolicy()
+        self.assertTrue(policy.is_retryable(make_error(TONAPITooManyRequestsError, 429), idempotent=False))
+        self.assertTrue(policy.is_retryable(make_error(TONAPIError, 503)))
+        self.assertFalse(policy.is_retryable(make_error(TONAPIError, 503), idempotent=False))
+        self.assertFalse(policy.is_retryable(make_error(TONAPIError, 400)))
+        self.assertTrue(policy.is_retryable(TimeoutError()))
+        self.assertTrue(policy.is_retryable(aiohttp.ServerDisconnectedError()))
+        self.assertFalse(policy.is_retryable(aiohttp.ServerDisconnectedError(), idempotent=False))
+
+    def test_delay(self):
+        policy = RetryPolicy(base_delay=1, max_delay=4)
+        for attempt in range(10):
+            self.assertLessEqual(policy.get_delay(attempt), 4)
+        self.assertEqual(policy.get_delay(0, make_error(TONAPITooManyRequestsError, 429, 2.5)), 2.5)
+        self.assertEqual(policy.get_delay(0, make_error(TONAPITooManyRequestsError, 429, 60)), 4)
+
+    def test_budget(self):
+        policy = RetryPolicy(max_retries=5, budget=RetryBudget(ratio=0.5, min_tokens=1))
+        error = make_error(TONAPIError, 503)
+        self.assertTrue(policy.should_retry(error, 0))
+        self.assertFalse(policy.should_retry(error, 0))
+        policy.budget.deposit()
+        policy.budget.deposit()
+        self.assertTrue(policy.should_retry(error, 0))
+
+    def test_parse_retry_after(self):
+        self.assertEqual(parse_retry_after("3"), 3.0)
+        self.assertEqual(parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT"), 0.0)
+        self.assertIsNone(parse_retry_after("soon"))
+        self.assertIsNone(parse_retry_after(None))
+
+
+class TestRequestRetries(IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self) -> None:
+        self.calls = 0
+
+        async def flaky(request: web.Request) -> web.Response:
+            self.calls += 1
+            if self.calls < 3:
+                return web.json_response({"error": "unavailable"}, status=503, headers={"Retry-After": "0"})
+            return web.json_response({"ok": True})
+
+        app = web.Application()
+        app.router.add_get("/v2/flaky", flaky)
+        app.router.add_post("/v2/flaky", flaky)
+        self.server = TestServer(app)
+        await self.server.start_server()
+
+        policy = RetryPolicy(max_retries=3, base_delay=0)
+        self.tonapi = AsyncTonapi(api_key="", base_url=str(self.server.make_url("/")), retry_policy=policy)
+
+    async def asyncTearDown(self) -> None:
+        await self.tonapi.aclose()
+        await self.server.close()
+
+    async def test_get_is_retried(self):
+        response = await self.tonapi._get("v2/flaky")
+        self.assertEqual(response, {"ok": True})
+        self.assertEqual(self.calls, 3)
+
+    async def test_post_is_not_retried(self):
+        with self.assertRaises(TONAPIError) as ctx:
+            await self.tonapi._post("v2/flaky")
+        self.assertEqual(ctx.exception.status, 503)
+        self.assertEqual(self.calls, 1)
+
+    async def test_idempotent_post_is_retried(self):
+        await self.tonapi._post("v2/flaky", idempotent=True)
+        self.assertEqual(self.calls, 3)
@@ -0,0 +1,90 @@
+import asyncio
+from unittest import IsolatedAsyncioTestCase
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from pytonapi import AsyncTonapi
+from pytonapi.ratelimit import AsyncTokenBucket
+from pytonapi.scheduler import Priority, PriorityScheduler
+
+
+class TestPriorityScheduler(IsolatedAsyncioTestCase):
+
+    async def run_requests(self, scheduler, lanes):
+        order = []
+
+        async def request(lane, i):
+            await scheduler.acquire(lane)
+            order.append((lane, i))
+            await asyncio.sleep(0)
+            scheduler.release()
+
+        await asyncio.gather(*(request(lane, i) for i, lane in enumerate(lanes)))
+        return order
+
+    async def test_interactive_jumps_the_queue(self):
+        scheduler = PriorityScheduler(AsyncTokenBucket(200, burst=1))
+        order = await self.run_requests(scheduler, ["bulk"] * 20 + ["interactive"])
+        self.assertLessEqual(order.index(("interactive", 20)), 2)
+        self.assertEqual(scheduler.dispatched[Priority.bulk], 20)
+
+    async def test_weighted_shares(self):
+        scheduler = PriorityScheduler(max_concurrency=1, weights={"interactive": 4, "bulk": 1})
+        order = await self.run_requests(scheduler, ["bulk"] * 50 + ["interactive"] * 50)
+        first = [lane for lane, _ in order[1:26]]  # the first request goes through at once
+        self.assertEqual(first.count("interactive"), 20)
+        self.assertEqual(first.count("bulk"), 5)
+
+    async def test_idle_lane_share_is_reused(self):
+        scheduler = PriorityScheduler(max_concurrency=1)
+        order = await self.run_requests(scheduler, ["bulk"] * 10)
+        self.assertEqual([i for _, i in order], list(range(10)))
+
+    async def test_cancelled_waiter(self):
+        scheduler = PriorityScheduler(max_concurrency=1)
+        await scheduler.acquire()
+        waiter = asyncio.ensure_future(scheduler.acquire("bulk"))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        await asyncio.sleep(0)
+        scheduler.release()
+        self.assertEqual(scheduler.active, 0)
+        await asyncio.wait_for(scheduler.acquire(), 1)
+
+
+class TestClientPriorities(IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self) -> None:
+        self.order = []
+
+        async def rates(request: web.Request) -> web.Response:
+            self.order.append("rates")
+            return web.json_response({"rates": {}})
+
+        async def seqno(request: web.Request) -> web.Response:
+            self.order.append("seqno")
+            return web.json_response({"seqno": 7})
+
+        app = web.Application()
+        app.router.add_get("/v2/rates", rates)
+        app.router.add_get("/v2/wallet/{account_id}/seqno", seqno)
+        self.server = TestServer(app)
+        await self.server.start_server()
+
+    async def asyncTearDown(self) -> None:
+        await self.server.close()
+
+    async def test_seqno_overtakes_backfill(self):
+        async with AsyncTonapi(api_key="", base_url=str(self.server.make_url("/")), rps=200, burst=1) as tonapi:
+            with tonapi.use_priority("bulk"):
+                backfill = [
+                    asyncio.ensure_future(tonapi.rates.get_prices(tokens=["ton"], currencies=["usd"]))
+                    for _ in range(20)
+                ]
+            await asyncio.sleep(0)
+            seqno = await tonapi.wallet.get_account_seqno("0:" + "a" * 64)
+            await asyncio.gather(*backfill)
+        self.assertEqual(seqno, 7)
+        self.assertLessEqual(self.order.index("seqno"), 3)
+        self.assertEqual(tonapi.scheduler.active, 0)
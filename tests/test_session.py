@@ -0,0 +1,41 @@
+import asyncio
+from unittest import TestCase
+
+from pytonapi.session import SessionManager
+from tests import TestAsyncTonapi
+
+
+class TestSessionManager(TestAsyncTonapi):
+
+    async def test_namespaces_share_session(self):
+        session = self.tonapi.accounts.session.get()
+        self.assertIs(self.tonapi.blockchain.session.get(), session)
+        self.assertIs(self.tonapi.sse.session.get(), session)
+        await self.tonapi.aclose()
+
+    async def test_aclose(self):
+        async with self.tonapi as tonapi:
+            session = tonapi.session.get()
+        self.assertTrue(session.closed)
+        self.assertTrue(self.tonapi.session.closed)
+
+
+class TestSessionAcrossLoops(TestCase):
+
+    def test_stale_session_is_closed(self):
+        manager = SessionManager()
+
+        async def get():
+            return manager.get()
+
+        async def get_and_close():
+            session = manager.get()
+            await asyncio.sleep(0)
+            await manager.close()
+            return session
+
+        first = asyncio.run(get())
+        second = asyncio.run(get_and_close())
+        self.assertIsNot(first, second)
+        self.assertTrue(first.closed)
+        self.assertTrue(second.closed)
@@ -0,0 +1,71 @@
+import asyncio
+from unittest import IsolatedAsyncioTestCase
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from pytonapi import AsyncTonapi
+from pytonapi.singleflight import RequestCoalescer, request_key
+
+
+class TestRequestCoalescer(IsolatedAsyncioTestCase):
+
+    async def test_concurrent_calls_are_shared(self):
+        coalescer = RequestCoalescer()
+        calls = 0
+
+        async def factory():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"value": calls}
+
+        results = await asyncio.gather(*(coalescer.do("key", factory) for _ in range(10)))
+        self.assertEqual(calls, 1)
+        self.assertEqual(coalescer.shared, 9)
+        self.assertTrue(all(result is results[0] for result in results))
+        self.assertEqual(coalescer.in_flight, 0)
+
+    async def test_cancelled_caller_does_not_cancel_others(self):
+        coalescer = RequestCoalescer()
+
+        async def factory():
+            await asyncio.sleep(0.02)
+            return 1
+
+        first = asyncio.ensure_future(coalescer.do("key", factory))
+        second = asyncio.ensure_future(coalescer.do("key", factory))
+        await asyncio.sleep(0)
+        first.cancel()
+        self.assertEqual(await second, 1)
+
+    def test_request_key_ignores_order(self):
+        self.assertEqual(
+            request_key("GET", "url", {"a": 1, "b": 2}, {"X": "1"}),
+            request_key("GET", "url", {"b": 2, "a": 1}, {"x": "1"}),
+        )
+
+
+class TestCoalescedRequests(IsolatedAsyncioTestCase):
+
+    async def test_identical_gets_hit_upstream_once(self):
+        calls = 0
+
+        async def handler(request: web.Request) -> web.Response:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.02)
+            return web.json_response({"id": request.match_info["id"]})
+
+        app = web.Application()
+        app.router.add_get("/v2/traces/{id}", handler)
+        server = TestServer(app)
+        await server.start_server()
+        tonapi = AsyncTonapi(api_key="", base_url=str(server.make_url("/")), coalesce_requests=True)
+        try:
+            results = await asyncio.gather(*(tonapi.traces._get("v2/traces/abc") for _ in range(20)))
+            self.assertEqual(calls, 1)
+            self.assertEqual(results[0], {"id": "abc"})
+        finally:
+            await tonapi.aclose()
+            await server.close()
@@ -0,0 +1,160 @@
+import asyncio
+import json
+from unittest import IsolatedAsyncioTestCase, TestCase
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from pytonapi import AsyncTonapi
+from pytonapi.schema.jettons import JettonHolder
+from pytonapi.streaming import JSONArrayParser, SSEEvent, SSEParser
+
+HOLDERS = [
+    {
+        "address": f"0:{i:064x}",
+        "owner": {"address": f"0:{i:064x}", "name": "ÿ holder", "is_scam": False, "is_wallet": True},
+        "balance": str(10 ** 30 + i),
+    }
+    for i in range(50)
+]
+BODY = json.dumps({"addresses": HOLDERS, "total": 12345678901234567890123}, ensure_ascii=False).encode("utf-8")
+
+
+class TestJSONArrayParser(TestCase):
+
+    def parse(self, body: bytes, chunk_size: int, key: str = "addresses") -> JSONArrayParser:
+        parser = JSONArrayParser(key)
+        self.items = []
+        for i in range(0, len(body), chunk_size):
+            self.items.extend(parser.feed(body[i:i + chunk_size]))
+        parser.close()
+        return parser
+
+    def test_any_chunk_size(self):
+        for chunk_size in (1, 7, 64, len(BODY)):
+            with self.subTest(chunk_size=chunk_size):
+                parser = self.parse(BODY, chunk_size)
+                self.assertEqual(self.items, HOLDERS)
+                self.assertEqual(parser.fields, {"total": 12345678901234567890123})
+
+    def test_fields_before_array(self):
+        body = b'{"total": 2, "nested": {"addresses": [0]}, "addresses": [ 1 , 2 ]}'
+        parser = self.parse(body, 3)
+        self.assertEqual(self.items, [1, 2])
+        self.assertEqual(parser.fields, {"total": 2, "nested": {"addresses": [0]}})
+
+    def test_strings_and_nesting(self):
+        items = [{"a": "\\\"]}", "b": [[], {"c": "[{"}]}, "x\\", -1.5e3, True, None, []]
+        body = json.dumps({"addresses": items, "total": 1}).encode()
+        for chunk_size in (1, 2, 3):
+            with self.subTest(chunk_size=chunk_size):
+                self.assertEqual(self.parse(body, chunk_size).fields, {"total": 1})
+                self.assertEqual(self.items, items)
+
+    def test_long_item(self):
+        item = {"data": "x" * 4_000_000}
+        # an item split into many small chunks is scanned once, not decoded on every chunk
+        self.parse(json.dumps({"addresses": [item]}).encode(), 1024)
+        self.assertEqual(self.items, [item])
+
+    def test_truncated(self):
+        with self.assertRaises(ValueError):
+            self.parse(BODY[:-10], 100)
+
+    def test_missing_key(self):
+        with self.assertRaises(ValueError):
+            self.parse(b'{"other": []}', 4)
+
+
+class TestSSEParser(TestCase):
+
+    def parse(self, body: bytes, chunk_size: int) -> list:
+        self.parser = SSEParser()
+        events = []
+        for i in range(0, len(body), chunk_size):
+            events.extend(self.parser.feed(body[i:i + chunk_size]))
+        return events
+
+    def test_any_chunk_size(self):
+        body = (
+            b"\xef\xbb\xbf: comment\r\n"
+            b"event: heartbeat\r\n\r\n"
+            b"data: {\"a\":\r\ndata:1}\r\nid: 7\r\n\r\n"
+            b"retry: 3000\revent:custom\rdata:  x\r\r"
+            b"data\n\n"  # empty data is not dispatched
+            b"data: incomplete"
+        )
+        for chunk_size in (1, 2, 5, len(body)):
+            with self.subTest(chunk_size=chunk_size):
+                self.assertEqual(self.parse(body, chunk_size), [
+                    SSEEvent("message", b'{"a":\n1}', "7"),
+                    SSEEvent("custom", b" x", "7"),
+                ])
+                self.assertEqual(self.parser.retry, 3000)
+
+    def test_reset_keeps_the_event_id(self):
+        self.parse(b"id: 3\nretry: 10\n\ndata: broken", 100)
+        self.parser.reset()
+        self.assertEqual(self.parser.feed(b"data: 1\n\n"), [SSEEvent("message", b"1", "3")])
+        self.assertEqual((self.parser.last_event_id, self.parser.retry), ("3", 10))
+
+    def test_long_line(self):
+        data = b"x" * 4_000_000
+        # a line split into many small chunks is joined once, not rebuilt on every chunk
+        self.assertEqual(self.parse(b"data: " + data + b"\n\n", 1024), [SSEEvent("message", data)])
+
+
+class TestStreamMethods(IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self) -> None:
+        async def holders(request: web.Request) -> web.StreamResponse:
+            response = web.StreamResponse()
+            response.content_type = "application/json"
+            await response.prepare(request)
+            for i in range(0, len(BODY), 1000):
+                await response.write(BODY[i:i + 1000])
+                await self.hold.wait()
+            await response.write_eof()
+            return response
+
+        self.hold = asyncio.Event()
+        self.hold.set()
+        app = web.Application()
+        app.router.add_get("/v2/jettons/{account_id}/holders", holders)
+        self.server = TestServer(app)
+        await self.server.start_server()
+        self.tonapi = AsyncTonapi(api_key="", base_url=str(self.server.make_url("/")))
+
+    async def asyncTearDown(self) -> None:
+        await self.tonapi.aclose()
+        await self.server.close()
+
+    async def test_stream_holders(self):
+        holders = [holder async for holder in self.tonapi.jettons.stream_holders("0:" + "a" * 64)]
+        self.assertEqual(len(holders), len(HOLDERS))
+        self.assertIsInstance(holders[0], JettonHolder)
+        self.assertEqual(holders[-1].balance, HOLDERS[-1]["balance"])
+
+    async def test_stream_respects_response_mode(self):
+        with self.tonapi.use_response_mode("raw"):
+            holders = [holder async for holder in self.tonapi.jettons.stream_holders("0:" + "a" * 64)]
+        self.assertEqual(holders, HOLDERS)
+
+    async def test_slot_released_when_body_is_read(self):
+        self.hold.clear()
+        stream = self.tonapi.jettons.stream_holders("0:" + "a" * 64)
+        await stream.__anext__()
+        self.assertEqual(self.tonapi.scheduler.active, 1)
+        self.hold.set()
+        for _ in HOLDERS[1:]:
+            await stream.__anext__()
+        # all items are taken, but the generator has not finished yet
+        self.assertEqual(self.tonapi.scheduler.active, 0)
+        await stream.aclose()
+
+    async def test_slot_released_on_aclose(self):
+        self.hold.clear()
+        stream = self.tonapi.jettons.stream_holders("0:" + "a" * 64)
+        await stream.__anext__()
+        await stream.aclose()
+        self.assertEqual(self.tonapi.scheduler.active, 0)